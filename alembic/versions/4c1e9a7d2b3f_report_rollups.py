@@ -0,0 +1,82 @@
+"""tablas de resumen para reportes
+
+Revision ID: 4c1e9a7d2b3f
+Revises: b7ca13dad564
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c1e9a7d2b3f'
+down_revision: Union[str, Sequence[str], None] = 'b7ca13dad564'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('report_monthly_rollups',
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.Column('invoice_count', sa.Integer(), nullable=False),
+    sa.Column('income', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('payment_count', sa.Integer(), nullable=False),
+    sa.Column('payments', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('expense_count', sa.Integer(), nullable=False),
+    sa.Column('expense', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.PrimaryKeyConstraint('month')
+    )
+    op.create_table('report_client_rollups',
+    sa.Column('client_id', sa.Integer(), nullable=False),
+    sa.Column('invoice_count', sa.Integer(), nullable=False),
+    sa.Column('total_billed', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('total_paid', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.ForeignKeyConstraint(['client_id'], ['clients.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('client_id')
+    )
+
+    # Carga inicial con los datos existentes
+    op.execute(
+        """
+        INSERT INTO report_monthly_rollups
+            (month, invoice_count, income, payment_count, payments,
+             expense_count, expense)
+        SELECT month,
+               SUM(invoice_count), SUM(income),
+               SUM(payment_count), SUM(payments),
+               SUM(expense_count), SUM(expense)
+        FROM (
+            SELECT DATE_TRUNC('month', issued_at)::date AS month,
+                   COUNT(*) AS invoice_count, SUM(total) AS income,
+                   0 AS payment_count, 0 AS payments,
+                   0 AS expense_count, 0 AS expense
+            FROM invoices WHERE issued_at IS NOT NULL GROUP BY 1
+            UNION ALL
+            SELECT DATE_TRUNC('month', date)::date, 0, 0, COUNT(*), SUM(amount), 0, 0
+            FROM payments WHERE date IS NOT NULL GROUP BY 1
+            UNION ALL
+            SELECT DATE_TRUNC('month', date)::date, 0, 0, 0, 0, COUNT(*), SUM(amount)
+            FROM expenses GROUP BY 1
+        ) AS totals
+        GROUP BY month
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO report_client_rollups
+            (client_id, invoice_count, total_billed, total_paid)
+        SELECT client_id, COUNT(*), SUM(total), SUM(COALESCE(paid, 0))
+        FROM invoices
+        GROUP BY client_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('report_client_rollups')
+    op.drop_table('report_monthly_rollups')
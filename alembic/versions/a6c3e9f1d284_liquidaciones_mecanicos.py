@@ -0,0 +1,74 @@
+"""liquidaciones de tareas a mecánicos
+
+Revision ID: a6c3e9f1d284
+Revises: f4a8d2c6b913
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6c3e9f1d284'
+down_revision: Union[str, Sequence[str], None] = 'f4a8d2c6b913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('pay_runs',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('area_id', sa.Integer(), nullable=True),
+    sa.Column('status_id', sa.Integer(), nullable=True),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('period_start', sa.Date(), nullable=True),
+    sa.Column('period_end', sa.Date(), nullable=True),
+    sa.Column('task_count', sa.Integer(), nullable=False),
+    sa.Column('total', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('paid_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['area_id'], ['work_areas.id'], ),
+    sa.ForeignKeyConstraint(['status_id'], ['work_order_statuses.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_pay_runs_area_id'), 'pay_runs', ['area_id'], unique=False)
+    op.create_index(op.f('ix_pay_runs_status_id'), 'pay_runs', ['status_id'], unique=False)
+    op.create_index(op.f('ix_pay_runs_user_id'), 'pay_runs', ['user_id'], unique=False)
+    op.create_index(op.f('ix_pay_runs_paid_at'), 'pay_runs', ['paid_at'], unique=False)
+    op.create_table('pay_run_lines',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('pay_run_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('area_id', sa.Integer(), nullable=False),
+    sa.Column('task_count', sa.Integer(), nullable=False),
+    sa.Column('total', sa.Numeric(precision=14, scale=2), nullable=False),
+    sa.ForeignKeyConstraint(['pay_run_id'], ['pay_runs.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.ForeignKeyConstraint(['area_id'], ['work_areas.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_pay_run_lines_pay_run_id'), 'pay_run_lines', ['pay_run_id'], unique=False)
+    op.create_index(op.f('ix_pay_run_lines_user_id'), 'pay_run_lines', ['user_id'], unique=False)
+    op.add_column('work_order_tasks', sa.Column('pay_run_id', sa.Integer(), nullable=True))
+    op.create_index(op.f('ix_work_order_tasks_pay_run_id'), 'work_order_tasks', ['pay_run_id'], unique=False)
+    op.create_foreign_key('work_order_tasks_pay_run_id_fkey', 'work_order_tasks', 'pay_runs', ['pay_run_id'], ['id'], ondelete='SET NULL')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('work_order_tasks_pay_run_id_fkey', 'work_order_tasks', type_='foreignkey')
+    op.drop_index(op.f('ix_work_order_tasks_pay_run_id'), table_name='work_order_tasks')
+    op.drop_column('work_order_tasks', 'pay_run_id')
+    op.drop_index(op.f('ix_pay_run_lines_user_id'), table_name='pay_run_lines')
+    op.drop_index(op.f('ix_pay_run_lines_pay_run_id'), table_name='pay_run_lines')
+    op.drop_table('pay_run_lines')
+    op.drop_index(op.f('ix_pay_runs_paid_at'), table_name='pay_runs')
+    op.drop_index(op.f('ix_pay_runs_user_id'), table_name='pay_runs')
+    op.drop_index(op.f('ix_pay_runs_status_id'), table_name='pay_runs')
+    op.drop_index(op.f('ix_pay_runs_area_id'), table_name='pay_runs')
+    op.drop_table('pay_runs')
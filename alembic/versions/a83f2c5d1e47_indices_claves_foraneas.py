@@ -0,0 +1,76 @@
+"""índices en claves foráneas y columnas de filtro
+
+Revision ID: a83f2c5d1e47
+Revises: 9d3f6b1a7c52
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a83f2c5d1e47'
+down_revision: Union[str, Sequence[str], None] = '9d3f6b1a7c52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_expenses_expense_type_id'), 'expenses', ['expense_type_id'], unique=False)
+    op.create_index(op.f('ix_trucks_client_id'), 'trucks', ['client_id'], unique=False)
+    op.create_index(op.f('ix_users_role_id'), 'users', ['role_id'], unique=False)
+    op.create_index(op.f('ix_work_orders_created_at'), 'work_orders', ['created_at'], unique=False)
+    op.create_index(op.f('ix_work_orders_reviewed_by'), 'work_orders', ['reviewed_by'], unique=False)
+    op.create_index(op.f('ix_work_orders_status_id'), 'work_orders', ['status_id'], unique=False)
+    op.create_index(op.f('ix_work_orders_truck_id'), 'work_orders', ['truck_id'], unique=False)
+    op.create_index(op.f('ix_invoices_client_id'), 'invoices', ['client_id'], unique=False)
+    op.create_index(op.f('ix_invoices_invoice_type_id'), 'invoices', ['invoice_type_id'], unique=False)
+    op.create_index(op.f('ix_invoices_issued_at'), 'invoices', ['issued_at'], unique=False)
+    op.create_index(op.f('ix_invoices_status_id'), 'invoices', ['status_id'], unique=False)
+    op.create_index(op.f('ix_invoices_work_order_id'), 'invoices', ['work_order_id'], unique=False)
+    op.create_index(op.f('ix_work_order_mechanics_area_id'), 'work_order_mechanics', ['area_id'], unique=False)
+    op.create_index(op.f('ix_work_order_mechanics_user_id'), 'work_order_mechanics', ['user_id'], unique=False)
+    op.create_index(op.f('ix_work_order_mechanics_work_order_id'), 'work_order_mechanics', ['work_order_id'], unique=False)
+    op.create_index(op.f('ix_work_order_parts_work_order_id'), 'work_order_parts', ['work_order_id'], unique=False)
+    op.create_index(op.f('ix_work_order_tasks_area_id'), 'work_order_tasks', ['area_id'], unique=False)
+    op.create_index(op.f('ix_work_order_tasks_paid'), 'work_order_tasks', ['paid'], unique=False)
+    op.create_index(op.f('ix_work_order_tasks_user_id'), 'work_order_tasks', ['user_id'], unique=False)
+    op.create_index(op.f('ix_work_order_tasks_work_order_id'), 'work_order_tasks', ['work_order_id'], unique=False)
+    op.create_index(op.f('ix_payments_date'), 'payments', ['date'], unique=False)
+    op.create_index(op.f('ix_payments_invoice_id'), 'payments', ['invoice_id'], unique=False)
+    op.create_index(op.f('ix_payments_method_id'), 'payments', ['method_id'], unique=False)
+    op.create_index(op.f('ix_bank_checks_due_date'), 'bank_checks', ['due_date'], unique=False)
+    op.create_index(op.f('ix_bank_checks_payment_id'), 'bank_checks', ['payment_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_bank_checks_payment_id'), table_name='bank_checks')
+    op.drop_index(op.f('ix_bank_checks_due_date'), table_name='bank_checks')
+    op.drop_index(op.f('ix_payments_method_id'), table_name='payments')
+    op.drop_index(op.f('ix_payments_invoice_id'), table_name='payments')
+    op.drop_index(op.f('ix_payments_date'), table_name='payments')
+    op.drop_index(op.f('ix_work_order_tasks_work_order_id'), table_name='work_order_tasks')
+    op.drop_index(op.f('ix_work_order_tasks_user_id'), table_name='work_order_tasks')
+    op.drop_index(op.f('ix_work_order_tasks_paid'), table_name='work_order_tasks')
+    op.drop_index(op.f('ix_work_order_tasks_area_id'), table_name='work_order_tasks')
+    op.drop_index(op.f('ix_work_order_parts_work_order_id'), table_name='work_order_parts')
+    op.drop_index(op.f('ix_work_order_mechanics_work_order_id'), table_name='work_order_mechanics')
+    op.drop_index(op.f('ix_work_order_mechanics_user_id'), table_name='work_order_mechanics')
+    op.drop_index(op.f('ix_work_order_mechanics_area_id'), table_name='work_order_mechanics')
+    op.drop_index(op.f('ix_invoices_work_order_id'), table_name='invoices')
+    op.drop_index(op.f('ix_invoices_status_id'), table_name='invoices')
+    op.drop_index(op.f('ix_invoices_issued_at'), table_name='invoices')
+    op.drop_index(op.f('ix_invoices_invoice_type_id'), table_name='invoices')
+    op.drop_index(op.f('ix_invoices_client_id'), table_name='invoices')
+    op.drop_index(op.f('ix_work_orders_truck_id'), table_name='work_orders')
+    op.drop_index(op.f('ix_work_orders_status_id'), table_name='work_orders')
+    op.drop_index(op.f('ix_work_orders_reviewed_by'), table_name='work_orders')
+    op.drop_index(op.f('ix_work_orders_created_at'), table_name='work_orders')
+    op.drop_index(op.f('ix_users_role_id'), table_name='users')
+    op.drop_index(op.f('ix_trucks_client_id'), table_name='trucks')
+    op.drop_index(op.f('ix_expenses_expense_type_id'), table_name='expenses')
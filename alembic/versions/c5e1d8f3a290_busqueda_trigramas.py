@@ -0,0 +1,38 @@
+"""búsqueda por trigramas en clientes y camiones
+
+Revision ID: c5e1d8f3a290
+Revises: a83f2c5d1e47
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5e1d8f3a290'
+down_revision: Union[str, Sequence[str], None] = 'a83f2c5d1e47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRIGRAM_COLUMNS = {
+    'clients': ['name', 'document_number', 'phone'],
+    'trucks': ['license_plate', 'brand', 'model'],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for table, columns in TRIGRAM_COLUMNS.items():
+        for column in columns:
+            op.create_index(f'ix_{table}_{column}_trgm', table, [column], unique=False, postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, columns in TRIGRAM_COLUMNS.items():
+        for column in columns:
+            op.drop_index(f'ix_{table}_{column}_trgm', table_name=table)
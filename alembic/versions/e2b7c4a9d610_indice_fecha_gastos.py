@@ -0,0 +1,28 @@
+"""índice por fecha en gastos
+
+Revision ID: e2b7c4a9d610
+Revises: c5e1d8f3a290
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7c4a9d610'
+down_revision: Union[str, Sequence[str], None] = 'c5e1d8f3a290'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_expenses_date'), 'expenses', ['date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_expenses_date'), table_name='expenses')
@@ -0,0 +1,43 @@
+"""catálogo de repuestos
+
+Revision ID: f4a8d2c6b913
+Revises: e2b7c4a9d610
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4a8d2c6b913'
+down_revision: Union[str, Sequence[str], None] = 'e2b7c4a9d610'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('part_catalog',
+    sa.Column('name', sa.Text(), nullable=False),
+    sa.Column('uses', sa.Integer(), nullable=False),
+    sa.Column('last_unit_price', sa.Numeric(precision=10, scale=2), nullable=True),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.create_index('ix_part_catalog_name_trgm', 'part_catalog', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+    # carga inicial desde el historial de repuestos
+    op.execute(
+        'INSERT INTO part_catalog (name, uses, last_unit_price) '
+        'SELECT p.name, c.uses, p.unit_price FROM work_order_parts p '
+        'JOIN (SELECT name, count(*) AS uses, max(id) AS last_id '
+        'FROM work_order_parts WHERE name IS NOT NULL GROUP BY name) c '
+        'ON c.last_id = p.id'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_part_catalog_name_trgm', table_name='part_catalog', postgresql_using='gin')
+    op.drop_table('part_catalog')
@@ -0,0 +1,204 @@
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+from fastapi.encoders import jsonable_encoder
+
+from app.core.settings import settings
+
+MISSING = object()
+
+
+class MemoryCache:
+    """LRU en memoria del proceso con expiración por clave."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._data: OrderedDict[str, tuple[float | None, Any]] = OrderedDict()
+
+    async def get(self, key: str) -> Any:
+        item = self._data.get(key)
+        if item is None:
+            return MISSING
+        expires_at, value = item
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            return MISSING
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    async def delete(self, key: str) -> None:
+        self._data.pop(key, None)
+
+    async def incr(self, key: str) -> int:
+        current = await self.get(key)
+        value = (0 if current is MISSING else int(current)) + 1
+        await self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class RedisCache:
+    """Backend compatible con Redis.
+
+    ``client`` puede ser un ``redis.asyncio.Redis`` o cualquier objeto con
+    los métodos asíncronos ``get``, ``set(key, value, ex=...)``, ``delete`` e
+    ``incr`` (por ejemplo un fake en memoria para desarrollo local).
+    """
+
+    def __init__(self, client):
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str) -> "RedisCache":
+        import redis.asyncio as redis
+
+        return cls(redis.from_url(url))
+
+    async def get(self, key: str) -> Any:
+        raw = await self.client.get(key)
+        if raw is None:
+            return MISSING
+        return json.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        await self.client.set(key, json.dumps(jsonable_encoder(value)), ex=ttl)
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(key)
+
+    async def incr(self, key: str) -> int:
+        return int(await self.client.incr(key))
+
+
+class ResultCache:
+    """Cache de resultados por nombre y parámetros, con invalidación explícita.
+
+    Invalidar incrementa un número de generación que forma parte de cada clave,
+    de modo que todas las entradas previas quedan inaccesibles sin recorrerlas.
+    """
+
+    def __init__(self, backend, namespace: str, ttl: int | None = None):
+        self.backend = backend
+        self.namespace = namespace
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def _generation_key(self) -> str:
+        return f"{self.namespace}:generation"
+
+    async def _key(self, name: str, params: dict) -> str:
+        generation = await self.backend.get(self._generation_key)
+        generation = 0 if generation is MISSING else int(generation)
+        digest = hashlib.sha1(
+            json.dumps(params, sort_keys=True, default=str).encode()
+        ).hexdigest()
+        return f"{self.namespace}:{generation}:{name}:{digest}"
+
+    async def get_or_compute(
+        self, name: str, params: dict, compute: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        if self.backend is None:
+            return await compute()
+        try:
+            key = await self._key(name, params)
+            value = await self.backend.get(key)
+        except Exception:
+            logging.exception("No se pudo leer la cache %s", self.namespace)
+            return await compute()
+        if value is not MISSING:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = await compute()
+        try:
+            await self.backend.set(key, value, ttl=self.ttl)
+        except Exception:
+            logging.exception("No se pudo escribir la cache %s", self.namespace)
+        return value
+
+    async def invalidate(self) -> None:
+        if self.backend is None:
+            return
+        try:
+            await self.backend.incr(self._generation_key)
+        except Exception:
+            logging.exception("No se pudo invalidar la cache %s", self.namespace)
+
+    def stats(self) -> dict:
+        return {
+            "backend": type(self.backend).__name__ if self.backend else None,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+def cached(cache: ResultCache, name: str, ignore: tuple[str, ...] = ()):
+    """Cachea el resultado de un método async según sus argumentos."""
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = {
+                key: value
+                for key, value in bound.arguments.items()
+                if key != "self" and key not in ignore
+            }
+            return await cache.get_or_compute(
+                name, params, lambda: func(self, *args, **kwargs)
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def build_backend(kind: str, maxsize: int):
+    if kind == "memory":
+        return MemoryCache(maxsize=maxsize)
+    if kind == "redis":
+        if not settings.REDIS_URL:
+            raise RuntimeError("REDIS_URL es obligatorio para la cache en Redis")
+        return RedisCache.from_url(settings.REDIS_URL)
+    return None
+
+
+reports_cache = ResultCache(
+    build_backend(settings.REPORTS_CACHE_BACKEND, settings.REPORTS_CACHE_MAXSIZE),
+    namespace="reports",
+    ttl=settings.REPORTS_CACHE_TTL,
+)
+
+
+# Usuario autenticado + rol por id. Guarda instancias ORM desacopladas de la
+# sesión, por eso siempre vive en memoria del proceso.
+user_cache = MemoryCache(maxsize=settings.USER_CACHE_MAXSIZE)
+
+
+def user_cache_key(user_id: int) -> str:
+    return f"user:{user_id}"
+
+
+async def invalidate_user(user_id: int) -> None:
+    await user_cache.delete(user_cache_key(user_id))
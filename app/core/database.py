@@ -1,12 +1,146 @@
+import threading
+import time
 from typing import AsyncGenerator
 
+from sqlalchemy import Index, event
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from app.core.settings import settings
 
+
+class PoolMetrics:
+    """Contadores del pool para dimensionarlo bajo carga real."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.checkouts = 0
+            self.checkins = 0
+            self.connects = 0
+            self.timeouts = 0
+            self.checked_out = 0
+            self.peak_checked_out = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+
+    def record_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.wait_total += seconds
+            self.wait_max = max(self.wait_max, seconds)
+            if timed_out:
+                self.timeouts += 1
+
+    def record_checkout(self) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.checked_out += 1
+            self.peak_checked_out = max(self.peak_checked_out, self.checked_out)
+
+    def record_checkin(self) -> None:
+        with self._lock:
+            self.checkins += 1
+            self.checked_out = max(self.checked_out - 1, 0)
+
+    def record_connect(self) -> None:
+        with self._lock:
+            self.connects += 1
+
+    def snapshot(self, pool=None) -> dict:
+        with self._lock:
+            data = {
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "timeouts": self.timeouts,
+                "checked_out": self.checked_out,
+                "peak_checked_out": self.peak_checked_out,
+                "wait_total_ms": round(self.wait_total * 1000, 3),
+                "wait_max_ms": round(self.wait_max * 1000, 3),
+                "wait_avg_ms": (
+                    round(self.wait_total * 1000 / self.checkouts, 3)
+                    if self.checkouts
+                    else 0.0
+                ),
+            }
+        if isinstance(pool, AsyncAdaptedQueuePool):
+            data.update(
+                {
+                    "pool_size": pool.size(),
+                    "idle": pool.checkedin(),
+                    "overflow": pool.overflow(),
+                }
+            )
+        return data
+
+
+pool_metrics = PoolMetrics()
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """Pool que mide cuánto espera cada request para obtener una conexión."""
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except PoolTimeoutError:
+            pool_metrics.record_wait(time.perf_counter() - start, timed_out=True)
+            raise
+        pool_metrics.record_wait(time.perf_counter() - start)
+        return connection
+
+
+def _engine_options(database_url: str) -> dict:
+    url = make_url(database_url)
+    options = {"echo": settings.DB_ECHO}
+    if url.get_backend_name() == "sqlite":
+        return options
+
+    options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+    )
+    if settings.DB_STATEMENT_TIMEOUT_MS and url.get_driver_name() == "asyncpg":
+        options["connect_args"] = {
+            "server_settings": {
+                "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)
+            }
+        }
+    return options
+
+
 # Asegurate que tu DATABASE_URL sea asíncrona: postgresql+asyncpg://...
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
+engine = create_async_engine(
+    settings.DATABASE_URL, **_engine_options(settings.DATABASE_URL)
+)
+
+
+@event.listens_for(engine.sync_engine, "checkout")
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    pool_metrics.record_checkout()
+
+
+@event.listens_for(engine.sync_engine, "checkin")
+def _on_checkin(dbapi_connection, connection_record):
+    pool_metrics.record_checkin()
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def _on_connect(dbapi_connection, connection_record):
+    pool_metrics.record_connect()
+
 
 AsyncSessionLocal = sessionmaker(
     bind=engine, class_=AsyncSession, expire_on_commit=False
@@ -15,6 +149,32 @@ AsyncSessionLocal = sessionmaker(
 Base = declarative_base()
 
 
+def trigram_index(table: str, column: str) -> Index:
+    """Índice GIN ``gin_trgm_ops`` (pg_trgm) para ILIKE y búsqueda difusa."""
+    return Index(
+        f"ix_{table}_{column}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    )
+
+
+_DIALECT_INSERTS = {"postgresql": postgresql.insert, "sqlite": sqlite.insert}
+
+
+def dialect_insert(dialect_name: str, model):
+    """``INSERT`` del dialecto, con soporte de ``ON CONFLICT`` (upsert)."""
+    insert = _DIALECT_INSERTS.get(dialect_name)
+    if insert is None:
+        raise NotImplementedError(f"Dialecto no soportado: {dialect_name}")
+    return insert(model)
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         yield session
+
+
+def get_session_factory() -> sessionmaker:
+    """Fábrica de sesiones para trabajo concurrente dentro de un request."""
+    return AsyncSessionLocal
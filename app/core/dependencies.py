@@ -1,12 +1,18 @@
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
 
-from app.core.database import get_db
+from app.core.cache import MISSING, user_cache, user_cache_key
+from app.core.database import get_db, get_session_factory
+from app.core.revocations import token_revocations
 from app.core.security import decode_token
+from app.core.settings import settings
 from app.db.repositories.users import UsersRepository
 from app.models.users import User
+from app.schemas.auth import TokenPayload
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/token")
 
@@ -22,13 +28,39 @@ async def get_current_user(
     except JWTError:
         raise HTTPException(status_code=401, detail="Token inválido")
 
+    key = user_cache_key(int(user_id))
+    user = await user_cache.get(key)
+    if user is not MISSING:
+        return user
+
     repo = UsersRepository(db)
-    user = await repo.get_by_id(int(user_id))
+    user = await repo.get_with_role(int(user_id))
     if user is None:
         raise HTTPException(status_code=404, detail="Usuario no encontrado")
+    # el usuario se comparte entre requests: se desacopla de esta sesión
+    db.expunge(user)
+    await user_cache.set(key, user, ttl=settings.USER_CACHE_TTL)
     return user
 
 
+async def get_token_claims(
+    token: str = Depends(oauth2_scheme),
+    session_factory: sessionmaker = Depends(get_session_factory),
+) -> TokenPayload:
+    """Claims verificados del JWT, sin cargar el usuario de la base."""
+    try:
+        claims = TokenPayload(**decode_token(token))
+    except (JWTError, ValidationError):
+        raise HTTPException(status_code=401, detail="Token inválido")
+    if claims.sub is None or claims.role is None:
+        raise HTTPException(status_code=401, detail="Token inválido")
+
+    await token_revocations.ensure_fresh(session_factory)
+    if token_revocations.is_revoked(int(claims.sub), claims.ver):
+        raise HTTPException(status_code=401, detail="Token revocado")
+    return claims
+
+
 def admin_only(user: User = Depends(get_current_user)):
     if user.role.name != "admin":
         raise HTTPException(
@@ -37,7 +69,27 @@ def admin_only(user: User = Depends(get_current_user)):
     return user
 
 
-def roles_allowed(*allowed_roles):
+def roles_allowed(*allowed_roles, load_user: bool | None = None):
+    """Restringe por rol.
+
+    Con ``AUTH_STATELESS`` el rol se toma de los claims del token y el
+    endpoint recibe un ``TokenPayload``; ``load_user=True`` fuerza cargar el
+    ``User`` para endpoints que lo necesitan.
+    """
+    if load_user is None:
+        load_user = not settings.AUTH_STATELESS
+
+    if not load_user:
+
+        def from_claims(claims: TokenPayload = Depends(get_token_claims)):
+            if claims.role not in allowed_roles:
+                raise HTTPException(
+                    status_code=403, detail="No tiene permiso para esta operación"
+                )
+            return claims
+
+        return from_claims
+
     def wrapper(user: User = Depends(get_current_user)):
         if user.role_id not in allowed_roles:
             raise HTTPException(
@@ -0,0 +1,77 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+from sqlalchemy.orm import sessionmaker
+
+# Filas que se traen del cursor del servidor por cada viaje a la base
+EXPORT_BATCH_SIZE = 500
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _csv_line(values) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow([_csv_value(value) for value in values])
+    return buffer.getvalue()
+
+
+async def stream_rows(
+    session_factory: sessionmaker, query: Select, fmt: str
+) -> AsyncIterator[str]:
+    """Recorre ``query`` con un cursor del servidor y emite una línea por fila.
+
+    Usa su propia sesión: la respuesta se sigue enviando después de que el
+    endpoint devuelve y la sesión del request ya se cerró.
+    """
+    fields = list(query.selected_columns.keys())
+    if fmt == "csv":
+        yield _csv_line(fields)
+    async with session_factory() as session:
+        result = await session.stream(
+            query.execution_options(yield_per=EXPORT_BATCH_SIZE)
+        )
+        async for row in result:
+            if fmt == "csv":
+                yield _csv_line(row)
+            else:
+                # Decimal como texto, igual que en CSV: sin perder precisión
+                record = jsonable_encoder(
+                    dict(zip(fields, row)), custom_encoder={Decimal: str}
+                )
+                yield json.dumps(record, ensure_ascii=False) + "\n"
+
+
+def export_response(
+    session_factory: sessionmaker, query: Select, fmt: str, filename: str
+) -> StreamingResponse:
+    if fmt not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Formato inválido, use uno de: {', '.join(EXPORT_FORMATS)}",
+        )
+    return StreamingResponse(
+        stream_rows(session_factory, query, fmt),
+        media_type=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'},
+    )
@@ -0,0 +1,365 @@
+import asyncio
+import itertools
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import and_, func, or_, select, update
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import get_session_factory
+from app.core.settings import settings
+from app.models.jobs import BackgroundJob
+
+# handler(session_factory, **payload): corre fuera del request, con sesión propia
+Handler = Callable[..., Awaitable[None]]
+
+
+@dataclass
+class Job:
+    name: str
+    payload: dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+    id: int | None = None
+
+
+class MemoryJobs:
+    """Trabajos en un ``asyncio.Queue`` del proceso; se pierden si se reinicia."""
+
+    name = "memory"
+
+    def __init__(self):
+        self._queue: asyncio.Queue[Job] = asyncio.Queue()
+        self._ids = itertools.count(1)
+
+    async def push(self, job: Job) -> None:
+        job.id = next(self._ids)
+        self._queue.put_nowait(job)
+
+    async def pop(self) -> Job:
+        return await self._queue.get()
+
+    def _requeue(self, job: Job) -> None:
+        # se encola antes de marcar el intento anterior: join() no lo pierde
+        self._queue.put_nowait(job)
+        self._queue.task_done()
+
+    async def retry(self, job: Job, delay: float, error: str) -> None:
+        asyncio.get_running_loop().call_later(delay, self._requeue, job)
+
+    async def finish(self, job: Job, error: str | None = None) -> None:
+        self._queue.task_done()
+
+    async def join(self) -> None:
+        await self._queue.join()
+
+    async def drain(self) -> None:
+        await self.join()
+
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+
+class DatabaseJobs:
+    """Trabajos en la tabla ``background_jobs``.
+
+    Sobreviven reinicios y varios procesos los reparten con
+    ``FOR UPDATE SKIP LOCKED``. Los workers consultan cada ``poll_seconds``
+    y se despiertan antes cuando este mismo proceso encola algo. Un trabajo
+    tomado queda reservado ``lease_seconds``; si para entonces sigue en
+    ``running`` (worker caído, reinicio, ``stop()`` que cortó la espera) se
+    cuenta como intento fallido y se vuelve a tomar.
+    """
+
+    name = "database"
+
+    def __init__(
+        self, session_factory: sessionmaker, poll_seconds: float, lease_seconds: float
+    ):
+        self.session_factory = session_factory
+        self.poll_seconds = poll_seconds
+        self.lease_seconds = lease_seconds
+        self._wakeup = asyncio.Event()
+        self._claimed = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    async def push(self, job: Job) -> None:
+        async with self.session_factory() as session:
+            row = BackgroundJob(name=job.name, payload=job.payload)
+            session.add(row)
+            await session.commit()
+            job.id = row.id
+        self._wakeup.set()
+
+    async def _claim(self) -> Job | None:
+        async with self.session_factory() as session:
+            while True:
+                now = datetime.utcnow()
+                result = await session.execute(
+                    select(BackgroundJob)
+                    .where(
+                        or_(
+                            and_(
+                                BackgroundJob.status == "pending",
+                                BackgroundJob.run_at <= now,
+                            ),
+                            and_(
+                                BackgroundJob.status == "running",
+                                BackgroundJob.locked_until <= now,
+                            ),
+                        )
+                    )
+                    .order_by(BackgroundJob.run_at, BackgroundJob.id)
+                    .limit(1)
+                    .with_for_update(skip_locked=True)
+                )
+                row = result.scalar_one_or_none()
+                if row is None:
+                    return None
+                if row.status == "running":
+                    # la toma anterior venció sin terminar: fue un intento fallido
+                    row.attempts += 1
+                    row.last_error = "Toma vencida: el worker no terminó el trabajo"
+                    logging.warning(
+                        "Trabajo %s #%s retomado tras vencer su toma", row.name, row.id
+                    )
+                    if row.attempts >= settings.JOBS_MAX_ATTEMPTS:
+                        row.status = "failed"
+                        row.locked_until = None
+                        row.finished_at = now
+                        await session.commit()
+                        continue
+                row.status = "running"
+                row.locked_until = now + timedelta(seconds=self.lease_seconds)
+                await session.commit()
+                return Job(row.name, row.payload, attempts=row.attempts, id=row.id)
+
+    async def pop(self) -> Job:
+        while True:
+            self._wakeup.clear()
+            job = await self._claim()
+            if job is not None:
+                self._claimed += 1
+                self._idle.clear()
+                return job
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _update(self, job: Job, **values) -> None:
+        async with self.session_factory() as session:
+            await session.execute(
+                update(BackgroundJob)
+                .where(BackgroundJob.id == job.id)
+                .values(attempts=job.attempts, locked_until=None, **values)
+            )
+            await session.commit()
+        self._claimed -= 1
+        if not self._claimed:
+            self._idle.set()
+
+    async def retry(self, job: Job, delay: float, error: str) -> None:
+        await self._update(
+            job,
+            status="pending",
+            run_at=datetime.utcnow() + timedelta(seconds=delay),
+            last_error=error,
+        )
+        # sin esperar al próximo sondeo si el reintento vence antes
+        asyncio.get_running_loop().call_later(delay, self._wakeup.set)
+
+    async def finish(self, job: Job, error: str | None = None) -> None:
+        await self._update(
+            job,
+            status="failed" if error else "done",
+            last_error=error,
+            finished_at=datetime.utcnow(),
+        )
+
+    async def join(self) -> None:
+        """Espera a que no queden trabajos pendientes ni en curso en la tabla."""
+        while True:
+            async with self.session_factory() as session:
+                result = await session.execute(
+                    select(func.count()).where(
+                        BackgroundJob.status.in_(("pending", "running"))
+                    )
+                )
+                if not result.scalar_one():
+                    return
+            await asyncio.sleep(0.05)
+
+    async def drain(self) -> None:
+        # los pendientes quedan en la tabla; solo se esperan los ya tomados
+        await self._idle.wait()
+
+    def pending(self) -> int | None:
+        return None
+
+
+class JobQueue:
+    """Cola de trabajos en segundo plano con reintentos y backoff exponencial.
+
+    Los efectos secundarios (notificaciones, correos...) se encolan y corren
+    en workers del event loop después de que el request respondió. Sin
+    workers (``JOBS_WORKERS=0``, scripts, consola) ``enqueue`` ejecuta el
+    trabajo en el momento y solo registra sus errores.
+    """
+
+    def __init__(self):
+        self.handlers: dict[str, Handler] = {}
+        self.backend: MemoryJobs | DatabaseJobs | None = None
+        self.session_factory: sessionmaker | None = None
+        self._workers: list[asyncio.Task] = []
+        self._scheduled: set[asyncio.Task] = set()
+        self.processed = 0
+        self.retried = 0
+        self.failed = 0
+
+    def register(self, name: str) -> Callable[[Handler], Handler]:
+        def decorator(handler: Handler) -> Handler:
+            self.handlers[name] = handler
+            return handler
+
+        return decorator
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    async def start(
+        self,
+        session_factory: sessionmaker,
+        backend: str | None = None,
+        workers: int | None = None,
+    ) -> None:
+        backend = backend or settings.JOBS_BACKEND
+        self.session_factory = session_factory
+        if backend == "database":
+            self.backend = DatabaseJobs(
+                session_factory, settings.JOBS_POLL_SECONDS, settings.JOBS_LEASE_SECONDS
+            )
+        else:
+            self.backend = MemoryJobs()
+        workers = settings.JOBS_WORKERS if workers is None else workers
+        self._workers = [asyncio.create_task(self._work()) for _ in range(workers)]
+
+    async def stop(self, timeout: float | None = None) -> None:
+        """Espera los trabajos en curso (hasta ``timeout``) y detiene los workers."""
+        timeout = settings.JOBS_SHUTDOWN_SECONDS if timeout is None else timeout
+        if self._scheduled:
+            await asyncio.wait(self._scheduled, timeout=timeout)
+        if self.running:
+            try:
+                await asyncio.wait_for(self.backend.drain(), timeout)
+            except asyncio.TimeoutError:
+                logging.warning("Trabajos en segundo plano sin terminar al detener")
+            for worker in self._workers:
+                worker.cancel()
+            await asyncio.gather(*self._workers, return_exceptions=True)
+            self._workers = []
+        self.session_factory = None
+
+    async def enqueue(self, name: str, **payload) -> None:
+        if name not in self.handlers:
+            raise ValueError(f"Trabajo desconocido: {name}")
+        job = Job(name, payload)
+        if not self.running:
+            try:
+                await self._run(job)
+                self.processed += 1
+            except Exception:
+                self.failed += 1
+                logging.exception("Trabajo %s falló", name)
+            return
+        await self.backend.push(job)
+
+    def schedule(self, name: str, **payload) -> asyncio.Task:
+        """Encola desde código sincrónico (eventos del ORM) sin esperar.
+
+        Necesita un event loop en marcha (``RuntimeError`` si no lo hay). La
+        tarea queda referenciada hasta terminar y sus errores se registran.
+        """
+        if name not in self.handlers:
+            raise ValueError(f"Trabajo desconocido: {name}")
+        task = asyncio.get_running_loop().create_task(self.enqueue(name, **payload))
+        self._scheduled.add(task)
+        task.add_done_callback(self._scheduled_done)
+        return task
+
+    def _scheduled_done(self, task: asyncio.Task) -> None:
+        self._scheduled.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logging.error("No se pudo encolar un trabajo", exc_info=task.exception())
+
+    async def join(self) -> None:
+        """Espera a que se procesen todos los trabajos encolados."""
+        if self._scheduled:
+            await asyncio.wait(self._scheduled)
+        if self.running:
+            await self.backend.join()
+
+    async def _run(self, job: Job) -> None:
+        factory = self.session_factory or get_session_factory()
+        await self.handlers[job.name](factory, **job.payload)
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                await self._process(await self.backend.pop())
+            except Exception:
+                # la base no responde: se reintenta sin perder el worker
+                logging.exception("Error en la cola de trabajos")
+                await asyncio.sleep(settings.JOBS_POLL_SECONDS)
+
+    async def _process(self, job: Job) -> None:
+        job.attempts += 1
+        try:
+            await self._run(job)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            error = repr(exc)
+            if job.attempts < settings.JOBS_MAX_ATTEMPTS:
+                delay = min(
+                    settings.JOBS_BACKOFF_SECONDS * 2 ** (job.attempts - 1),
+                    settings.JOBS_BACKOFF_MAX_SECONDS,
+                )
+                logging.warning(
+                    "Trabajo %s #%s falló (intento %s), reintento en %ss: %s",
+                    job.name,
+                    job.id,
+                    job.attempts,
+                    delay,
+                    error,
+                )
+                self.retried += 1
+                await self.backend.retry(job, delay, error)
+                return
+            logging.exception(
+                "Trabajo %s #%s descartado tras %s intentos",
+                job.name,
+                job.id,
+                job.attempts,
+            )
+            self.failed += 1
+            await self.backend.finish(job, error)
+            return
+        self.processed += 1
+        await self.backend.finish(job)
+
+    def snapshot(self) -> dict:
+        return {
+            "backend": self.backend.name if self.backend else None,
+            "workers": len(self._workers),
+            "pending": self.backend.pending() if self.backend else 0,
+            "processed": self.processed,
+            "retried": self.retried,
+            "failed": self.failed,
+        }
+
+
+job_queue = JobQueue()
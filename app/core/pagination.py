@@ -0,0 +1,60 @@
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Callable, Sequence
+
+from fastapi import HTTPException
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import tuple_
+
+
+def encode_cursor(*values: Any) -> str:
+    """Cursor opaco con los valores de ordenamiento de la última fila."""
+    raw = json.dumps(jsonable_encoder(list(values)), separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def _parse(value: Any, type_: type) -> Any:
+    if type_ is datetime:
+        return datetime.fromisoformat(value)
+    if type_ is date:
+        return date.fromisoformat(value)
+    if type_ is Decimal:
+        return Decimal(str(value))
+    return type_(value)
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple:
+    """Decodifica un cursor validando cantidad y tipo de sus valores."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError
+        return tuple(_parse(value, type_) for value, type_ in zip(values, types))
+    except (
+        binascii.Error,
+        InvalidOperation,
+        UnicodeDecodeError,
+        TypeError,
+        ValueError,
+    ):
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+
+
+def after_cursor(columns: Sequence, cursor: str):
+    """Filtro keyset para un orden descendente por ``columns``."""
+    types = [column.type.python_type for column in columns]
+    values = decode_cursor(cursor, *types)
+    if len(columns) == 1:
+        return columns[0] < values[0]
+    return tuple_(*columns) < tuple_(*values)
+
+
+def next_cursor(items: Sequence, limit: int, key: Callable[[Any], tuple]) -> str | None:
+    """Cursor a la página siguiente, o ``None`` si no hay más resultados."""
+    if not items or len(items) < limit:
+        return None
+    return encode_cursor(*key(items[-1]))
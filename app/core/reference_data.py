@@ -0,0 +1,131 @@
+import time
+from typing import Any
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.settings import settings
+from app.models.expense import ExpenseType
+from app.models.invoices import InvoiceStatus, InvoiceType, PaymentMethod
+from app.models.users import Role
+from app.models.work_orders import WorkOrderStatus
+from app.models.work_orders_mechanic import WorkArea
+
+REFERENCE_MODELS = (
+    ExpenseType,
+    InvoiceStatus,
+    InvoiceType,
+    PaymentMethod,
+    Role,
+    WorkArea,
+    WorkOrderStatus,
+)
+
+
+class ReferenceDataRegistry:
+    """Copia en memoria de las tablas de referencia (estados, tipos, roles...).
+
+    Se carga al iniciar la app y se recarga completa cada ``ttl`` segundos o
+    cuando este proceso modifica alguna de esas tablas. Las filas son copias
+    transitorias (fuera de toda sesión) y se tratan como de solo lectura.
+    """
+
+    def __init__(self, models: tuple[type, ...], ttl: int):
+        self.models = models
+        self.ttl = ttl
+        self.clear()
+
+    def clear(self) -> None:
+        self.rows: dict[type, dict[int, Any]] = {}
+        self.loaded_at: float | None = None
+
+    def invalidate(self) -> None:
+        self.loaded_at = None
+
+    @property
+    def stale(self) -> bool:
+        return self.loaded_at is None or time.monotonic() - self.loaded_at >= self.ttl
+
+    async def load(self, db: AsyncSession) -> None:
+        rows = {}
+        for model in self.models:
+            # columnas sueltas: no toca el identity map de la sesión del request
+            result = await db.execute(
+                select(*model.__table__.columns).order_by(model.id)
+            )
+            rows[model] = {row.id: model(**row._mapping) for row in result.all()}
+        self.rows = rows
+        self.loaded_at = time.monotonic()
+
+    async def preload(self, session_factory: sessionmaker) -> None:
+        async with session_factory() as session:
+            await self.load(session)
+
+    async def ensure_fresh(self, db: AsyncSession) -> None:
+        if self.stale:
+            await self.load(db)
+
+    async def all(self, db: AsyncSession, model: type) -> list:
+        await self.ensure_fresh(db)
+        return list(self.rows.get(model, {}).values())
+
+    async def ids(self, db: AsyncSession, model: type) -> set[int]:
+        await self.ensure_fresh(db)
+        return set(self.rows.get(model, {}))
+
+    async def known(self, db: AsyncSession, model: type, obj_id: int) -> bool:
+        """Si ``obj_id`` es un id existente de una tabla de referencia.
+
+        Un id que no está en memoria no se da por inexistente: quien valida
+        lo consulta en la base, así un registro nuevo no obliga a recargar.
+        """
+        return model in self.models and obj_id in await self.ids(db, model)
+
+    async def get(self, db: AsyncSession, model: type, obj_id: int) -> Any:
+        """Fila por id; un id desconocido se busca solo (puede ser nuevo).
+
+        Un id inexistente cuesta una consulta por clave primaria, nunca una
+        recarga de todas las tablas.
+        """
+        await self.ensure_fresh(db)
+        item = self.rows.get(model, {}).get(obj_id)
+        if item is None and model in self.models:
+            result = await db.execute(
+                select(*model.__table__.columns).where(model.id == obj_id)
+            )
+            row = result.one_or_none()
+            if row is not None:
+                item = model(**row._mapping)
+                self.rows.setdefault(model, {})[obj_id] = item
+        return item
+
+    def snapshot(self) -> dict:
+        return {
+            "loaded": self.loaded_at is not None,
+            "age_seconds": (
+                round(time.monotonic() - self.loaded_at, 3)
+                if self.loaded_at is not None
+                else None
+            ),
+            "rows": {
+                model.__tablename__: len(rows) for model, rows in self.rows.items()
+            },
+        }
+
+
+reference_data = ReferenceDataRegistry(
+    REFERENCE_MODELS, ttl=settings.REFERENCE_DATA_REFRESH_SECONDS
+)
+
+
+def _invalidate_on_change(session, flush_context) -> None:
+    changed = session.new | session.dirty | session.deleted
+    if any(isinstance(obj, reference_data.models) for obj in changed):
+        reference_data.invalidate()
+
+
+def register_reference_data_listeners() -> None:
+    """Recarga el registro cuando este proceso escribe una tabla de referencia."""
+    if not event.contains(Session, "after_flush", _invalidate_on_change):
+        event.listen(Session, "after_flush", _invalidate_on_change)
@@ -1,19 +1,46 @@
+from functools import lru_cache
 from typing import Any, Optional
 
 from fastapi.encoders import jsonable_encoder
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+from pydantic import TypeAdapter
 
 from app.constants.response_codes import ResponseCode
 from app.schemas.response import ResponseSchema
 
 
-def success_response(data: Any = None, message: Optional[str] = None) -> JSONResponse:
+@lru_cache(maxsize=None)
+def _envelope_adapter(schema: Any) -> TypeAdapter:
+    return TypeAdapter(ResponseSchema[schema])
+
+
+def success_response(
+    data: Any = None,
+    message: Optional[str] = None,
+    next_cursor: Optional[str] = None,
+    schema: Any = None,
+) -> Response:
+    """Respuesta estándar ``ResponseSchema``.
+
+    Con ``schema`` (por ejemplo ``list[WorkOrderOut]``) los datos se validan
+    directo desde los objetos ORM o filas y se serializan a bytes en una sola
+    pasada con pydantic-core, sin ``jsonable_encoder`` ni ``json.dumps``.
+    """
+    envelope = {
+        "code": ResponseCode.SUCCESS,
+        "success": True,
+        "message": message,
+        "data": data,
+        "next_cursor": next_cursor,
+    }
+    if schema is not None:
+        adapter = _envelope_adapter(schema)
+        body = adapter.dump_json(
+            adapter.validate_python(envelope, from_attributes=True)
+        )
+        return Response(content=body, media_type="application/json")
+
+    envelope["data"] = jsonable_encoder(data)
     return JSONResponse(
-        status_code=200,
-        content=ResponseSchema(
-            code=ResponseCode.SUCCESS,
-            success=True,
-            message=message,
-            data=jsonable_encoder(data),
-        ).model_dump(),
+        status_code=200, content=ResponseSchema(**envelope).model_dump()
     )
@@ -0,0 +1,44 @@
+import time
+
+from sqlalchemy.orm import sessionmaker
+
+from app.core.settings import settings
+from app.db.repositories.token_revocations import TokenRevocationsRepository
+
+
+class TokenRevocationRegistry:
+    """Copia en memoria de ``user_token_revocations`` para validar tokens.
+
+    Se recarga completa cada ``ttl`` segundos; los cambios hechos por este
+    proceso se reflejan de inmediato con ``record``.
+    """
+
+    def __init__(self, ttl: int):
+        self.ttl = ttl
+        self.clear()
+
+    def clear(self) -> None:
+        self.versions: dict[int, int] = {}
+        self.loaded_at: float | None = None
+
+    async def ensure_fresh(self, session_factory: sessionmaker) -> None:
+        now = time.monotonic()
+        if self.loaded_at is not None and now - self.loaded_at < self.ttl:
+            return
+        async with session_factory() as session:
+            self.versions = await TokenRevocationsRepository(session).versions()
+        self.loaded_at = now
+
+    def current_version(self, user_id: int) -> int:
+        return self.versions.get(user_id, 0)
+
+    def is_revoked(self, user_id: int, token_version: int) -> bool:
+        return token_version < self.current_version(user_id)
+
+    def record(self, user_id: int, token_version: int) -> None:
+        self.versions[user_id] = token_version
+
+
+token_revocations = TokenRevocationRegistry(
+    ttl=settings.AUTH_REVOCATION_REFRESH_SECONDS
+)
@@ -7,6 +7,54 @@ class Settings(BaseSettings):
     SENTRY_DSN: str | None = None
     PRODUCTION: bool = False
 
+    # Pool de conexiones del engine asíncrono
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_ECHO: bool = False
+    # Timeout por sentencia en milisegundos (solo PostgreSQL). None = sin límite
+    DB_STATEMENT_TIMEOUT_MS: int | None = None
+
+    # Cache de reportes: "memory" (LRU del proceso), "redis" o "none"
+    REPORTS_CACHE_BACKEND: str = "memory"
+    REPORTS_CACHE_TTL: int = 300
+    REPORTS_CACHE_MAXSIZE: int = 256
+    REDIS_URL: str | None = None
+
+    # Pool de hilos para bcrypt: hilos concurrentes y pedidos en espera
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 100
+
+    # Autorización solo con los claims del JWT (sin consultar el usuario)
+    AUTH_STATELESS: bool = False
+    AUTH_REVOCATION_REFRESH_SECONDS: int = 30
+
+    # Cache del usuario autenticado (por proceso)
+    USER_CACHE_TTL: int = 60
+    USER_CACHE_MAXSIZE: int = 1024
+
+    # Tablas de referencia en memoria (estados, tipos, roles, áreas, métodos)
+    REFERENCE_DATA_REFRESH_SECONDS: int = 300
+    # Validar ids de esas tablas contra la copia en memoria
+    FK_LOOKUP_CACHE: bool = True
+
+    # Trabajos en segundo plano: "memory" (cola del proceso) o "database"
+    # (tabla background_jobs, sobrevive reinicios y se reparte entre procesos)
+    JOBS_BACKEND: str = "memory"
+    # 0 = sin workers: cada trabajo corre en el momento en que se encola
+    JOBS_WORKERS: int = 2
+    JOBS_MAX_ATTEMPTS: int = 5
+    # Espera antes del reintento n: BACKOFF * 2^(n-1), hasta BACKOFF_MAX
+    JOBS_BACKOFF_SECONDS: float = 1
+    JOBS_BACKOFF_MAX_SECONDS: float = 300
+    JOBS_POLL_SECONDS: float = 5
+    JOBS_SHUTDOWN_SECONDS: float = 10
+    # Backend "database": un trabajo tomado y sin terminar tras este plazo
+    # (worker caído, reinicio) vuelve a tomarse como intento fallido
+    JOBS_LEASE_SECONDS: float = 300
+
     class Config:
         env_file = ".env"
         extra = "allow"
@@ -1,8 +1,14 @@
+from datetime import datetime
+from typing import Any, Iterable
+
 from fastapi import HTTPException
-from sqlalchemy import func
+from sqlalchemy import func, literal, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from app.core.reference_data import reference_data
+from app.core.settings import settings
+
 
 async def get_or_404(db: AsyncSession, model, obj_id: int, name: str = "Recurso"):
     if obj_id <= 0:
@@ -35,6 +41,10 @@ async def exists_or_404(db: AsyncSession, model, obj_id: int):
 async def validate_foreign_keys(db: AsyncSession, mapping: dict) -> None:
     """Ensure all referenced foreign keys exist.
 
+    All ids are checked with a single query and every missing reference is
+    reported at once. Ids of reference tables (statuses, types, roles...) are
+    first looked up in the in-memory ``reference_data`` registry.
+
     Parameters
     ----------
     db: AsyncSession
@@ -49,6 +59,65 @@ async def validate_foreign_keys(db: AsyncSession, mapping: dict) -> None:
         If any provided id does not exist in the database.
     """
 
+    pending = {}
     for model, obj_id in mapping.items():
-        if obj_id is not None:
-            await exists_or_404(db, model, obj_id)
+        if obj_id is None:
+            continue
+        if settings.FK_LOOKUP_CACHE and await reference_data.known(db, model, obj_id):
+            continue
+        pending[model] = obj_id
+
+    # lo que no está en memoria (o puede ser nuevo) se consulta junto
+    found = await existing_ids(
+        db, {model: [obj_id] for model, obj_id in pending.items() if obj_id > 0}
+    )
+    missing = [
+        f"{model.__name__} con id {obj_id} no existe"
+        for model, obj_id in pending.items()
+        if obj_id not in found.get(model, ())
+    ]
+    if missing:
+        raise HTTPException(status_code=404, detail="; ".join(missing))
+
+
+async def existing_ids(
+    db: AsyncSession, mapping: dict[type, Iterable[int]]
+) -> dict[type, set[int]]:
+    """Ids existentes por modelo, resueltos en una única consulta UNION ALL."""
+    models = [model for model, ids in mapping.items() if ids]
+    found = {model: set() for model in mapping}
+    if not models:
+        return found
+
+    queries = [
+        select(literal(position).label("model"), model.id.label("id")).where(
+            model.id.in_(set(mapping[model]))
+        )
+        for position, model in enumerate(models)
+    ]
+    query = queries[0] if len(queries) == 1 else union_all(*queries)
+    result = await db.execute(query)
+    for position, obj_id in result.all():
+        found[models[position]].add(obj_id)
+    return found
+
+
+def day_bounds(
+    start_date: datetime | None, end_date: datetime | None
+) -> tuple[datetime | None, datetime | None]:
+    """Extiende un rango de fechas a días completos."""
+    if start_date:
+        start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+    if end_date:
+        end_date = end_date.replace(hour=23, minute=59, second=59, microsecond=999999)
+    return start_date, end_date
+
+
+def check_range(
+    low: Any,
+    high: Any,
+    detail: str = "La fecha de inicio no puede ser mayor que la fecha final",
+) -> None:
+    """400 si ambos extremos están informados y ``low`` es mayor que ``high``."""
+    if low is not None and high is not None and low > high:
+        raise HTTPException(status_code=400, detail=detail)
@@ -25,8 +25,10 @@ class ClientsRepository:
         name: Optional[str] = None,
         document_number: Optional[str] = None,
         phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
     ) -> list[Client]:
-        query = select(Client)
+        query = select(Client).order_by(Client.id).offset(skip).limit(limit)
 
         filters = []
         if type:
@@ -1,19 +1,40 @@
-from sqlalchemy import select
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.models.expense import Expense, ExpenseType
+from app.core.pagination import after_cursor
+from app.models.expense import Expense
 from app.schemas.expenses import ExpenseCreate
 
 
+def _expense_filters(
+    query,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    expense_type_id: int | None = None,
+    min_amount: Decimal | None = None,
+    max_amount: Decimal | None = None,
+):
+    if start_date is not None:
+        query = query.where(Expense.date >= start_date)
+    if end_date is not None:
+        query = query.where(Expense.date <= end_date)
+    if expense_type_id is not None:
+        query = query.where(Expense.expense_type_id == expense_type_id)
+    if min_amount is not None:
+        query = query.where(Expense.amount >= min_amount)
+    if max_amount is not None:
+        query = query.where(Expense.amount <= max_amount)
+    return query
+
+
 class ExpensesRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
 
-    async def list_types(self) -> list[ExpenseType]:
-        result = await self.db.execute(select(ExpenseType))
-        return result.scalars().all()
-
     async def create_expense(self, data: ExpenseCreate) -> Expense:
         expense = Expense(**data.model_dump())
         self.db.add(expense)
@@ -29,8 +50,54 @@ class ExpensesRepository:
         )
         return result.scalar_one_or_none()
 
-    async def list_expenses(self) -> list[Expense]:
-        result = await self.db.execute(
-            select(Expense).options(selectinload(Expense.expense_type))
+    async def list_expenses(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        expense_type_id: int | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: str | None = None,
+    ) -> list[Expense]:
+        query = _expense_filters(
+            select(Expense).options(selectinload(Expense.expense_type)),
+            start_date,
+            end_date,
+            expense_type_id,
+            min_amount,
+            max_amount,
+        )
+        if after is not None:
+            query = query.where(after_cursor([Expense.date, Expense.id], after))
+        query = (
+            query.order_by(Expense.date.desc(), Expense.id.desc())
+            .offset(skip)
+            .limit(limit)
         )
+        result = await self.db.execute(query)
         return result.scalars().all()
+
+    async def total(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        expense_type_id: int | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+    ) -> dict:
+        """Suma y cantidad de los gastos filtrados, calculadas en SQL."""
+        query = _expense_filters(
+            select(
+                func.coalesce(func.sum(Expense.amount), 0).label("total"),
+                func.count(Expense.id).label("count"),
+            ),
+            start_date,
+            end_date,
+            expense_type_id,
+            min_amount,
+            max_amount,
+        )
+        result = await self.db.execute(query)
+        return dict(result.mappings().one())
@@ -1,15 +1,68 @@
+from collections import defaultdict
 from datetime import datetime
 from decimal import Decimal
 
-from sqlalchemy import func, select
+from sqlalchemy import Numeric, case, func, insert, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.models.invoices import BankCheck, Invoice, Payment, PaymentMethod
+from app.core.pagination import after_cursor
+from app.db.repositories.report_rollups import ReportRollupsRepository, RollupDeltas
+from app.models.clients import Client
+from app.models.invoices import (
+    BankCheck,
+    Invoice,
+    InvoiceStatus,
+    InvoiceType,
+    Payment,
+    PaymentMethod,
+)
 from app.models.work_orders import WorkOrder
 from app.schemas.invoices import InvoiceCreate, InvoiceUpdate, PaymentCreate
 
 
+def _invoice_filters(
+    query,
+    status_id: int | None = None,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    client_id: int | None = None,
+):
+    if status_id is not None:
+        query = query.where(Invoice.status_id == status_id)
+    if start_date is not None:
+        query = query.where(Invoice.issued_at >= start_date)
+    if end_date is not None:
+        query = query.where(Invoice.issued_at <= end_date)
+    if client_id is not None:
+        query = query.where(Invoice.client_id == client_id)
+    return query
+
+
+def _payment_filters(
+    query,
+    client_id: int | None = None,
+    invoice_id: int | None = None,
+    payment_type: str | None = None,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+):
+    if client_id is not None:
+        query = query.where(Payment.invoice.has(Invoice.client_id == client_id))
+    if invoice_id is not None:
+        query = query.where(Payment.invoice_id == invoice_id)
+    if payment_type is not None:
+        if payment_type.lower() in {"physical", "electronic"}:
+            query = query.where(Payment.bank_checks.any(BankCheck.type == payment_type))
+        else:
+            query = query.where(Payment.method.has(PaymentMethod.name == payment_type))
+    if start_date is not None:
+        query = query.where(Payment.date >= start_date)
+    if end_date is not None:
+        query = query.where(Payment.date <= end_date)
+    return query
+
+
 class InvoicesRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -35,6 +88,75 @@ class InvoicesRepository:
         )
         return result.scalar_one_or_none()
 
+    async def reconcile_paid(self) -> list[dict]:
+        """Recalcula ``paid`` desde los pagos en las facturas que no coinciden."""
+        expected = (
+            select(func.coalesce(func.sum(Payment.amount), 0))
+            .where(Payment.invoice_id == Invoice.id)
+            .scalar_subquery()
+        )
+        mismatch = func.coalesce(Invoice.paid, 0) != expected
+        result = await self.db.execute(
+            select(Invoice.id, Invoice.client_id, Invoice.paid).where(mismatch)
+        )
+        previous = {row.id: row for row in result.all()}
+        if not previous:
+            return []
+
+        result = await self.db.execute(
+            update(Invoice)
+            .where(Invoice.id.in_(list(previous)), mismatch)
+            .values(paid=expected)
+            .returning(Invoice.id, Invoice.paid)
+            .execution_options(synchronize_session=False)
+        )
+        fixed = [
+            {
+                "invoice_id": invoice_id,
+                "previous": previous[invoice_id].paid,
+                "paid": paid,
+            }
+            for invoice_id, paid in result.all()
+        ]
+        # el resumen por cliente puede estar tan desfasado como la factura
+        await ReportRollupsRepository(self.db).refresh_client_paid(
+            {previous[row["invoice_id"]].client_id for row in fixed}
+        )
+        await self.db.commit()
+        return fixed
+
+    def export_query(
+        self,
+        status_id: int | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        client_id: int | None = None,
+    ):
+        """Columnas planas para exportar, con los mismos filtros que ``list``."""
+        query = (
+            select(
+                Invoice.id,
+                Invoice.invoice_number,
+                Invoice.issued_at,
+                Invoice.work_order_id,
+                Invoice.client_id,
+                Client.name.label("client_name"),
+                InvoiceType.name.label("invoice_type"),
+                InvoiceStatus.name.label("status"),
+                Invoice.labor_total,
+                Invoice.parts_total,
+                Invoice.iva,
+                Invoice.total,
+                Invoice.paid,
+                Invoice.accepted,
+            )
+            .outerjoin(Client, Client.id == Invoice.client_id)
+            .outerjoin(InvoiceType, InvoiceType.id == Invoice.invoice_type_id)
+            .outerjoin(InvoiceStatus, InvoiceStatus.id == Invoice.status_id)
+            .order_by(Invoice.id.desc())
+        )
+        return _invoice_filters(query, status_id, start_date, end_date, client_id)
+
     async def list(
         self,
         skip: int = 0,
@@ -43,6 +165,7 @@ class InvoicesRepository:
         start_date: datetime | None = None,
         end_date: datetime | None = None,
         client_id: int | None = None,
+        after: str | None = None,
     ) -> list[Invoice]:
         query = (
             select(Invoice)
@@ -55,14 +178,9 @@ class InvoicesRepository:
             .offset(skip)
             .limit(limit)
         )
-        if status_id is not None:
-            query = query.where(Invoice.status_id == status_id)
-        if start_date is not None:
-            query = query.where(Invoice.issued_at >= start_date)
-        if end_date is not None:
-            query = query.where(Invoice.issued_at <= end_date)
-        if client_id is not None:
-            query = query.where(Invoice.client_id == client_id)
+        query = _invoice_filters(query, status_id, start_date, end_date, client_id)
+        if after is not None:
+            query = query.where(after_cursor([Invoice.id], after))
         result = await self.db.execute(query)
         return result.scalars().all()
 
@@ -103,12 +221,89 @@ class PaymentsRepository:
             self.db.add(BankCheck(payment_id=payment.id, **bc.model_dump()))
 
         # Actualizar total pagado en la factura
-        invoice = await self.db.get(Invoice, data.invoice_id)
-        invoice.paid = (invoice.paid or Decimal("0")) + Decimal(str(data.amount))
+        await self._add_paid({data.invoice_id: Decimal(str(data.amount))})
 
         await self.db.commit()
         return await self.get(payment.id)
 
+    async def _add_paid(self, amounts: dict[int, Decimal]) -> None:
+        """Suma ``amounts`` al ``paid`` de cada factura en un único UPDATE atómico.
+
+        ``paid = paid + monto`` se resuelve en la base, así dos pagos
+        concurrentes sobre la misma factura no pisan el valor del otro.
+        """
+        increment = case(
+            {
+                invoice_id: literal(amount, Numeric(10, 2))
+                for invoice_id, amount in amounts.items()
+            },
+            value=Invoice.id,
+        )
+        result = await self.db.execute(
+            update(Invoice)
+            .where(Invoice.id.in_(list(amounts)))
+            .values(paid=func.coalesce(Invoice.paid, 0) + increment)
+            .returning(Invoice.id, Invoice.client_id)
+            .execution_options(synchronize_session=False)
+        )
+        # el UPDATE no pasa por el flush del ORM: los resúmenes se ajustan aparte
+        deltas = RollupDeltas()
+        for invoice_id, client_id in result.all():
+            deltas.add_invoice_paid(client_id, amounts[invoice_id])
+        await ReportRollupsRepository(self.db).apply(deltas)
+
+    async def create_bulk(self, payments: list[PaymentCreate]) -> list[int]:
+        """Inserta pagos y cheques en lote y acumula ``paid`` con un único UPDATE.
+
+        Devuelve los ids de los pagos en el mismo orden recibido.
+        """
+        now = datetime.utcnow()
+        rows = [
+            {**payment.model_dump(exclude={"bank_checks"}), "date": now}
+            for payment in payments
+        ]
+        result = await self.db.execute(
+            insert(Payment).returning(Payment.id, sort_by_parameter_order=True), rows
+        )
+        payment_ids = result.scalars().all()
+
+        checks = [
+            {**check.model_dump(), "payment_id": payment_id}
+            for payment, payment_id in zip(payments, payment_ids)
+            for check in payment.bank_checks or []
+        ]
+        if checks:
+            await self.db.execute(insert(BankCheck), checks)
+
+        amounts = defaultdict(Decimal)
+        for payment in payments:
+            amounts[payment.invoice_id] += Decimal(str(payment.amount))
+        await self._add_paid(amounts)
+
+        # el insert masivo no pasa por el flush del ORM
+        deltas = RollupDeltas()
+        for payment in payments:
+            deltas.add_payment(now, payment.amount)
+        await ReportRollupsRepository(self.db).apply(deltas)
+
+        await self.db.commit()
+        return payment_ids
+
+    async def due_checks(self, payment_ids: list[int]) -> list[BankCheck]:
+        result = await self.db.execute(
+            select(BankCheck)
+            .options(
+                selectinload(BankCheck.payment)
+                .selectinload(Payment.invoice)
+                .selectinload(Invoice.work_order)
+                .selectinload(WorkOrder.reviewer)
+            )
+            .where(
+                BankCheck.payment_id.in_(payment_ids), BankCheck.due_date.isnot(None)
+            )
+        )
+        return result.scalars().all()
+
     async def get(self, payment_id: int) -> Payment | None:
         result = await self.db.execute(
             select(Payment)
@@ -148,10 +343,6 @@ class PaymentsRepository:
         )
         return float(result.scalar_one())
 
-    async def list_methods(self) -> list[PaymentMethod]:
-        result = await self.db.execute(select(PaymentMethod))
-        return result.scalars().all()
-
     async def get_bank_check(self, check_id: int) -> BankCheck | None:
         result = await self.db.execute(
             select(BankCheck).where(BankCheck.id == check_id)
@@ -169,6 +360,37 @@ class PaymentsRepository:
         await self.db.refresh(check)
         return check
 
+    def export_query(
+        self,
+        client_id: int | None = None,
+        invoice_id: int | None = None,
+        payment_type: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ):
+        """Columnas planas para exportar, con los mismos filtros que ``list``."""
+        query = (
+            select(
+                Payment.id,
+                Payment.date,
+                Payment.invoice_id,
+                Invoice.invoice_number,
+                Invoice.client_id,
+                Client.name.label("client_name"),
+                PaymentMethod.name.label("method"),
+                Payment.amount,
+                Payment.reference,
+                Payment.notes,
+            )
+            .outerjoin(Invoice, Invoice.id == Payment.invoice_id)
+            .outerjoin(Client, Client.id == Invoice.client_id)
+            .outerjoin(PaymentMethod, PaymentMethod.id == Payment.method_id)
+            .order_by(Payment.date.desc(), Payment.id.desc())
+        )
+        return _payment_filters(
+            query, client_id, invoice_id, payment_type, start_date, end_date
+        )
+
     async def list(
         self,
         client_id: int | None = None,
@@ -178,6 +400,7 @@ class PaymentsRepository:
         end_date: datetime | None = None,
         skip: int = 0,
         limit: int = 100,
+        after: str | None = None,
     ) -> list[Payment]:
         """Return payments filtered by client and/or invoice."""
         query = select(Payment).options(
@@ -187,25 +410,16 @@ class PaymentsRepository:
             selectinload(Payment.invoice).selectinload(Invoice.invoice_type),
             selectinload(Payment.invoice).selectinload(Invoice.status),
         )
-        if client_id is not None:
-            query = query.join(Payment.invoice).where(Invoice.client_id == client_id)
-        if invoice_id is not None:
-            query = query.where(Payment.invoice_id == invoice_id)
-        if payment_type is not None:
-            if payment_type.lower() in {"physical", "electronic"}:
-                query = query.join(Payment.bank_checks).where(
-                    BankCheck.type == payment_type
-                )
-            else:
-                query = query.join(Payment.method).where(
-                    PaymentMethod.name == payment_type
-                )
-        if start_date is not None:
-            query = query.where(Payment.date >= start_date)
-
-        if end_date is not None:
-            query = query.where(Payment.date <= end_date)
-
-        query = query.order_by(Payment.date.desc()).offset(skip).limit(limit)
+        query = _payment_filters(
+            query, client_id, invoice_id, payment_type, start_date, end_date
+        )
+        if after is not None:
+            query = query.where(after_cursor([Payment.date, Payment.id], after))
+
+        query = (
+            query.order_by(Payment.date.desc(), Payment.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
         result = await self.db.execute(query)
         return result.scalars().all()
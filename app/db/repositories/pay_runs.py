@@ -0,0 +1,177 @@
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import false, func, insert, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models.pay_runs import PayRun, PayRunLine
+from app.models.work_order_tasks import WorkOrderTask
+from app.models.work_orders import WorkOrder
+
+
+def _unpaid_filters(
+    area_id: int | None = None,
+    status_id: int | None = None,
+    user_id: int | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> list:
+    """Tareas impagas y sin liquidación que cumplen los filtros."""
+    conditions = [WorkOrderTask.paid == false(), WorkOrderTask.pay_run_id.is_(None)]
+    if area_id is not None:
+        conditions.append(WorkOrderTask.area_id == area_id)
+    if status_id is not None:
+        conditions.append(
+            WorkOrderTask.work_order_id.in_(
+                select(WorkOrder.id).where(WorkOrder.status_id == status_id)
+            )
+        )
+    if user_id is not None:
+        conditions.append(WorkOrderTask.user_id == user_id)
+    if start_date is not None:
+        conditions.append(
+            WorkOrderTask.created_at >= datetime.combine(start_date, time.min)
+        )
+    if end_date is not None:
+        conditions.append(
+            WorkOrderTask.created_at
+            < datetime.combine(end_date + timedelta(days=1), time.min)
+        )
+    return conditions
+
+
+def _lines_query(conditions):
+    """Cantidad y total de tareas por mecánico y área, agrupados en la base."""
+    return (
+        select(
+            WorkOrderTask.user_id,
+            WorkOrderTask.area_id,
+            func.count().label("task_count"),
+            func.sum(WorkOrderTask.price).label("total"),
+        )
+        .where(*conditions)
+        .group_by(WorkOrderTask.user_id, WorkOrderTask.area_id)
+        .order_by(WorkOrderTask.user_id, WorkOrderTask.area_id)
+    )
+
+
+class PayRunsRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def preview(self, **filters) -> list[dict]:
+        result = await self.db.execute(_lines_query(_unpaid_filters(**filters)))
+        return [dict(row) for row in result.mappings().all()]
+
+    async def create(self, **filters) -> PayRun | None:
+        """Reserva las tareas impagas que cumplen los filtros en una liquidación.
+
+        Un único ``UPDATE`` asigna ``pay_run_id`` sólo a tareas todavía sin
+        liquidación, así dos liquidaciones simultáneas no toman la misma tarea.
+        Las líneas y totales se calculan en la base y quedan guardados.
+        Devuelve ``None`` si no hay tareas para liquidar.
+        """
+        run = PayRun(
+            area_id=filters.get("area_id"),
+            status_id=filters.get("status_id"),
+            user_id=filters.get("user_id"),
+            period_start=filters.get("start_date"),
+            period_end=filters.get("end_date"),
+        )
+        self.db.add(run)
+        await self.db.flush()
+
+        result = await self.db.execute(
+            update(WorkOrderTask)
+            .where(*_unpaid_filters(**filters))
+            .values(pay_run_id=run.id)
+            .execution_options(synchronize_session=False)
+        )
+        if not result.rowcount:
+            await self.db.rollback()
+            return None
+
+        lines = _lines_query([WorkOrderTask.pay_run_id == run.id]).subquery()
+        await self.db.execute(
+            insert(PayRunLine).from_select(
+                ["pay_run_id", "user_id", "area_id", "task_count", "total"],
+                select(
+                    literal(run.id),
+                    lines.c.user_id,
+                    lines.c.area_id,
+                    lines.c.task_count,
+                    lines.c.total,
+                ),
+            )
+        )
+        totals = await self.db.execute(
+            select(func.sum(PayRunLine.task_count), func.sum(PayRunLine.total)).where(
+                PayRunLine.pay_run_id == run.id
+            )
+        )
+        run.task_count, run.total = totals.one()
+        await self.db.commit()
+        return await self.get(run.id)
+
+    async def get(self, pay_run_id: int) -> PayRun | None:
+        result = await self.db.execute(
+            select(PayRun)
+            .options(selectinload(PayRun.lines))
+            .where(PayRun.id == pay_run_id)
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    async def list(self, skip: int = 0, limit: int = 100) -> list[PayRun]:
+        result = await self.db.execute(
+            select(PayRun)
+            .options(selectinload(PayRun.lines))
+            .order_by(PayRun.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
+        return result.scalars().all()
+
+    async def _lock(self, pay_run_id: int) -> PayRun | None:
+        result = await self.db.execute(
+            select(PayRun)
+            .where(PayRun.id == pay_run_id)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
+    async def pay(self, pay_run_id: int) -> PayRun | None:
+        """Marca pagadas todas las tareas de la liquidación en la misma transacción.
+
+        Devuelve ``None`` si no existe o ya estaba pagada.
+        """
+        run = await self._lock(pay_run_id)
+        if run is None or run.paid_at is not None:
+            await self.db.rollback()
+            return None
+        await self.db.execute(
+            update(WorkOrderTask)
+            .where(WorkOrderTask.pay_run_id == pay_run_id)
+            .values(paid=True)
+            .execution_options(synchronize_session=False)
+        )
+        run.paid_at = datetime.utcnow()
+        await self.db.commit()
+        return await self.get(pay_run_id)
+
+    async def cancel(self, pay_run_id: int) -> bool:
+        """Libera las tareas de una liquidación impaga y la elimina."""
+        run = await self._lock(pay_run_id)
+        if run is None or run.paid_at is not None:
+            await self.db.rollback()
+            return False
+        await self.db.execute(
+            update(WorkOrderTask)
+            .where(WorkOrderTask.pay_run_id == pay_run_id)
+            .values(pay_run_id=None)
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.delete(await self.get(pay_run_id))
+        await self.db.commit()
+        return True
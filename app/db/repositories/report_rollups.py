@@ -0,0 +1,362 @@
+import logging
+from collections import defaultdict
+from datetime import date
+from decimal import Decimal
+
+from sqlalchemy import Date, cast, delete, event, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.base import instance_state
+
+from app.core.database import dialect_insert
+from app.core.jobs import job_queue
+from app.models.clients import Client
+from app.models.expense import Expense
+from app.models.invoices import Invoice, Payment
+from app.models.reports import ClientReportRollup, MonthlyReportRollup
+
+
+def month_of(value) -> date | None:
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = date.fromisoformat(value[:10])
+    return date(value.year, value.month, 1)
+
+
+def _money(value) -> Decimal:
+    return Decimal(str(value or 0))
+
+
+def _upsert(dialect_name: str, model, key: dict, deltas: dict):
+    """INSERT ... ON CONFLICT que suma ``deltas`` a la fila identificada por ``key``."""
+    stmt = dialect_insert(dialect_name, model).values(**key, **deltas)
+    return stmt.on_conflict_do_update(
+        index_elements=list(key),
+        set_={name: getattr(model, name) + stmt.excluded[name] for name in deltas},
+    )
+
+
+class RollupDeltas:
+    """Variaciones pendientes de aplicar sobre las tablas de resumen."""
+
+    def __init__(self):
+        self.monthly = defaultdict(lambda: defaultdict(int))
+        self.clients = defaultdict(lambda: defaultdict(int))
+
+    def __bool__(self) -> bool:
+        return bool(self.monthly or self.clients)
+
+    def add_monthly(self, month: date | None, **values) -> None:
+        if month is None:
+            return
+        for name, value in values.items():
+            self.monthly[month][name] += value
+
+    def add_client(self, client_id: int | None, **values) -> None:
+        if client_id is None:
+            return
+        for name, value in values.items():
+            self.clients[client_id][name] += value
+
+    def add_invoice(self, issued_at, client_id, total, paid, sign: int = 1) -> None:
+        self.add_monthly(
+            month_of(issued_at), invoice_count=sign, income=sign * _money(total)
+        )
+        self.add_client(
+            client_id,
+            invoice_count=sign,
+            total_billed=sign * _money(total),
+            total_paid=sign * _money(paid),
+        )
+
+    def add_invoice_paid(self, client_id: int, amount) -> None:
+        self.add_client(client_id, total_paid=_money(amount))
+
+    def add_payment(self, paid_at, amount, sign: int = 1) -> None:
+        self.add_monthly(
+            month_of(paid_at), payment_count=sign, payments=sign * _money(amount)
+        )
+
+    def add_expense(self, spent_at, amount, sign: int = 1) -> None:
+        self.add_monthly(
+            month_of(spent_at), expense_count=sign, expense=sign * _money(amount)
+        )
+
+    def statements(self, dialect_name: str) -> list:
+        stmts = []
+        for month, values in self.monthly.items():
+            if any(values.values()):
+                stmts.append(
+                    _upsert(dialect_name, MonthlyReportRollup, {"month": month}, values)
+                )
+        for client_id, values in self.clients.items():
+            if any(values.values()):
+                stmts.append(
+                    _upsert(
+                        dialect_name,
+                        ClientReportRollup,
+                        {"client_id": client_id},
+                        values,
+                    )
+                )
+        return stmts
+
+
+# ─────────────────────────────────────────────────────────────
+# Mantenimiento incremental a partir del unit of work del ORM
+# ─────────────────────────────────────────────────────────────
+_INVOICE_FIELDS = ("issued_at", "client_id", "total", "paid")
+_PAYMENT_FIELDS = ("date", "amount")
+_EXPENSE_FIELDS = ("date", "amount")
+
+
+_TRACKED = (
+    (Invoice, _INVOICE_FIELDS),
+    (Payment, _PAYMENT_FIELDS),
+    (Expense, _EXPENSE_FIELDS),
+)
+REBUILD_JOB = "rebuild_report_rollups"
+
+
+def _previous(obj, fields):
+    """Valores previos al flush de ``fields``; ``None`` si no se conocen.
+
+    Los campos seguidos tienen historial activo (ver
+    ``register_rollup_listeners``): al asignarlos se carga el valor anterior,
+    así que ``None`` solo aparece si algo los modificó por fuera del ORM.
+    """
+    state = instance_state(obj)
+    values = []
+    for name in fields:
+        history = state.attrs[name].history
+        if history.deleted:
+            values.append(history.deleted[0])
+        elif history.unchanged:
+            values.append(history.unchanged[0])
+        elif history.added:
+            logging.warning(
+                "Valor previo de %s.%s desconocido: se recalculan los resúmenes",
+                type(obj).__name__,
+                name,
+            )
+            return None
+        else:
+            values.append(getattr(obj, name))
+    return tuple(values)
+
+
+def _current(obj, fields):
+    return tuple(getattr(obj, name) for name in fields)
+
+
+def _track(deltas: RollupDeltas, obj, values, sign: int) -> None:
+    if isinstance(obj, Invoice):
+        issued_at, client_id, total, paid = values
+        deltas.add_invoice(issued_at, client_id, total, paid, sign=sign)
+    elif isinstance(obj, Payment):
+        deltas.add_payment(*values, sign=sign)
+    elif isinstance(obj, Expense):
+        deltas.add_expense(*values, sign=sign)
+
+
+def _fields_for(obj):
+    for model, fields in _TRACKED:
+        if isinstance(obj, model):
+            return fields
+    return None
+
+
+def _load_deleted_fields(session: Session, flush_context, instances) -> None:
+    # después del DELETE la fila ya no existe: se cargan antes para restarlos
+    for obj in session.deleted:
+        fields = _fields_for(obj)
+        if fields:
+            _current(obj, fields)
+
+
+def _keep_previous_value(target, value, oldvalue, initiator) -> None:
+    """Sin efecto: registrarlo con ``active_history`` carga el valor anterior."""
+
+
+def _apply_rollup_deltas(session: Session, flush_context) -> None:
+    deltas = RollupDeltas()
+    for obj in session.new:
+        fields = _fields_for(obj)
+        if fields:
+            _track(deltas, obj, _current(obj, fields), 1)
+    for obj in session.deleted:
+        fields = _fields_for(obj)
+        if fields:
+            previous = _previous(obj, fields)
+            if previous is None:
+                session.info["rollups_stale"] = True
+            else:
+                _track(deltas, obj, previous, -1)
+    for obj in session.dirty:
+        fields = _fields_for(obj)
+        if not fields or not session.is_modified(obj):
+            continue
+        previous = _previous(obj, fields)
+        current = _current(obj, fields)
+        if previous is None:
+            session.info["rollups_stale"] = True
+            continue
+        if previous == current:
+            continue
+        _track(deltas, obj, previous, -1)
+        _track(deltas, obj, current, 1)
+
+    if deltas:
+        connection = session.connection()
+        for stmt in deltas.statements(connection.dialect.name):
+            connection.execute(stmt)
+
+
+def _schedule_rebuild(session: Session) -> None:
+    """Encola un recálculo completo si un flush no pudo calcular sus deltas."""
+    if not session.info.pop("rollups_stale", False):
+        return
+    try:
+        job_queue.schedule(REBUILD_JOB)
+    except (RuntimeError, ValueError):
+        logging.warning("Resúmenes desactualizados: ejecutar /reports/rollups/rebuild")
+
+
+def register_rollup_listeners() -> None:
+    """Mantiene los resúmenes al día con cada flush de facturas, pagos y gastos."""
+    for model, fields in _TRACKED:
+        for name in fields:
+            attribute = getattr(model, name)
+            if not event.contains(attribute, "set", _keep_previous_value):
+                event.listen(
+                    attribute, "set", _keep_previous_value, active_history=True
+                )
+    if not event.contains(Session, "before_flush", _load_deleted_fields):
+        event.listen(Session, "before_flush", _load_deleted_fields)
+    if not event.contains(Session, "after_flush", _apply_rollup_deltas):
+        event.listen(Session, "after_flush", _apply_rollup_deltas)
+    if not event.contains(Session, "after_commit", _schedule_rebuild):
+        event.listen(Session, "after_commit", _schedule_rebuild)
+
+
+class ReportRollupsRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def apply(self, deltas: RollupDeltas) -> None:
+        """Aplica deltas calculados fuera del ORM (updates/inserts masivos)."""
+        connection = await self.db.connection()
+        for stmt in deltas.statements(connection.dialect.name):
+            await self.db.execute(stmt)
+
+    async def refresh_client_paid(self, client_ids) -> None:
+        """Recalcula ``total_paid`` de esos clientes desde las facturas."""
+        paid = (
+            select(func.coalesce(func.sum(func.coalesce(Invoice.paid, 0)), 0))
+            .where(Invoice.client_id == ClientReportRollup.client_id)
+            .scalar_subquery()
+        )
+        await self.db.execute(
+            update(ClientReportRollup)
+            .where(ClientReportRollup.client_id.in_(list(client_ids)))
+            .values(total_paid=paid)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def monthly(self) -> list[MonthlyReportRollup]:
+        result = await self.db.execute(
+            select(MonthlyReportRollup).order_by(MonthlyReportRollup.month.desc())
+        )
+        return result.scalars().all()
+
+    async def totals(self) -> dict:
+        result = await self.db.execute(
+            select(
+                func.coalesce(func.sum(MonthlyReportRollup.income), 0).label("income"),
+                func.coalesce(func.sum(MonthlyReportRollup.payments), 0).label(
+                    "payments"
+                ),
+                func.coalesce(func.sum(MonthlyReportRollup.expense), 0).label(
+                    "expense"
+                ),
+            )
+        )
+        return dict(result.mappings().one())
+
+    async def billing_by_client(self) -> list[dict]:
+        result = await self.db.execute(
+            select(
+                Client.id.label("client_id"),
+                Client.name.label("client_name"),
+                ClientReportRollup.total_billed,
+                ClientReportRollup.total_paid,
+            )
+            .join(Client, Client.id == ClientReportRollup.client_id)
+            .where(ClientReportRollup.invoice_count > 0)
+            .order_by(ClientReportRollup.total_billed.desc())
+        )
+        return [dict(row) for row in result.mappings().all()]
+
+    async def top_clients(self, limit: int = 5) -> list[dict]:
+        total_billed = func.sum(ClientReportRollup.total_billed).label("total_billed")
+        result = await self.db.execute(
+            select(Client.name.label("client_name"), total_billed)
+            .join(Client, Client.id == ClientReportRollup.client_id)
+            .where(ClientReportRollup.invoice_count > 0)
+            .group_by(Client.name)
+            .order_by(total_billed.desc())
+            .limit(limit)
+        )
+        return [dict(row) for row in result.mappings().all()]
+
+    async def rebuild(self) -> None:
+        """Recalcula ambos resúmenes desde cero a partir de las tablas base."""
+        connection = await self.db.connection()
+        dialect_name = connection.dialect.name
+
+        def month_expr(column):
+            if dialect_name == "sqlite":
+                return func.date(column, "start of month")
+            return cast(func.date_trunc("month", column), Date)
+
+        await self.db.execute(delete(MonthlyReportRollup))
+        await self.db.execute(delete(ClientReportRollup))
+
+        deltas = RollupDeltas()
+        aggregates = (
+            (Invoice.issued_at, Invoice.total, "invoice_count", "income"),
+            (Payment.date, Payment.amount, "payment_count", "payments"),
+            (Expense.date, Expense.amount, "expense_count", "expense"),
+        )
+        for date_column, amount_column, count_name, amount_name in aggregates:
+            month = month_expr(date_column).label("month")
+            result = await self.db.execute(
+                select(month, func.count(), func.sum(amount_column))
+                .where(date_column.isnot(None))
+                .group_by(month)
+            )
+            for row_month, count, amount in result.all():
+                deltas.add_monthly(
+                    month_of(row_month),
+                    **{count_name: count, amount_name: _money(amount)},
+                )
+
+        result = await self.db.execute(
+            select(
+                Invoice.client_id,
+                func.count(),
+                func.sum(Invoice.total),
+                func.sum(func.coalesce(Invoice.paid, 0)),
+            ).group_by(Invoice.client_id)
+        )
+        for client_id, count, billed, paid in result.all():
+            deltas.add_client(
+                client_id,
+                invoice_count=count,
+                total_billed=_money(billed),
+                total_paid=_money(paid),
+            )
+
+        await self.apply(deltas)
+        await self.db.commit()
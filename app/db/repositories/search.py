@@ -0,0 +1,76 @@
+from sqlalchemy import Float, case, func, literal, or_, select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.clients import Client
+from app.models.trucks import Truck
+
+
+def _column_score(column, term: str, fuzzy: bool):
+    """Coincidencia exacta > prefijo > contiene; en PostgreSQL suma similitud."""
+    value = func.coalesce(column, "")
+    score = case(
+        (func.lower(value) == term.lower(), 3.0),
+        (value.istartswith(term, autoescape=True), 2.0),
+        (value.icontains(term, autoescape=True), 1.0),
+        else_=0.0,
+    )
+    if fuzzy:
+        score = score + func.similarity(value, term)
+    return score
+
+
+def _score(columns, term: str, fuzzy: bool):
+    scores = [_column_score(column, term, fuzzy) for column in columns]
+    # greatest() en PostgreSQL; max() con varios argumentos en SQLite
+    best = func.greatest(*scores) if fuzzy else func.max(*scores)
+    return best.cast(Float)
+
+
+def _match(columns, term: str, fuzzy: bool):
+    """``ILIKE '%term%'`` y, con pg_trgm, ``%`` (similitud): ambos usan GIN."""
+    conditions = [column.icontains(term, autoescape=True) for column in columns]
+    if fuzzy:
+        conditions += [column.op("%")(term) for column in columns]
+    return or_(*conditions)
+
+
+class SearchRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def search(self, term: str, limit: int = 10) -> list[dict]:
+        """Clientes y camiones que coinciden con ``term``, mejor puntaje primero."""
+        connection = await self.db.connection()
+        fuzzy = connection.dialect.name == "postgresql"
+
+        client_columns = (Client.name, Client.document_number, Client.phone)
+        truck_columns = (Truck.license_plate, Truck.brand, Truck.model)
+        clients = select(
+            literal("client").label("type"),
+            Client.id.label("id"),
+            Client.name.label("label"),
+            Client.document_number.label("detail"),
+            Client.id.label("client_id"),
+            _score(client_columns, term, fuzzy).label("score"),
+        ).where(_match(client_columns, term, fuzzy))
+        trucks = select(
+            literal("truck").label("type"),
+            Truck.id.label("id"),
+            Truck.license_plate.label("label"),
+            func.trim(
+                func.coalesce(Truck.brand, "") + " " + func.coalesce(Truck.model, "")
+            ).label("detail"),
+            Truck.client_id.label("client_id"),
+            _score(truck_columns, term, fuzzy).label("score"),
+        ).where(_match(truck_columns, term, fuzzy))
+
+        results = union_all(clients, trucks).subquery()
+        query = (
+            select(results)
+            .order_by(
+                results.c.score.desc(), results.c.label, results.c.type, results.c.id
+            )
+            .limit(limit)
+        )
+        result = await self.db.execute(query)
+        return [dict(row) for row in result.mappings().all()]
@@ -0,0 +1,34 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.models.users import UserTokenRevocation
+
+# Versión para usuarios borrados: ningún token emitido la alcanza
+REVOKED_FOREVER = 2**31 - 1
+
+
+class TokenRevocationsRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_version(self, user_id: int) -> int:
+        revocation = await self.db.get(UserTokenRevocation, user_id)
+        return revocation.token_version if revocation else 0
+
+    async def revoke(self, user_id: int, forever: bool = False) -> int:
+        """Invalida los tokens emitidos hasta ahora. No hace commit."""
+        revocation = await self.db.get(UserTokenRevocation, user_id)
+        if revocation is None:
+            revocation = UserTokenRevocation(user_id=user_id, token_version=0)
+            self.db.add(revocation)
+        if forever:
+            revocation.token_version = REVOKED_FOREVER
+        elif revocation.token_version < REVOKED_FOREVER:
+            revocation.token_version += 1
+        return revocation.token_version
+
+    async def versions(self) -> dict[int, int]:
+        result = await self.db.execute(
+            select(UserTokenRevocation.user_id, UserTokenRevocation.token_version)
+        )
+        return dict(result.all())
@@ -43,6 +43,8 @@ class TrucksRepository:
         license_plate: str = None,
         brand: str = None,
         model: str = None,
+        skip: int = 0,
+        limit: int = 100,
     ):
         filters = []
 
@@ -57,7 +59,13 @@ class TrucksRepository:
         if model is not None:
             filters.append(Truck.model == model)
 
-        query = select(Truck).options(selectinload(Truck.client))
+        query = (
+            select(Truck)
+            .options(selectinload(Truck.client))
+            .order_by(Truck.id)
+            .offset(skip)
+            .limit(limit)
+        )
         if filters:
             query = query.where(and_(*filters))
 
@@ -2,8 +2,12 @@ from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
+from sqlalchemy.orm import joinedload
 
-from app.core.security import hash_password
+from app.core.cache import invalidate_user
+from app.core.revocations import token_revocations
+from app.core.security import hash_password_async
+from app.db.repositories.token_revocations import TokenRevocationsRepository
 from app.models.users import User
 from app.schemas.users import UserCreate
 
@@ -11,13 +15,20 @@ from app.schemas.users import UserCreate
 class UsersRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.revocations = TokenRevocationsRepository(db)
+
+    async def _forget(self, user_id: int, token_version: int | None = None) -> None:
+        """Descarta la copia cacheada y, si cambió, la versión de token vigente."""
+        await invalidate_user(user_id)
+        if token_version is not None:
+            token_revocations.record(user_id, token_version)
 
     async def get_by_email(self, email: str) -> User | None:
         result = await self.db.execute(select(User).where(User.email == email))
         return result.scalar_one_or_none()
 
     async def create(self, user_in: UserCreate) -> User:
-        hashed_pw = hash_password(user_in.password)
+        hashed_pw = await hash_password_async(user_in.password)
         db_user = User(
             name=user_in.name,
             email=user_in.email,
@@ -33,6 +44,12 @@ class UsersRepository:
         result = await self.db.execute(select(User).where(User.id == user_id))
         return result.scalar_one_or_none()
 
+    async def get_with_role(self, user_id: int) -> User | None:
+        result = await self.db.execute(
+            select(User).options(joinedload(User.role)).where(User.id == user_id)
+        )
+        return result.scalar_one_or_none()
+
     async def list(self, role_id: Optional[int] = None) -> list[User]:
         stmt = select(User)
         if role_id is not None:
@@ -46,17 +63,23 @@ class UsersRepository:
         if not user:
             raise ValueError("User not found")
 
+        # cambiar rol o contraseña invalida los tokens ya emitidos
+        revoke = bool(user_in.password) or (
+            user_in.role_id is not None and user_in.role_id != user.role_id
+        )
         if user_in.name:
             user.name = user_in.name
         if user_in.email:
             user.email = user_in.email
         if user_in.password:
-            user.password = hash_password(user_in.password)
+            user.password = await hash_password_async(user_in.password)
         if user_in.role_id is not None:
             user.role_id = user_in.role_id
 
         self.db.add(user)
+        version = await self.revocations.revoke(user_id) if revoke else None
         await self.db.commit()
+        await self._forget(user_id, version)
         await self.db.refresh(user)
         return user
 
@@ -65,15 +88,19 @@ class UsersRepository:
         if not user:
             raise ValueError("User not found")
         await self.db.delete(user)
+        version = await self.revocations.revoke(user_id, forever=True)
         await self.db.commit()
+        await self._forget(user_id, version)
 
     async def update_password(self, user_id: int, new_password: str) -> User:
         user = await self.get_by_id(user_id)
         if not user:
             raise ValueError("User not found")
 
-        user.password = hash_password(new_password)
+        user.password = await hash_password_async(new_password)
         self.db.add(user)
+        version = await self.revocations.revoke(user_id)
         await self.db.commit()
+        await self._forget(user_id, version)
         await self.db.refresh(user)
         return user
@@ -1,11 +1,76 @@
+from collections import defaultdict
+
+from sqlalchemy import case, event, func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.base import instance_state
 
-from app.models.work_order_parts import WorkOrderPart
+from app.core.database import dialect_insert
+from app.models.work_order_parts import PartCatalog, WorkOrderPart
 from app.schemas.work_order_parts import WorkOrderPartCreate
 
 
+# ─────────────────────────────────────────────────────────────
+# Catálogo de repuestos mantenido a partir del unit of work del ORM
+# ─────────────────────────────────────────────────────────────
+def _catalog_changes(session: Session) -> dict:
+    """nombre -> [variación de usos, último precio (o ``None``)] del flush."""
+    changes = defaultdict(lambda: [0, None])
+
+    def use(name, sign, price=None):
+        if name is None:
+            return
+        changes[name][0] += sign
+        if price is not None:
+            changes[name][1] = price
+
+    for obj in session.new:
+        if isinstance(obj, WorkOrderPart):
+            use(obj.name, 1, obj.unit_price)
+    for obj in session.deleted:
+        if isinstance(obj, WorkOrderPart):
+            history = instance_state(obj).attrs.name.history
+            use((history.deleted or [obj.name])[0], -1)
+    for obj in session.dirty:
+        if not isinstance(obj, WorkOrderPart) or not session.is_modified(obj):
+            continue
+        history = instance_state(obj).attrs.name.history
+        if history.deleted:
+            use(history.deleted[0], -1)
+            use(obj.name, 1, obj.unit_price)
+        elif instance_state(obj).attrs.unit_price.history.added:
+            use(obj.name, 0, obj.unit_price)
+    return changes
+
+
+def _update_part_catalog(session: Session, flush_context) -> None:
+    changes = _catalog_changes(session)
+    if not changes:
+        return
+    connection = session.connection()
+    for name, (uses, price) in changes.items():
+        stmt = dialect_insert(connection.dialect.name, PartCatalog).values(
+            name=name, uses=uses, last_unit_price=price
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["name"],
+            set_={
+                "uses": PartCatalog.uses + stmt.excluded.uses,
+                "last_unit_price": func.coalesce(
+                    stmt.excluded.last_unit_price, PartCatalog.last_unit_price
+                ),
+            },
+        )
+        connection.execute(stmt)
+
+
+def register_part_catalog_listeners() -> None:
+    """Mantiene ``part_catalog`` al día con cada flush de repuestos."""
+    if not event.contains(Session, "after_flush", _update_part_catalog):
+        event.listen(Session, "after_flush", _update_part_catalog)
+
+
 class WorkOrderPartsRepository:
     def __init__(self, db: AsyncSession):
         self.db = db
@@ -53,5 +118,32 @@ class WorkOrderPartsRepository:
         return await self.get(part.id)
 
     async def list_names(self) -> list[str]:
-        result = await self.db.execute(select(WorkOrderPart.name))
-        return [row[0] for row in result.fetchall()]
+        result = await self.db.execute(
+            select(PartCatalog.name)
+            .where(PartCatalog.uses > 0)
+            .order_by(PartCatalog.name)
+        )
+        return result.scalars().all()
+
+    async def catalog(self, term: str | None = None, limit: int = 20) -> list[dict]:
+        """Repuestos del catálogo con cantidad de usos y último precio unitario.
+
+        Lee ``part_catalog`` (una fila por nombre), no el historial de
+        repuestos. Con ``term`` filtra por ``ILIKE '%term%'`` (índice GIN de
+        trigramas) y ordena primero los que empiezan con el término; luego los
+        más usados.
+        """
+        query = select(
+            PartCatalog.name, PartCatalog.uses, PartCatalog.last_unit_price
+        ).where(PartCatalog.uses > 0)
+        order = []
+        if term:
+            query = query.where(PartCatalog.name.icontains(term, autoescape=True))
+            order.append(
+                case((PartCatalog.name.istartswith(term, autoescape=True), 0), else_=1)
+            )
+        query = query.order_by(*order, PartCatalog.uses.desc(), PartCatalog.name).limit(
+            limit
+        )
+        result = await self.db.execute(query)
+        return [dict(row) for row in result.mappings().all()]
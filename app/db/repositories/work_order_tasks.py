@@ -1,7 +1,9 @@
+from sqlalchemy import func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.models.work_order_tasks import WorkOrderTask
+from app.models.work_orders import WorkOrder
 from app.schemas.work_order_tasks import WorkOrderTaskCreate
 
 
@@ -47,17 +49,57 @@ class WorkOrderTasksRepository:
         return True
 
     async def bulk_update_paid(
-        self, task_ids: list[int], paid: bool
+        self,
+        task_ids: list[int],
+        paid: bool,
+        area_id: int | None = None,
+        status_id: int | None = None,
     ) -> list[WorkOrderTask] | None:
+        """Marca ``paid`` en todas las tareas con un único ``UPDATE ... RETURNING``.
+
+        ``area_id`` y ``status_id`` (estado de la orden) restringen qué tareas
+        se actualizan; las que no cumplen el filtro se dejan como están. Las
+        tareas incluidas en una liquidación nunca se tocan: las paga la
+        liquidación. Si algún id no existe no se modifica nada y devuelve
+        ``None``.
+        """
+        ids = set(task_ids)
+        conditions = [WorkOrderTask.id.in_(ids), WorkOrderTask.pay_run_id.is_(None)]
+        if area_id is not None:
+            conditions.append(WorkOrderTask.area_id == area_id)
+        if status_id is not None:
+            conditions.append(
+                WorkOrderTask.work_order_id.in_(
+                    select(WorkOrder.id).where(WorkOrder.status_id == status_id)
+                )
+            )
         result = await self.db.execute(
-            select(WorkOrderTask).where(WorkOrderTask.id.in_(task_ids))
+            update(WorkOrderTask)
+            .where(*conditions)
+            .values(paid=paid)
+            .returning(WorkOrderTask)
+            .execution_options(populate_existing=True)
         )
         tasks = result.scalars().all()
-        if len(tasks) != len(task_ids):
+        if len(tasks) != len(ids) and await self._count(ids) != len(ids):
+            await self.db.rollback()
             return None
-        for task in tasks:
-            task.paid = paid
         await self.db.commit()
-        for task in tasks:
-            await self.db.refresh(task)
-        return tasks
+        return sorted(tasks, key=lambda task: task.id)
+
+    async def reserved_ids(self, task_ids) -> list[int]:
+        """Ids de ``task_ids`` que ya están en una liquidación."""
+        result = await self.db.execute(
+            select(WorkOrderTask.id)
+            .where(
+                WorkOrderTask.id.in_(task_ids), WorkOrderTask.pay_run_id.is_not(None)
+            )
+            .order_by(WorkOrderTask.id)
+        )
+        return result.scalars().all()
+
+    async def _count(self, task_ids) -> int:
+        result = await self.db.execute(
+            select(func.count()).where(WorkOrderTask.id.in_(task_ids))
+        )
+        return result.scalar_one()
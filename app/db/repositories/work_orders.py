@@ -1,11 +1,96 @@
 from datetime import datetime
+from decimal import Decimal
 
+import sqlalchemy as sa
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import selectinload
 
+from app.core.pagination import after_cursor
+from app.models.clients import Client
+from app.models.invoices import Invoice
 from app.models.trucks import Truck
-from app.models.work_orders import WorkOrder
+from app.models.users import User
+from app.models.work_order_parts import WorkOrderPart
+from app.models.work_order_tasks import WorkOrderTask
+from app.models.work_orders import WorkOrder, WorkOrderStatus
+
+MONEY = sa.Numeric(14, 2)
+
+
+def _scalar(query, type_=None):
+    """Subconsulta escalar correlacionada con la orden de la fila externa."""
+    value = query.correlate(WorkOrder).scalar_subquery()
+    return sa.type_coerce(value, type_) if type_ is not None else value
+
+
+def order_totals() -> dict:
+    """Cantidad y total de repuestos y tareas de cada orden seleccionada.
+
+    Son subconsultas escalares correlacionadas por ``work_order_id`` (usan
+    los índices de repuestos y tareas), así el costo crece con las órdenes
+    de la página y no con todo el historial. El total de cada repuesto
+    aplica el incremento porcentual por unidad:
+    ``unit_price * quantity * (1 + increment_per_unit / 100)``.
+    """
+    part_total = (
+        WorkOrderPart.unit_price
+        * WorkOrderPart.quantity
+        * (100 + sa.func.coalesce(WorkOrderPart.increment_per_unit, 0))
+        / sa.literal_column("100.0")
+    )
+    of_order = WorkOrderPart.work_order_id == WorkOrder.id
+    task_of_order = WorkOrderTask.work_order_id == WorkOrder.id
+    parts_total = _scalar(
+        select(sa.func.round(sa.func.coalesce(sa.func.sum(part_total), 0), 2)).where(
+            of_order
+        ),
+        MONEY,
+    )
+    labor_total = _scalar(
+        select(sa.func.coalesce(sa.func.sum(WorkOrderTask.price), 0)).where(
+            task_of_order
+        ),
+        MONEY,
+    )
+    return {
+        "part_count": _scalar(select(sa.func.count()).where(of_order)).label(
+            "part_count"
+        ),
+        "task_count": _scalar(select(sa.func.count()).where(task_of_order)).label(
+            "task_count"
+        ),
+        "parts_total": parts_total.label("parts_total"),
+        "labor_total": labor_total.label("labor_total"),
+        "total": sa.type_coerce(parts_total + labor_total, MONEY).label("total"),
+    }
+
+
+TOTAL_FIELDS = ("parts_total", "labor_total", "total")
+
+
+def _with_totals(rows) -> list[WorkOrder]:
+    """Adjunta a cada orden los totales calculados en la misma consulta."""
+    orders = []
+    for order, *values in rows:
+        for name, value in zip(TOTAL_FIELDS, values):
+            setattr(order, name, value)
+        orders.append(order)
+    return orders
+
+
+def _total_filters(query, totals, min_total=None, max_total=None):
+    if min_total is not None:
+        query = query.where(totals["total"] >= min_total)
+    if max_total is not None:
+        query = query.where(totals["total"] <= max_total)
+    return query
+
+
+def _sort_columns(totals, sort_by_total: bool) -> list:
+    if sort_by_total:
+        return [totals["total"], WorkOrder.id]
+    return [WorkOrder.id]
 
 
 class WorkOrdersRepository:
@@ -20,8 +105,9 @@ class WorkOrdersRepository:
         return await self.get(work_order.id)
 
     async def get(self, work_order_id: int) -> WorkOrder | None:
+        totals = order_totals()
         result = await self.db.execute(
-            select(WorkOrder)
+            select(WorkOrder, *(totals[name] for name in TOTAL_FIELDS))
             .options(
                 selectinload(WorkOrder.status),
                 selectinload(WorkOrder.truck).selectinload(Truck.client),
@@ -32,7 +118,111 @@ class WorkOrdersRepository:
             )
             .where(WorkOrder.id == work_order_id)
         )
-        return result.scalar_one_or_none()
+        orders = _with_totals(result.all())
+        return orders[0] if orders else None
+
+    async def get_totals(self, work_order_id: int) -> dict | None:
+        totals = order_totals()
+        result = await self.db.execute(
+            select(*(totals[name] for name in TOTAL_FIELDS)).where(
+                WorkOrder.id == work_order_id
+            )
+        )
+        row = result.mappings().one_or_none()
+        return dict(row) if row else None
+
+    async def invoiced_ids(self, work_order_ids: list[int]) -> set[int]:
+        """Ids de ``work_order_ids`` que ya tienen factura, en una sola consulta."""
+        if not work_order_ids:
+            return set()
+        result = await self.db.execute(
+            select(Invoice.work_order_id)
+            .where(Invoice.work_order_id.in_(work_order_ids))
+            .distinct()
+        )
+        return set(result.scalars().all())
+
+    def summary_query(
+        self,
+        status_id: int | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        client_id: int | None = None,
+        truck_id: int | None = None,
+        after: str | None = None,
+        min_total: Decimal | None = None,
+        max_total: Decimal | None = None,
+        sort_by_total: bool = False,
+    ):
+        """Consulta plana del listado resumido, sin paginar (también exporta)."""
+        totals = order_totals()
+        sort_columns = _sort_columns(totals, sort_by_total)
+        query = (
+            select(
+                WorkOrder.id,
+                WorkOrder.created_at,
+                Truck.license_plate,
+                Client.name.label("client_name"),
+                WorkOrderStatus.name.label("status_name"),
+                User.name.label("reviewer_name"),
+                totals["task_count"],
+                totals["part_count"],
+                totals["parts_total"],
+                totals["labor_total"],
+                totals["total"],
+                ~sa.exists()
+                .where(Invoice.work_order_id == WorkOrder.id)
+                .label("is_editable"),
+            )
+            .select_from(WorkOrder)
+            .outerjoin(Truck, Truck.id == WorkOrder.truck_id)
+            .outerjoin(Client, Client.id == Truck.client_id)
+            .outerjoin(WorkOrderStatus, WorkOrderStatus.id == WorkOrder.status_id)
+            .outerjoin(User, User.id == WorkOrder.reviewed_by)
+            .order_by(*(c.desc() for c in sort_columns))
+        )
+        if status_id is not None:
+            query = query.where(WorkOrder.status_id == status_id)
+        if start_date is not None:
+            query = query.where(WorkOrder.created_at >= start_date)
+        if end_date is not None:
+            query = query.where(WorkOrder.created_at <= end_date)
+        if truck_id is not None:
+            query = query.where(WorkOrder.truck_id == truck_id)
+        if client_id is not None:
+            query = query.where(Truck.client_id == client_id)
+        if after is not None:
+            query = query.where(after_cursor(sort_columns, after))
+        return _total_filters(query, totals, min_total, max_total)
+
+    async def list_summary(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        status_id: int | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        client_id: int | None = None,
+        truck_id: int | None = None,
+        after: str | None = None,
+        min_total: Decimal | None = None,
+        max_total: Decimal | None = None,
+        sort_by_total: bool = False,
+    ) -> list[dict]:
+        """Listado plano para tablas: una sola consulta, sin objetos ORM."""
+        query = self.summary_query(
+            status_id=status_id,
+            start_date=start_date,
+            end_date=end_date,
+            client_id=client_id,
+            truck_id=truck_id,
+            after=after,
+            min_total=min_total,
+            max_total=max_total,
+            sort_by_total=sort_by_total,
+        )
+        result = await self.db.execute(query.offset(skip).limit(limit))
+        return [dict(row) for row in result.mappings().all()]
 
     async def list(
         self,
@@ -43,9 +233,15 @@ class WorkOrdersRepository:
         end_date: datetime | None = None,
         client_id: int | None = None,
         truck_id: int | None = None,
+        after: str | None = None,
+        min_total: Decimal | None = None,
+        max_total: Decimal | None = None,
+        sort_by_total: bool = False,
     ) -> list[WorkOrder]:
+        totals = order_totals()
+        sort_columns = _sort_columns(totals, sort_by_total)
         query = (
-            select(WorkOrder)
+            select(WorkOrder, *(totals[name] for name in TOTAL_FIELDS))
             .options(
                 selectinload(WorkOrder.status),
                 selectinload(WorkOrder.truck).selectinload(Truck.client),
@@ -54,7 +250,7 @@ class WorkOrdersRepository:
                 selectinload(WorkOrder.tasks),
                 selectinload(WorkOrder.parts),
             )
-            .order_by(WorkOrder.id.desc())
+            .order_by(*(c.desc() for c in sort_columns))
             .offset(skip)
             .limit(limit)
         )
@@ -68,8 +264,11 @@ class WorkOrdersRepository:
             query = query.where(WorkOrder.truck_id == truck_id)
         if client_id is not None:
             query = query.join(WorkOrder.truck).where(Truck.client_id == client_id)
+        if after is not None:
+            query = query.where(after_cursor(sort_columns, after))
+        query = _total_filters(query, totals, min_total, max_total)
         result = await self.db.execute(query)
-        return result.scalars().all()
+        return _with_totals(result.all())
 
     async def update(self, work_order_id: int, data: dict) -> WorkOrder | bool:
         work_order = await self.get(work_order_id)
@@ -1,16 +1,27 @@
+import logging
+from contextlib import asynccontextmanager
+
 import sentry_sdk
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from app.constants.response_codes import ResponseCode
+from app.core.database import get_session_factory
+from app.core.jobs import job_queue
+from app.core.reference_data import reference_data, register_reference_data_listeners
 from app.core.settings import settings
+from app.db.repositories.report_rollups import register_rollup_listeners
+from app.db.repositories.work_order_parts import register_part_catalog_listeners
 from app.routers import (
     auth_router,
     clients_router,
     expenses_router,
     invoice_router,
+    metrics_router,
+    pay_runs_router,
     reports_router,
+    search_router,
     trucks_router,
     users_router,
     work_order_parts_router,
@@ -32,7 +43,31 @@ def get_application() -> FastAPI:
             send_default_pii=True,
         )
 
+    # Resúmenes de reportes mantenidos en cada flush del ORM
+    register_rollup_listeners()
+    # Catálogo de repuestos (nombres, usos, último precio) en cada flush
+    register_part_catalog_listeners()
+    # Tablas de referencia en memoria: se recargan si este proceso las modifica
+    register_reference_data_listeners()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        # Precarga las tablas de referencia; si la base no responde se cargan
+        # en el primer uso
+        factory = app.dependency_overrides.get(
+            get_session_factory, get_session_factory
+        )()
+        try:
+            await reference_data.preload(factory)
+        except Exception:
+            logging.exception("No se pudieron precargar las tablas de referencia")
+        # Notificaciones y demás efectos secundarios, fuera del request
+        await job_queue.start(factory)
+        yield
+        await job_queue.stop()
+
     app = FastAPI(
+        lifespan=lifespan,
         title="Sistema de Gestión para Taller Mecánico",
         description="API para gestionar órdenes de trabajo, clientes, facturación, pagos y más.",
         version="1.0.0",
@@ -109,10 +144,16 @@ def include_routers(app: FastAPI) -> None:
 
     app.include_router(reports_router, prefix="/reports", tags=["Reportes"])
 
+    app.include_router(pay_runs_router, prefix="/pay-runs", tags=["Liquidaciones"])
+
     app.include_router(trucks_router, prefix="/trucks", tags=["Camiones"])
 
+    app.include_router(search_router, prefix="/search", tags=["Búsqueda"])
+
     app.include_router(expenses_router, tags=["Gastos"])
 
+    app.include_router(metrics_router, prefix="/metrics", tags=["Métricas"])
+
 
 # Inicializa la app
 app = get_application()
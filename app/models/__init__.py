@@ -1,9 +1,12 @@
 from .clients import Client, ClientType
 from .expense import Expense, ExpenseType
 from .invoices import Invoice, InvoiceStatus, InvoiceType, Payment, PaymentMethod
+from .jobs import BackgroundJob
+from .pay_runs import PayRun, PayRunLine
+from .reports import ClientReportRollup, MonthlyReportRollup
 from .trucks import Truck
-from .users import Role, User
-from .work_order_parts import WorkOrderPart
+from .users import Role, User, UserTokenRevocation
+from .work_order_parts import PartCatalog, WorkOrderPart
 from .work_order_tasks import WorkOrderTask
 from .work_orders import WorkOrder, WorkOrderStatus
 from .work_orders_mechanic import WorkArea, WorkOrderMechanic
@@ -27,4 +30,11 @@ __all__ = [
     "PaymentMethod",
     "Truck",
     "Role",
+    "UserTokenRevocation",
+    "MonthlyReportRollup",
+    "ClientReportRollup",
+    "PayRun",
+    "PayRunLine",
+    "BackgroundJob",
+    "PartCatalog",
 ]
@@ -3,7 +3,7 @@ import enum
 from sqlalchemy import Column, DateTime, Enum, Integer, String
 from sqlalchemy.sql import func
 
-from app.core.database import Base
+from app.core.database import Base, trigram_index
 
 
 class ClientType(str, enum.Enum):
@@ -13,6 +13,11 @@ class ClientType(str, enum.Enum):
 
 class Client(Base):
     __tablename__ = "clients"
+    __table_args__ = (
+        trigram_index("clients", "name"),
+        trigram_index("clients", "document_number"),
+        trigram_index("clients", "phone"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     type = Column(Enum(ClientType), nullable=False)
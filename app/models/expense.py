@@ -18,13 +18,14 @@ class Expense(Base):
     __tablename__ = "expenses"
 
     id = Column(Integer, primary_key=True)
-    date = Column(Date, nullable=False)
+    date = Column(Date, nullable=False, index=True)
     amount = Column(Numeric(10, 2), nullable=False)
     description = Column(String(255))
     expense_type_id = Column(
         Integer,
         ForeignKey("expense_types.id", ondelete="SET NULL"),
         nullable=True,
+        index=True,
     )
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
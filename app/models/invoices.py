@@ -26,15 +26,17 @@ class Invoice(Base):
     __tablename__ = "invoices"
 
     id = Column(Integer, primary_key=True)
-    work_order_id = Column(Integer, ForeignKey("work_orders.id"), nullable=False)
-    client_id = Column(Integer, ForeignKey("clients.id"), nullable=False)
-    invoice_type_id = Column(Integer, ForeignKey("invoice_types.id"))
-    status_id = Column(Integer, ForeignKey("invoice_statuses.id"))
+    work_order_id = Column(
+        Integer, ForeignKey("work_orders.id"), nullable=False, index=True
+    )
+    client_id = Column(Integer, ForeignKey("clients.id"), nullable=False, index=True)
+    invoice_type_id = Column(Integer, ForeignKey("invoice_types.id"), index=True)
+    status_id = Column(Integer, ForeignKey("invoice_statuses.id"), index=True)
     labor_total = Column(Numeric(10, 2), nullable=False)
     parts_total = Column(Numeric(10, 2), nullable=False)
     iva = Column(Numeric(10, 2), nullable=False)
     total = Column(Numeric(10, 2), nullable=False)
-    issued_at = Column(DateTime, default=datetime.utcnow)
+    issued_at = Column(DateTime, default=datetime.utcnow, index=True)
     paid = Column(Numeric(10, 2), default=0)
     invoice_number = Column(String(30), nullable=True)
     accepted = Column(Boolean, default=False)
@@ -56,10 +58,10 @@ class Payment(Base):
     __tablename__ = "payments"
 
     id = Column(Integer, primary_key=True)
-    invoice_id = Column(Integer, ForeignKey("invoices.id"))
-    method_id = Column(Integer, ForeignKey("payment_methods.id"))
+    invoice_id = Column(Integer, ForeignKey("invoices.id"), index=True)
+    method_id = Column(Integer, ForeignKey("payment_methods.id"), index=True)
     amount = Column(Numeric(10, 2), nullable=False)
-    date = Column(DateTime, default=datetime.utcnow)
+    date = Column(DateTime, default=datetime.utcnow, index=True)
     reference = Column(String(100), nullable=True)
     notes = Column(String(255), nullable=True)
 
@@ -85,8 +87,8 @@ class BankCheck(Base):
     check_number = Column(String(50), nullable=False)
     amount = Column(Numeric(10, 2), nullable=False)
     issued_at = Column(DateTime, default=datetime.utcnow)
-    due_date = Column(DateTime, nullable=True)
+    due_date = Column(DateTime, nullable=True, index=True)
     exchange_date = Column(DateTime, nullable=True)
     type = Column(SqlEnum(BankCheckType), nullable=False)
-    payment_id = Column(Integer, ForeignKey("payments.id"), nullable=False)
+    payment_id = Column(Integer, ForeignKey("payments.id"), nullable=False, index=True)
     payment = relationship("Payment", back_populates="bank_checks")
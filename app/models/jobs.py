@@ -0,0 +1,25 @@
+from datetime import datetime
+
+from sqlalchemy import JSON, Column, DateTime, Index, Integer, String, Text
+
+from app.core.database import Base
+
+
+class BackgroundJob(Base):
+    """Trabajo en segundo plano persistido (backend ``JOBS_BACKEND=database``)."""
+
+    __tablename__ = "background_jobs"
+    # los workers buscan el próximo pendiente por estado y fecha de ejecución
+    __table_args__ = (Index("ix_background_jobs_status_run_at", "status", "run_at"),)
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(100), nullable=False)
+    payload = Column(JSON, nullable=False, default=dict)
+    status = Column(String(20), nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    run_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    # vencimiento de la toma de un worker; pasado ese momento se vuelve a tomar
+    locked_until = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
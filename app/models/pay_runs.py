@@ -0,0 +1,52 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, Numeric
+from sqlalchemy.orm import relationship
+
+from app.core.database import Base
+
+
+class PayRun(Base):
+    """Liquidación de tareas a mecánicos: filtros usados y totales congelados."""
+
+    __tablename__ = "pay_runs"
+
+    id = Column(Integer, primary_key=True)
+    area_id = Column(Integer, ForeignKey("work_areas.id"), nullable=True, index=True)
+    status_id = Column(
+        Integer, ForeignKey("work_order_statuses.id"), nullable=True, index=True
+    )
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
+    period_start = Column(Date, nullable=True)
+    period_end = Column(Date, nullable=True)
+    task_count = Column(Integer, nullable=False, default=0)
+    total = Column(Numeric(14, 2), nullable=False, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    paid_at = Column(DateTime, nullable=True, index=True)
+
+    lines = relationship(
+        "PayRunLine",
+        back_populates="pay_run",
+        cascade="all, delete-orphan",
+        order_by="PayRunLine.id",
+    )
+
+
+class PayRunLine(Base):
+    """Total de una liquidación por mecánico y área."""
+
+    __tablename__ = "pay_run_lines"
+
+    id = Column(Integer, primary_key=True)
+    pay_run_id = Column(
+        Integer,
+        ForeignKey("pay_runs.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    area_id = Column(Integer, ForeignKey("work_areas.id"), nullable=False)
+    task_count = Column(Integer, nullable=False)
+    total = Column(Numeric(14, 2), nullable=False)
+
+    pay_run = relationship("PayRun", back_populates="lines")
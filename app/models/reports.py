@@ -0,0 +1,30 @@
+from sqlalchemy import Column, Date, ForeignKey, Integer, Numeric
+
+from app.core.database import Base
+
+
+class MonthlyReportRollup(Base):
+    """Totales mensuales de facturación, cobros y gastos."""
+
+    __tablename__ = "report_monthly_rollups"
+
+    month = Column(Date, primary_key=True)  # primer día del mes
+    invoice_count = Column(Integer, nullable=False, default=0)
+    income = Column(Numeric(14, 2), nullable=False, default=0)
+    payment_count = Column(Integer, nullable=False, default=0)
+    payments = Column(Numeric(14, 2), nullable=False, default=0)
+    expense_count = Column(Integer, nullable=False, default=0)
+    expense = Column(Numeric(14, 2), nullable=False, default=0)
+
+
+class ClientReportRollup(Base):
+    """Totales facturados y cobrados por cliente."""
+
+    __tablename__ = "report_client_rollups"
+
+    client_id = Column(
+        Integer, ForeignKey("clients.id", ondelete="CASCADE"), primary_key=True
+    )
+    invoice_count = Column(Integer, nullable=False, default=0)
+    total_billed = Column(Numeric(14, 2), nullable=False, default=0)
+    total_paid = Column(Numeric(14, 2), nullable=False, default=0)
@@ -2,14 +2,19 @@ from sqlalchemy import Column, DateTime, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
-from app.core.database import Base
+from app.core.database import Base, trigram_index
 
 
 class Truck(Base):
     __tablename__ = "trucks"
+    __table_args__ = (
+        trigram_index("trucks", "license_plate"),
+        trigram_index("trucks", "brand"),
+        trigram_index("trucks", "model"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
-    client_id = Column(Integer, ForeignKey("clients.id"), nullable=False)
+    client_id = Column(Integer, ForeignKey("clients.id"), nullable=False, index=True)
     license_plate = Column(String(20), unique=True, nullable=False)
     brand = Column(String(50))
     model = Column(String(50))
@@ -1,4 +1,6 @@
-from sqlalchemy import Boolean, Column, ForeignKey, Integer, String
+from datetime import datetime
+
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
@@ -19,7 +21,21 @@ class User(Base):
     name = Column(String(100), nullable=False)
     email = Column(String(100), unique=True, nullable=False)
     password = Column(String(255), nullable=False)
-    role_id = Column(Integer, ForeignKey("roles.id"))
+    role_id = Column(Integer, ForeignKey("roles.id"), index=True)
     active = Column(Boolean, default=True)
 
     role = relationship("Role")
+
+
+class UserTokenRevocation(Base):
+    """Versión mínima de token aceptada por usuario.
+
+    Solo tiene filas para usuarios con tokens revocados. Sin FK a ``users``
+    para que la revocación sobreviva al borrado del usuario.
+    """
+
+    __tablename__ = "user_token_revocations"
+
+    user_id = Column(Integer, primary_key=True, autoincrement=False)
+    token_version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
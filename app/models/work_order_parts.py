@@ -1,15 +1,18 @@
 from sqlalchemy import Column, ForeignKey, Integer, Numeric, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import column_property, relationship
 
-from app.core.database import Base
+from app.core.database import Base, trigram_index
 
 
 class WorkOrderPart(Base):
     __tablename__ = "work_order_parts"
 
     id = Column(Integer, primary_key=True)
-    work_order_id = Column(Integer, ForeignKey("work_orders.id"), nullable=False)
-    name = Column(Text)
+    work_order_id = Column(
+        Integer, ForeignKey("work_orders.id"), nullable=False, index=True
+    )
+    # valor previo siempre cargado: el catálogo necesita el nombre anterior
+    name = column_property(Column(Text), active_history=True)
     quantity = Column(Integer, nullable=False)
     increment_per_unit = Column(
         Numeric(10, 2), nullable=False, default=1
@@ -20,3 +23,14 @@ class WorkOrderPart(Base):
     subtotal = Column(Numeric(10, 2), nullable=False)
 
     work_order = relationship("WorkOrder", back_populates="parts")
+
+
+class PartCatalog(Base):
+    """Nombres de repuestos usados, mantenido en cada flush de ``WorkOrderPart``."""
+
+    __tablename__ = "part_catalog"
+    __table_args__ = (trigram_index("part_catalog", "name"),)
+
+    name = Column(Text, primary_key=True)
+    uses = Column(Integer, nullable=False, default=0)
+    last_unit_price = Column(Numeric(10, 2), nullable=True)
@@ -10,14 +10,23 @@ class WorkOrderTask(Base):
     __tablename__ = "work_order_tasks"
 
     id = Column(Integer, primary_key=True)
-    work_order_id = Column(Integer, ForeignKey("work_orders.id"), nullable=False)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    work_order_id = Column(
+        Integer, ForeignKey("work_orders.id"), nullable=False, index=True
+    )
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
     description = Column(Text, nullable=False)
-    area_id = Column(Integer, ForeignKey("work_areas.id"), nullable=False)
+    area_id = Column(Integer, ForeignKey("work_areas.id"), nullable=False, index=True)
     price = Column(Numeric(10, 2), nullable=False)
     external = Column(Boolean, default=False)
-    paid = Column(Boolean, default=False)
+    paid = Column(Boolean, default=False, index=True)
     created_at = Column(DateTime, default=datetime.utcnow)
+    # liquidación que reservó la tarea; se marca ``paid`` al pagarla
+    pay_run_id = Column(
+        Integer,
+        ForeignKey("pay_runs.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
 
     work_order = relationship("WorkOrder", back_populates="tasks")
     user = relationship("User")
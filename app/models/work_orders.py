@@ -18,10 +18,10 @@ class WorkOrder(Base):
     __tablename__ = "work_orders"
 
     id = Column(Integer, primary_key=True)
-    truck_id = Column(Integer, ForeignKey("trucks.id"))
-    created_at = Column(DateTime, default=datetime.utcnow)
-    status_id = Column(Integer, ForeignKey("work_order_statuses.id"))
-    reviewed_by = Column(Integer, ForeignKey("users.id"))
+    truck_id = Column(Integer, ForeignKey("trucks.id"), index=True)
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    status_id = Column(Integer, ForeignKey("work_order_statuses.id"), index=True)
+    reviewed_by = Column(Integer, ForeignKey("users.id"), index=True)
     notes = Column(Text)
     fast_phone = Column(Text, nullable=True)
 
@@ -20,9 +20,9 @@ class WorkOrderMechanic(Base):
     __tablename__ = "work_order_mechanics"
 
     id = Column(Integer, primary_key=True)
-    work_order_id = Column(Integer, ForeignKey("work_orders.id"))
-    user_id = Column(Integer, ForeignKey("users.id"))
-    area_id = Column(Integer, ForeignKey("work_areas.id"))
+    work_order_id = Column(Integer, ForeignKey("work_orders.id"), index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True)
+    area_id = Column(Integer, ForeignKey("work_areas.id"), index=True)
     joined_at = Column(DateTime, default=datetime.utcnow)
     notes = Column(Text, nullable=True)
 
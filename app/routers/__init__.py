@@ -2,7 +2,10 @@ from .auth import auth_router
 from .clients import clients_router
 from .expenses import expenses_router
 from .invoices import invoice_router
+from .metrics import metrics_router
+from .pay_runs import pay_runs_router
 from .reports import reports_router
+from .search import search_router
 from .trucks import trucks_router
 from .users import users_router
 from .work_order_parts import work_order_parts_router
@@ -24,4 +27,7 @@ __all__ = [
     "auth_router",
     "expenses_router",
     "work_orders_reviewer_router",
+    "metrics_router",
+    "search_router",
+    "pay_runs_router",
 ]
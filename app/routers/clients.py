@@ -18,6 +18,8 @@ async def list_clients(
     name: Optional[str] = Query(None),
     document_number: Optional[str] = Query(None),
     phone: Optional[str] = Query(None),
+    skip: int = 0,
+    limit: int = 100,
     db: AsyncSession = Depends(get_db),
 ):
     service = ClientsService(db)
@@ -26,6 +28,8 @@ async def list_clients(
         name=name,
         document_number=document_number,
         phone=phone,
+        skip=skip,
+        limit=limit,
     )
     return success_response(data=data)
 
@@ -1,9 +1,18 @@
+from datetime import date
+from decimal import Decimal
+
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.core.pagination import next_cursor
 from app.core.responses import success_response
-from app.schemas.expenses import ExpenseCreate, ExpenseOut, ExpenseTypeOut
+from app.schemas.expenses import (
+    ExpenseCreate,
+    ExpenseOut,
+    ExpenseTotalOut,
+    ExpenseTypeOut,
+)
 from app.schemas.response import ResponseSchema
 from app.services.expenses import ExpensesService
 
@@ -20,9 +29,49 @@ async def list_expense_types(db: AsyncSession = Depends(get_db)):
 
 
 @expenses_router.get("/expenses", response_model=ResponseSchema[list[ExpenseOut]])
-async def list_expenses(db: AsyncSession = Depends(get_db)):
+async def list_expenses(
+    start_date: date | None = None,
+    end_date: date | None = None,
+    expense_type_id: int | None = None,
+    min_amount: Decimal | None = None,
+    max_amount: Decimal | None = None,
+    skip: int = 0,
+    limit: int = 100,
+    after: str | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    service = ExpensesService(db)
+    data = await service.list_expenses(
+        start_date=start_date,
+        end_date=end_date,
+        expense_type_id=expense_type_id,
+        min_amount=min_amount,
+        max_amount=max_amount,
+        skip=skip,
+        limit=limit,
+        after=after,
+    )
+    cursor = next_cursor(data, limit, lambda expense: (expense.date, expense.id))
+    return success_response(data=data, next_cursor=cursor)
+
+
+@expenses_router.get("/expenses/total", response_model=ResponseSchema[ExpenseTotalOut])
+async def expenses_total(
+    start_date: date | None = None,
+    end_date: date | None = None,
+    expense_type_id: int | None = None,
+    min_amount: Decimal | None = None,
+    max_amount: Decimal | None = None,
+    db: AsyncSession = Depends(get_db),
+):
     service = ExpensesService(db)
-    data = await service.list_expenses()
+    data = await service.total(
+        start_date=start_date,
+        end_date=end_date,
+        expense_type_id=expense_type_id,
+        min_amount=min_amount,
+        max_amount=max_amount,
+    )
     return success_response(data=data)
 
 
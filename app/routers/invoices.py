@@ -2,10 +2,13 @@ from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
 
 from app.constants.roles import ADMIN, REVISOR
-from app.core.database import get_db
+from app.core.database import get_db, get_session_factory
 from app.core.dependencies import roles_allowed
+from app.core.exports import export_response
+from app.core.pagination import next_cursor
 from app.core.responses import success_response
 from app.schemas.invoices import (
     BankCheckExchange,
@@ -14,6 +17,8 @@ from app.schemas.invoices import (
     InvoiceDetailOut,
     InvoiceOut,
     InvoiceUpdate,
+    PaymentBulkCreate,
+    PaymentBulkResult,
     PaymentCreate,
     PaymentMethodOut,
     PaymentOut,
@@ -44,6 +49,7 @@ async def list_invoices(
     start_date: datetime | None = None,
     end_date: datetime | None = None,
     client_id: int | None = None,
+    after: str | None = None,
     db: AsyncSession = Depends(get_db),
     current_user: str = Depends(roles_allowed(ADMIN, REVISOR)),
 ):
@@ -55,8 +61,41 @@ async def list_invoices(
         start_date=start_date,
         end_date=end_date,
         client_id=client_id,
+        after=after,
     )
-    return success_response(data=data)
+    cursor = next_cursor(data, limit, lambda invoice: (invoice.id,))
+    return success_response(data=data, next_cursor=cursor)
+
+
+@invoice_router.get("/export")
+async def export_invoices(
+    status_id: int | None = None,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    client_id: int | None = None,
+    fmt: str = Query("csv", alias="format"),
+    db: AsyncSession = Depends(get_db),
+    session_factory: sessionmaker = Depends(get_session_factory),
+    current_user: str = Depends(roles_allowed(ADMIN, REVISOR)),
+):
+    service = InvoicesService(db)
+    query = service.export_query(
+        status_id=status_id,
+        start_date=start_date,
+        end_date=end_date,
+        client_id=client_id,
+    )
+    return export_response(session_factory, query, fmt, "facturas")
+
+
+@invoice_router.post("/reconcile-paid", response_model=ResponseSchema[list[dict]])
+async def reconcile_invoices_paid(
+    db: AsyncSession = Depends(get_db),
+    current_user: str = Depends(roles_allowed(ADMIN)),
+):
+    service = InvoicesService(db)
+    data = await service.reconcile_paid()
+    return success_response(data=data, message=f"{len(data)} facturas corregidas")
 
 
 @invoice_router.get(
@@ -83,6 +122,22 @@ async def register_payment(
     return success_response(data=data)
 
 
+@invoice_router.post(
+    "/payments/bulk", response_model=ResponseSchema[list[PaymentBulkResult]]
+)
+async def register_payments_bulk(
+    bulk_in: PaymentBulkCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user: str = Depends(roles_allowed(ADMIN, REVISOR)),
+):
+    service = PaymentsService(db)
+    data = await service.create_bulk(bulk_in.payments)
+    registered = sum(1 for row in data if row["success"])
+    return success_response(
+        data=data, message=f"{registered} de {len(data)} pagos registrados"
+    )
+
+
 @invoice_router.get("/payments/", response_model=ResponseSchema[list[PaymentSearchOut]])
 async def search_payments(
     client_id: int | None = None,
@@ -92,6 +147,7 @@ async def search_payments(
     end_date: datetime | None = None,
     skip: int = 0,
     limit: int = 100,
+    after: str | None = None,
     db: AsyncSession = Depends(get_db),
     current_user: str = Depends(roles_allowed(ADMIN, REVISOR)),
 ):
@@ -104,12 +160,35 @@ async def search_payments(
         limit=limit,
         start_date=start_date,
         end_date=end_date,
+        after=after,
     )
-    data = [
-        PaymentSearchOut.model_validate(payment, from_attributes=True).model_dump()
-        for payment in payments
-    ]
-    return success_response(data=data)
+    cursor = next_cursor(payments, limit, lambda payment: (payment.date, payment.id))
+    return success_response(
+        data=payments, next_cursor=cursor, schema=list[PaymentSearchOut]
+    )
+
+
+@invoice_router.get("/payments/export")
+async def export_payments(
+    client_id: int | None = None,
+    invoice_id: int | None = None,
+    payment_type: str | None = Query(None, alias="type"),
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    fmt: str = Query("csv", alias="format"),
+    db: AsyncSession = Depends(get_db),
+    session_factory: sessionmaker = Depends(get_session_factory),
+    current_user: str = Depends(roles_allowed(ADMIN, REVISOR)),
+):
+    service = PaymentsService(db)
+    query = service.export_query(
+        client_id=client_id,
+        invoice_id=invoice_id,
+        payment_type=payment_type,
+        start_date=start_date,
+        end_date=end_date,
+    )
+    return export_response(session_factory, query, fmt, "pagos")
 
 
 @invoice_router.post(
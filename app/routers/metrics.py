@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends
+
+from app.constants.roles import ADMIN
+from app.core.cache import reports_cache
+from app.core.database import engine, pool_metrics
+from app.core.dependencies import roles_allowed
+from app.core.jobs import job_queue
+from app.core.reference_data import reference_data
+from app.core.responses import success_response
+from app.core.security import hashing_pool
+from app.schemas.response import ResponseSchema
+
+metrics_router = APIRouter()
+
+
+@metrics_router.get("/", response_model=ResponseSchema[dict])
+async def get_metrics(current_user: str = Depends(roles_allowed(ADMIN))):
+    return success_response(
+        data={
+            "db_pool": pool_metrics.snapshot(engine.pool),
+            "reports_cache": reports_cache.stats(),
+            "password_hashing": hashing_pool.snapshot(),
+            "reference_data": reference_data.snapshot(),
+            "jobs": job_queue.snapshot(),
+        }
+    )
@@ -0,0 +1,93 @@
+from datetime import date
+
+from fastapi import APIRouter, Depends, Path
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants.roles import ADMIN, REVISOR
+from app.core.database import get_db
+from app.core.dependencies import roles_allowed
+from app.core.responses import success_response
+from app.schemas.pay_runs import PayRunCreate, PayRunOut, PayRunPreviewOut
+from app.schemas.response import ResponseSchema
+from app.services.pay_runs import PayRunsService
+
+pay_runs_router = APIRouter()
+
+
+@pay_runs_router.get("/preview", response_model=ResponseSchema[PayRunPreviewOut])
+async def preview_pay_run(
+    area_id: int | None = None,
+    status_id: int | None = None,
+    user_id: int | None = None,
+    start_date: date | None = None,
+    end_date: date | None = None,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(roles_allowed(ADMIN, REVISOR)),
+):
+    service = PayRunsService(db)
+    data = await service.preview(
+        PayRunCreate(
+            area_id=area_id,
+            status_id=status_id,
+            user_id=user_id,
+            start_date=start_date,
+            end_date=end_date,
+        )
+    )
+    return success_response(data=data, schema=PayRunPreviewOut)
+
+
+@pay_runs_router.post("/", response_model=ResponseSchema[PayRunOut])
+async def create_pay_run(
+    pay_run_in: PayRunCreate,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(roles_allowed(ADMIN, REVISOR)),
+):
+    service = PayRunsService(db)
+    data = await service.create_pay_run(pay_run_in)
+    return success_response(data=data, schema=PayRunOut)
+
+
+@pay_runs_router.get("/", response_model=ResponseSchema[list[PayRunOut]])
+async def list_pay_runs(
+    skip: int = 0,
+    limit: int = 100,
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(roles_allowed(ADMIN, REVISOR)),
+):
+    service = PayRunsService(db)
+    data = await service.list_pay_runs(skip=skip, limit=limit)
+    return success_response(data=data, schema=list[PayRunOut])
+
+
+@pay_runs_router.get("/{pay_run_id}", response_model=ResponseSchema[PayRunOut])
+async def get_pay_run(
+    pay_run_id: int = Path(..., gt=0),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(roles_allowed(ADMIN, REVISOR)),
+):
+    service = PayRunsService(db)
+    data = await service.get_pay_run(pay_run_id)
+    return success_response(data=data, schema=PayRunOut)
+
+
+@pay_runs_router.post("/{pay_run_id}/pay", response_model=ResponseSchema[PayRunOut])
+async def pay_pay_run(
+    pay_run_id: int = Path(..., gt=0),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(roles_allowed(ADMIN)),
+):
+    service = PayRunsService(db)
+    data = await service.pay_pay_run(pay_run_id)
+    return success_response(data=data, schema=PayRunOut)
+
+
+@pay_runs_router.delete("/{pay_run_id}")
+async def cancel_pay_run(
+    pay_run_id: int = Path(..., gt=0),
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(roles_allowed(ADMIN)),
+):
+    service = PayRunsService(db)
+    data = await service.cancel_pay_run(pay_run_id)
+    return success_response(data=data)
@@ -1,8 +1,11 @@
+from datetime import datetime
+
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
 
 from app.constants.roles import ADMIN, REVISOR
-from app.core.database import get_db
+from app.core.database import get_db, get_session_factory
 from app.core.dependencies import roles_allowed
 from app.core.responses import success_response
 from app.schemas.reports import FinancialBalanceOut
@@ -14,21 +17,34 @@ reports_router = APIRouter()
 
 @reports_router.get("/profit-by-order", response_model=ResponseSchema)
 async def report_profit_by_order(
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    client_id: int | None = None,
+    skip: int = 0,
+    limit: int = 100,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(roles_allowed(ADMIN, REVISOR)),
 ):
     service = ReportsService(db)
-    data = await service.profit_by_order()
+    data = await service.profit_by_order(
+        start_date=start_date,
+        end_date=end_date,
+        client_id=client_id,
+        skip=skip,
+        limit=limit,
+    )
     return success_response(data=data)
 
 
 @reports_router.get("/unpaid-air-mechanic-tasks", response_model=ResponseSchema)
 async def report_unpaid_air_mechanic_tasks(
+    area_id: int = 1,
+    status_id: int = 3,
     db: AsyncSession = Depends(get_db),
     current_user=Depends(roles_allowed(ADMIN, REVISOR)),
 ):
     service = ReportsService(db)
-    data = await service.unpaid_air_mechanic_tasks()
+    data = await service.unpaid_air_mechanic_tasks(area_id, status_id)
     return success_response(data=data)
 
 
@@ -119,14 +135,19 @@ async def report_financial_balance(
 @reports_router.get("/dashboard", response_model=ResponseSchema)
 async def report_dashboard(
     db: AsyncSession = Depends(get_db),
+    session_factory: sessionmaker = Depends(get_session_factory),
     current_user=Depends(roles_allowed(ADMIN, REVISOR)),
 ):
     service = ReportsService(db)
-    return success_response(
-        data={
-            "balance": await service.monthly_balance(),
-            "top_clients": await service.top_clients(limit=5),
-            "income": await service.income_monthly(),
-            "expenses": await service.expenses_monthly(),
-        }
-    )
+    data = await service.dashboard(session_factory, top_limit=5)
+    return success_response(data=data)
+
+
+@reports_router.post("/rollups/rebuild", response_model=ResponseSchema)
+async def rebuild_report_rollups(
+    db: AsyncSession = Depends(get_db),
+    current_user=Depends(roles_allowed(ADMIN)),
+):
+    service = ReportsService(db)
+    await service.rebuild_rollups()
+    return success_response(message="Resúmenes recalculados")
@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.constants.roles import ADMIN, REVISOR
+from app.core.database import get_db
+from app.core.dependencies import roles_allowed
+from app.core.responses import success_response
+from app.schemas.response import ResponseSchema
+from app.schemas.search import SearchResultOut
+from app.services.search import SearchService
+
+search_router = APIRouter()
+
+
+@search_router.get("/", response_model=ResponseSchema[list[SearchResultOut]])
+async def search(
+    q: str,
+    limit: int = Query(10, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+    current_user: str = Depends(roles_allowed(ADMIN, REVISOR)),
+):
+    service = SearchService(db)
+    data = await service.search(q, limit=limit)
+    return success_response(data=data, schema=list[SearchResultOut])
@@ -18,16 +18,19 @@ async def list_trucks(
     license_plate: str = None,
     brand: str = None,
     model: str = None,
+    skip: int = 0,
+    limit: int = 100,
     db: AsyncSession = Depends(get_db),
     current_user: str = Depends(roles_allowed(ADMIN, REVISOR)),
 ):
-    # Podés hacer paginación acá, filtro, etc.
     service = TrucksService(db)
     data = await service.list_trucks(
         client_id=client_id,
         license_plate=license_plate,
         brand=brand,
         model=model,
+        skip=skip,
+        limit=limit,
     )
     return success_response(data=data)
 
@@ -83,6 +83,6 @@ async def change_password(
 
 @users_router.get("/me", response_model=ResponseSchema[UserOut])
 async def get_current_user(
-    current_user: User = Depends(roles_allowed(ADMIN, REVISOR)),
+    current_user: User = Depends(roles_allowed(ADMIN, REVISOR, load_user=True)),
 ):
     return success_response(data=current_user)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, Path
+from fastapi import APIRouter, Depends, Path, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.constants.roles import ADMIN, MECHANIC, REVISOR
@@ -7,6 +7,7 @@ from app.core.dependencies import roles_allowed
 from app.core.responses import success_response
 from app.schemas.response import ResponseSchema
 from app.schemas.work_order_parts import (
+    PartCatalogOut,
     WorkOrderPartCreate,
     WorkOrderPartOut,
     WorkOrderPartUpdate,
@@ -26,6 +27,20 @@ async def list_names(
     return success_response(data=data)
 
 
+@work_order_parts_router.get(
+    "/catalog", response_model=ResponseSchema[list[PartCatalogOut]]
+)
+async def parts_catalog(
+    q: str | None = None,
+    limit: int = Query(20, ge=1, le=50),
+    db: AsyncSession = Depends(get_db),
+    current_user: str = Depends(roles_allowed(ADMIN, REVISOR, MECHANIC)),
+):
+    service = WorkOrderPartsService(db)
+    data = await service.catalog(q, limit)
+    return success_response(data=data, schema=list[PartCatalogOut])
+
+
 @work_order_parts_router.post("/", response_model=ResponseSchema[WorkOrderPartOut])
 async def add_part(
     part_in: WorkOrderPartCreate,
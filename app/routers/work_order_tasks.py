@@ -7,6 +7,7 @@ from app.core.dependencies import roles_allowed
 from app.core.responses import success_response
 from app.schemas.response import ResponseSchema
 from app.schemas.work_order_tasks import (
+    WorkOrderTaskBulkPaidOut,
     WorkOrderTaskBulkPaidUpdate,
     WorkOrderTaskCreate,
     WorkOrderTaskOut,
@@ -29,7 +30,7 @@ async def create_task(
 
 
 @work_order_tasks_router.put(
-    "/bulk-paid", response_model=ResponseSchema[list[WorkOrderTaskOut]]
+    "/bulk-paid", response_model=ResponseSchema[WorkOrderTaskBulkPaidOut]
 )
 async def bulk_update_paid(
     tasks_in: WorkOrderTaskBulkPaidUpdate,
@@ -38,7 +39,7 @@ async def bulk_update_paid(
 ):
     service = WorkOrderTasksService(db)
     data = await service.bulk_update_paid(tasks_in)
-    return success_response(data=data)
+    return success_response(data=data, schema=WorkOrderTaskBulkPaidOut)
 
 
 @work_order_tasks_router.get(
@@ -1,14 +1,23 @@
 from datetime import datetime
+from decimal import Decimal
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
 
 from app.constants.roles import ADMIN, MECHANIC, REVISOR
-from app.core.database import get_db
+from app.core.database import get_db, get_session_factory
 from app.core.dependencies import roles_allowed
+from app.core.exports import export_response
+from app.core.pagination import next_cursor
 from app.core.responses import success_response
 from app.schemas.response import ResponseSchema
-from app.schemas.work_orders import WorkOrderCreate, WorkOrderOut, WorkOrderUpdate
+from app.schemas.work_orders import (
+    WorkOrderCreate,
+    WorkOrderOut,
+    WorkOrderSummaryOut,
+    WorkOrderUpdate,
+)
 from app.services.work_orders import WorkOrdersService
 
 work_orders_router = APIRouter()
@@ -25,7 +34,10 @@ async def create_order(
     return success_response(data=work_order)
 
 
-@work_orders_router.get("/", response_model=ResponseSchema[list[WorkOrderOut]])
+@work_orders_router.get(
+    "/",
+    response_model=ResponseSchema[list[WorkOrderOut] | list[WorkOrderSummaryOut]],
+)
 async def list_orders(
     skip: int = 0,
     limit: int = 100,
@@ -34,6 +46,11 @@ async def list_orders(
     end_date: datetime | None = None,
     client_id: int | None = None,
     truck_id: int | None = None,
+    after: str | None = None,
+    summary: bool = False,
+    min_total: Decimal | None = None,
+    max_total: Decimal | None = None,
+    sort_by_total: bool = False,
     db: AsyncSession = Depends(get_db),
     current_user: str = Depends(roles_allowed(ADMIN, REVISOR, MECHANIC)),
 ):
@@ -46,8 +63,51 @@ async def list_orders(
         end_date=end_date,
         client_id=client_id,
         truck_id=truck_id,
+        after=after,
+        summary=summary,
+        min_total=min_total,
+        max_total=max_total,
+        sort_by_total=sort_by_total,
     )
-    return success_response(data=orders)
+    fields = ("total", "id") if sort_by_total else ("id",)
+    cursor = next_cursor(
+        orders,
+        limit,
+        lambda order: tuple(
+            order[name] if summary else getattr(order, name) for name in fields
+        ),
+    )
+    schema = list[WorkOrderSummaryOut] if summary else list[WorkOrderOut]
+    return success_response(data=orders, next_cursor=cursor, schema=schema)
+
+
+@work_orders_router.get("/export")
+async def export_orders(
+    status_id: int | None = None,
+    start_date: datetime | None = None,
+    end_date: datetime | None = None,
+    client_id: int | None = None,
+    truck_id: int | None = None,
+    min_total: Decimal | None = None,
+    max_total: Decimal | None = None,
+    sort_by_total: bool = False,
+    fmt: str = Query("csv", alias="format"),
+    db: AsyncSession = Depends(get_db),
+    session_factory: sessionmaker = Depends(get_session_factory),
+    current_user: str = Depends(roles_allowed(ADMIN, REVISOR)),
+):
+    service = WorkOrdersService(db)
+    query = service.export_query(
+        status_id=status_id,
+        start_date=start_date,
+        end_date=end_date,
+        client_id=client_id,
+        truck_id=truck_id,
+        min_total=min_total,
+        max_total=max_total,
+        sort_by_total=sort_by_total,
+    )
+    return export_response(session_factory, query, fmt, "ordenes")
 
 
 @work_orders_router.get("/{order_id}/total", response_model=ResponseSchema[dict])
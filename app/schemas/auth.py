@@ -16,6 +16,7 @@ class Token(BaseModel):
 class TokenPayload(BaseModel):
     sub: str | None = None
     role: int | None = None
+    ver: int = 0
     exp: int | None = None
 
 
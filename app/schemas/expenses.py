@@ -26,3 +26,8 @@ class ExpenseOut(ExpenseCreate):
 
     class Config:
         from_attributes = True
+
+
+class ExpenseTotalOut(BaseModel):
+    total: Decimal
+    count: int
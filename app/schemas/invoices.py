@@ -80,6 +80,17 @@ class BankCheckIn(BaseModel):
     due_date: Optional[datetime] = None
 
 
+class PaymentBulkCreate(BaseModel):
+    payments: list[PaymentCreate]
+
+
+class PaymentBulkResult(BaseModel):
+    index: int
+    success: bool
+    payment_id: Optional[int] = None
+    error: Optional[str] = None
+
+
 class BankCheckOut(BankCheckIn):
     id: int
     issued_at: datetime
@@ -0,0 +1,45 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+
+class PayRunCreate(BaseModel):
+    area_id: int | None = None
+    status_id: int | None = None
+    user_id: int | None = None
+    start_date: date | None = None
+    end_date: date | None = None
+
+
+class PayRunLineOut(BaseModel):
+    user_id: int
+    area_id: int
+    task_count: int
+    total: Decimal
+
+    class Config:
+        from_attributes = True
+
+
+class PayRunPreviewOut(BaseModel):
+    task_count: int
+    total: Decimal
+    lines: list[PayRunLineOut]
+
+
+class PayRunOut(BaseModel):
+    id: int
+    area_id: int | None
+    status_id: int | None
+    user_id: int | None
+    period_start: date | None
+    period_end: date | None
+    task_count: int
+    total: Decimal
+    created_at: datetime
+    paid_at: datetime | None
+    lines: list[PayRunLineOut]
+
+    class Config:
+        from_attributes = True
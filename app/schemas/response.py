@@ -10,3 +10,4 @@ class ResponseSchema(BaseModel, Generic[T]):
     success: bool
     message: Optional[str] = None
     data: Optional[T] = None
+    next_cursor: Optional[str] = None
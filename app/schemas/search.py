@@ -0,0 +1,12 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel
+
+
+class SearchResultOut(BaseModel):
+    type: Literal["client", "truck"]
+    id: int
+    label: str
+    detail: Optional[str] = None
+    client_id: int
+    score: float
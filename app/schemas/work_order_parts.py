@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 from pydantic import BaseModel
 
 
@@ -28,3 +30,9 @@ class WorkOrderPartOut(WorkOrderPartBase):
 
     class Config:
         from_attributes = True
+
+
+class PartCatalogOut(BaseModel):
+    name: str
+    uses: int
+    last_unit_price: Decimal | None
@@ -1,4 +1,5 @@
 from datetime import datetime
+from decimal import Decimal
 
 from pydantic import BaseModel
 
@@ -30,11 +31,20 @@ class WorkOrderTaskUpdate(BaseModel):
 class WorkOrderTaskBulkPaidUpdate(BaseModel):
     task_ids: list[int]
     paid: bool
+    area_id: int | None = None
+    status_id: int | None = None
 
 
 class WorkOrderTaskOut(WorkOrderTaskBase):
     id: int
     created_at: datetime
+    pay_run_id: int | None = None
 
     class Config:
         from_attributes = True
+
+
+class WorkOrderTaskBulkPaidOut(BaseModel):
+    tasks: list[WorkOrderTaskOut]
+    count: int
+    total: Decimal
@@ -1,4 +1,5 @@
 from datetime import datetime
+from decimal import Decimal
 from typing import List, Optional
 
 from pydantic import BaseModel
@@ -49,11 +50,29 @@ class WorkOrderOut(WorkOrderBase):
     parts: List[WorkOrderPartOut] = []
     fast_phone: Optional[str] = None
     is_editable: bool = True
+    parts_total: Decimal = Decimal("0")
+    labor_total: Decimal = Decimal("0")
+    total: Decimal = Decimal("0")
 
     class Config:
         from_attributes = True
 
 
+class WorkOrderSummaryOut(BaseModel):
+    id: int
+    created_at: datetime
+    license_plate: Optional[str] = None
+    client_name: Optional[str] = None
+    status_name: Optional[str] = None
+    reviewer_name: Optional[str] = None
+    task_count: int = 0
+    part_count: int = 0
+    parts_total: Decimal = Decimal("0")
+    labor_total: Decimal = Decimal("0")
+    total: Decimal = Decimal("0")
+    is_editable: bool = True
+
+
 class WorkOrderReviewer(BaseModel):
     work_order_id: int
     reviewer_id: int
@@ -1,7 +1,9 @@
 from fastapi import HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import create_access_token, verify_password
+from app.core.revocations import token_revocations
+from app.core.security import create_access_token, verify_password_async
+from app.db.repositories.token_revocations import TokenRevocationsRepository
 from app.db.repositories.users import UsersRepository
 
 
@@ -11,13 +13,21 @@ class AuthService:
 
     async def authenticate_user(self, email: str, password: str):
         user = await self.repo.get_by_email(email)
-        if not user or not verify_password(password, user.password):
+        if not user or not await verify_password_async(password, user.password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid credentials",
                 headers={"WWW-Authenticate": "Bearer"},
             )
+        version = await TokenRevocationsRepository(self.repo.db).get_version(user.id)
+        token_revocations.record(user.id, version)
         return user
 
     def login_token(self, user):
-        return create_access_token({"sub": str(user.id), "role": user.role_id})
+        return create_access_token(
+            {
+                "sub": str(user.id),
+                "role": user.role_id,
+                "ver": token_revocations.current_version(user.id),
+            }
+        )
@@ -20,12 +20,16 @@ class ClientsService:
         name: Optional[str] = None,
         document_number: Optional[str] = None,
         phone: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
     ):
         clients = await self.repo.list_all(
             type=type,
             name=name,
             document_number=document_number,
             phone=phone,
+            skip=skip,
+            limit=limit,
         )
         if not clients:
             raise HTTPException(
@@ -1,22 +1,81 @@
+from datetime import date
+from decimal import Decimal
+
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.validators import exists_or_404
+from app.core.cache import reports_cache
+from app.core.reference_data import reference_data
+from app.core.validators import check_range, validate_foreign_keys
 from app.db.repositories.expenses import ExpensesRepository
 from app.models.expense import Expense, ExpenseType
 from app.schemas.expenses import ExpenseCreate
 
 
+def _check_ranges(
+    start_date: date | None,
+    end_date: date | None,
+    min_amount: Decimal | None,
+    max_amount: Decimal | None,
+) -> None:
+    check_range(start_date, end_date)
+    check_range(
+        min_amount,
+        max_amount,
+        "El monto mínimo no puede ser mayor que el monto máximo",
+    )
+
+
 class ExpensesService:
     def __init__(self, db: AsyncSession):
         self.repo = ExpensesRepository(db)
 
     async def get_expense_types(self) -> list[ExpenseType]:
-        return await self.repo.list_types()
+        return await reference_data.all(self.repo.db, ExpenseType)
 
     async def create_expense(self, expense_data: ExpenseCreate) -> Expense:
-        if expense_data.expense_type_id is not None:
-            await exists_or_404(self.repo.db, ExpenseType, expense_data.expense_type_id)
-        return await self.repo.create_expense(expense_data)
+        await validate_foreign_keys(
+            self.repo.db, {ExpenseType: expense_data.expense_type_id}
+        )
+        expense = await self.repo.create_expense(expense_data)
+        await reports_cache.invalidate()
+        return expense
+
+    async def list_expenses(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        expense_type_id: int | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+        skip: int = 0,
+        limit: int = 100,
+        after: str | None = None,
+    ) -> list[Expense]:
+        _check_ranges(start_date, end_date, min_amount, max_amount)
+        return await self.repo.list_expenses(
+            start_date=start_date,
+            end_date=end_date,
+            expense_type_id=expense_type_id,
+            min_amount=min_amount,
+            max_amount=max_amount,
+            skip=skip,
+            limit=limit,
+            after=after,
+        )
 
-    async def list_expenses(self) -> list[Expense]:
-        return await self.repo.list_expenses()
+    async def total(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        expense_type_id: int | None = None,
+        min_amount: Decimal | None = None,
+        max_amount: Decimal | None = None,
+    ) -> dict:
+        _check_ranges(start_date, end_date, min_amount, max_amount)
+        return await self.repo.total(
+            start_date=start_date,
+            end_date=end_date,
+            expense_type_id=expense_type_id,
+            min_amount=min_amount,
+            max_amount=max_amount,
+        )
@@ -3,7 +3,14 @@ from datetime import datetime
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.validators import exists_or_404, validate_foreign_keys
+from app.core.cache import reports_cache
+from app.core.reference_data import reference_data
+from app.core.validators import (
+    check_range,
+    day_bounds,
+    existing_ids,
+    validate_foreign_keys,
+)
 from app.db.repositories.invoices import InvoicesRepository, PaymentsRepository
 from app.models.clients import Client
 from app.models.invoices import (
@@ -22,11 +29,12 @@ from app.schemas.invoices import (
     InvoiceUpdate,
     PaymentCreate,
 )
-from app.services.notifications import NotificationService
+from app.services.notifications import enqueue_due_check_notices
 
 
-def _invoice_with_surcharge(invoice: Invoice) -> dict:
-    surcharge = float(invoice.invoice_type.surcharge or 0)
+async def _invoice_with_surcharge(db: AsyncSession, invoice: Invoice) -> dict:
+    invoice_type = await reference_data.get(db, InvoiceType, invoice.invoice_type_id)
+    surcharge = float(invoice_type.surcharge or 0)
     base_total = float(invoice.total)
     data = InvoiceOut.model_validate(invoice).model_dump()
     data.update(
@@ -53,7 +61,9 @@ class InvoicesService:
                 InvoiceStatus: data.status_id,
             },
         )
-        return await self.repo.create(data)
+        invoice = await self.repo.create(data)
+        await reports_cache.invalidate()
+        return invoice
 
     async def get(self, invoice_id: int):
         invoice = await self.repo.get(invoice_id)
@@ -63,7 +73,29 @@ class InvoicesService:
 
     async def detail(self, invoice_id: int):
         invoice = await self.get(invoice_id)
-        return _invoice_with_surcharge(invoice)
+        return await _invoice_with_surcharge(self.repo.db, invoice)
+
+    async def reconcile_paid(self) -> list[dict]:
+        fixed = await self.repo.reconcile_paid()
+        if fixed:
+            await reports_cache.invalidate()
+        return fixed
+
+    def export_query(
+        self,
+        status_id: int | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        client_id: int | None = None,
+    ):
+        start_date, end_date = day_bounds(start_date, end_date)
+        check_range(start_date, end_date)
+        return self.repo.export_query(
+            status_id=status_id,
+            start_date=start_date,
+            end_date=end_date,
+            client_id=client_id,
+        )
 
     async def list(
         self,
@@ -73,20 +105,10 @@ class InvoicesService:
         start_date: datetime | None = None,
         end_date: datetime | None = None,
         client_id: int | None = None,
+        after: str | None = None,
     ):
-        if start_date:
-            start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        if end_date:
-            end_date = end_date.replace(
-                hour=23, minute=59, second=59, microsecond=999999
-            )
-
-        if start_date and end_date and start_date > end_date:
-            raise HTTPException(
-                status_code=400,
-                detail="La fecha de inicio no puede ser mayor que la fecha final",
-            )
-
+        start_date, end_date = day_bounds(start_date, end_date)
+        check_range(start_date, end_date)
         return await self.repo.list(
             skip=skip,
             limit=limit,
@@ -94,32 +116,36 @@ class InvoicesService:
             start_date=start_date,
             end_date=end_date,
             client_id=client_id,
+            after=after,
         )
 
     async def update(self, invoice_id: int, data: InvoiceUpdate):
-        await exists_or_404(self.repo.db, Invoice, invoice_id)
-        if data.status_id is not None:
-            await exists_or_404(self.repo.db, InvoiceStatus, data.status_id)
-
-        if data.invoice_type_id is not None:
-            await exists_or_404(self.repo.db, InvoiceType, data.invoice_type_id)
+        await validate_foreign_keys(
+            self.repo.db,
+            {
+                Invoice: invoice_id,
+                InvoiceStatus: data.status_id,
+                InvoiceType: data.invoice_type_id,
+            },
+        )
 
         invoice = await self.repo.update(invoice_id, data)
         if not invoice:
             raise HTTPException(404, detail="Factura no encontrada")
-        return _invoice_with_surcharge(invoice)
+        await reports_cache.invalidate()
+        return await _invoice_with_surcharge(self.repo.db, invoice)
 
     async def mark_as_accepted(self, invoice_id: int):
         invoice = await self.repo.mark_as_accepted(invoice_id)
         if not invoice:
             raise HTTPException(404, detail="Factura no encontrada")
-        return _invoice_with_surcharge(invoice)
+        await reports_cache.invalidate()
+        return await _invoice_with_surcharge(self.repo.db, invoice)
 
 
 class PaymentsService:
     def __init__(self, db: AsyncSession):
         self.repo = PaymentsRepository(db)
-        self.notifier = NotificationService(db)
 
     async def create(self, data: PaymentCreate):
         await validate_foreign_keys(
@@ -127,14 +153,75 @@ class PaymentsService:
             {Invoice: data.invoice_id, PaymentMethod: data.method_id},
         )
         payment = await self.repo.create(data)
-        for check in payment.bank_checks:
-            if check.due_date:
-                await self.notifier.notify_due_check(check)
+        await reports_cache.invalidate()
+        await enqueue_due_check_notices({payment.id: data})
         return payment
 
+    async def create_bulk(self, payments: list[PaymentCreate]) -> list[dict]:
+        """Registra un lote de pagos; las filas con referencias inválidas se
+        informan y el resto se inserta en una sola transacción."""
+        found = await existing_ids(
+            self.repo.db,
+            {
+                Invoice: [payment.invoice_id for payment in payments],
+                PaymentMethod: [payment.method_id for payment in payments],
+            },
+        )
+        results = []
+        valid = []
+        for index, payment in enumerate(payments):
+            errors = [
+                f"{model.__name__} con id {obj_id} no existe"
+                for model, obj_id in (
+                    (Invoice, payment.invoice_id),
+                    (PaymentMethod, payment.method_id),
+                )
+                if obj_id not in found[model]
+            ]
+            results.append(
+                {
+                    "index": index,
+                    "success": not errors,
+                    "payment_id": None,
+                    "error": "; ".join(errors) or None,
+                }
+            )
+            if not errors:
+                valid.append(index)
+
+        if valid:
+            payment_ids = await self.repo.create_bulk([payments[i] for i in valid])
+            for index, payment_id in zip(valid, payment_ids):
+                results[index]["payment_id"] = payment_id
+            await reports_cache.invalidate()
+            await enqueue_due_check_notices(
+                {
+                    payment_id: payments[index]
+                    for index, payment_id in zip(valid, payment_ids)
+                }
+            )
+        return results
+
     async def list_by_invoice(self, invoice_id: int, skip: int = 0, limit: int = 100):
         return await self.repo.list_by_invoice(invoice_id, skip=skip, limit=limit)
 
+    def export_query(
+        self,
+        client_id: int | None = None,
+        invoice_id: int | None = None,
+        payment_type: str | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+    ):
+        start_date, end_date = day_bounds(start_date, end_date)
+        return self.repo.export_query(
+            client_id=client_id,
+            invoice_id=invoice_id,
+            payment_type=payment_type,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
     async def list(
         self,
         client_id: int | None = None,
@@ -144,16 +231,9 @@ class PaymentsService:
         end_date: datetime | None = None,
         skip: int = 0,
         limit: int = 100,
+        after: str | None = None,
     ) -> list[Payment]:
-
-        if start_date:
-            start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-
-        if end_date:
-            end_date = end_date.replace(
-                hour=23, minute=59, second=59, microsecond=999999
-            )
-
+        start_date, end_date = day_bounds(start_date, end_date)
         return await self.repo.list(
             client_id=client_id,
             invoice_id=invoice_id,
@@ -162,13 +242,14 @@ class PaymentsService:
             end_date=end_date,
             skip=skip,
             limit=limit,
+            after=after,
         )
 
     async def total_by_invoice(self, invoice_id: int) -> float:
         return await self.repo.total_by_invoice(invoice_id)
 
     async def list_methods(self):
-        return await self.repo.list_methods()
+        return await reference_data.all(self.repo.db, PaymentMethod)
 
 
 class BankChecksService:
@@ -2,10 +2,14 @@ import logging
 from typing import Iterable
 
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
 
 from app.constants.roles import ADMIN
+from app.core.jobs import job_queue
+from app.db.repositories.invoices import PaymentsRepository
 from app.db.repositories.users import UsersRepository
 from app.models.invoices import BankCheck
+from app.schemas.invoices import PaymentCreate
 
 
 class NotificationService:
@@ -21,11 +25,42 @@ class NotificationService:
         )
 
     async def notify_due_check(self, check: BankCheck) -> None:
+        await self.notify_due_checks([check])
+
+    async def notify_due_checks(self, checks: Iterable[BankCheck]) -> None:
+        """Avisa el vencimiento de cada cheque; los admins se consultan una vez."""
+        checks = list(checks)
+        if not checks:
+            return
         admins = await self.users_repo.list(role_id=ADMIN)
-        recipients = [a.email for a in admins]
+        for check in checks:
+            await self._notify_due_check(check, [a.email for a in admins])
+
+    async def _notify_due_check(self, check: BankCheck, recipients: list[str]) -> None:
         invoice = check.payment.invoice if check.payment else None
         if invoice and invoice.work_order and invoice.work_order.reviewer:
             recipients.append(invoice.work_order.reviewer.email)
         subject = "Cheque próximo a vencer"
         body = f"El cheque {check.check_number} vence el {check.due_date}"
         await self._send_email(recipients, subject, body)
+
+
+@job_queue.register("notify_due_checks")
+async def notify_due_checks_job(
+    session_factory: sessionmaker, payment_ids: list[int]
+) -> None:
+    """Avisos de cheques con vencimiento de los pagos recién registrados."""
+    async with session_factory() as session:
+        checks = await PaymentsRepository(session).due_checks(payment_ids)
+        await NotificationService(session).notify_due_checks(checks)
+
+
+async def enqueue_due_check_notices(payments: dict[int, PaymentCreate]) -> None:
+    """Encola los avisos de los pagos (id -> datos) con cheques que vencen."""
+    payment_ids = [
+        payment_id
+        for payment_id, data in payments.items()
+        if any(check.due_date for check in data.bank_checks or [])
+    ]
+    if payment_ids:
+        await job_queue.enqueue("notify_due_checks", payment_ids=payment_ids)
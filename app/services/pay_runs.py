@@ -0,0 +1,68 @@
+from decimal import Decimal
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.validators import validate_foreign_keys
+from app.db.repositories.pay_runs import PayRunsRepository
+from app.models.users import User
+from app.models.work_orders import WorkOrderStatus
+from app.models.work_orders_mechanic import WorkArea
+from app.schemas.pay_runs import PayRunCreate
+
+
+class PayRunsService:
+    def __init__(self, db: AsyncSession):
+        self.repo = PayRunsRepository(db)
+
+    async def _check_filters(self, data: PayRunCreate) -> dict:
+        if data.start_date and data.end_date and data.start_date > data.end_date:
+            raise HTTPException(
+                status_code=400,
+                detail="La fecha de inicio no puede ser mayor que la fecha final",
+            )
+        await validate_foreign_keys(
+            self.repo.db,
+            {
+                WorkArea: data.area_id,
+                WorkOrderStatus: data.status_id,
+                User: data.user_id,
+            },
+        )
+        return data.model_dump()
+
+    async def preview(self, data: PayRunCreate):
+        lines = await self.repo.preview(**await self._check_filters(data))
+        return {
+            "task_count": sum(line["task_count"] for line in lines),
+            "total": sum((line["total"] for line in lines), Decimal("0")),
+            "lines": lines,
+        }
+
+    async def create_pay_run(self, data: PayRunCreate):
+        run = await self.repo.create(**await self._check_filters(data))
+        if run is None:
+            raise HTTPException(status_code=400, detail="No hay tareas para liquidar")
+        return run
+
+    async def list_pay_runs(self, skip: int = 0, limit: int = 100):
+        return await self.repo.list(skip=skip, limit=limit)
+
+    async def get_pay_run(self, pay_run_id: int):
+        run = await self.repo.get(pay_run_id)
+        if not run:
+            raise HTTPException(status_code=404, detail="Liquidación no encontrada")
+        return run
+
+    async def pay_pay_run(self, pay_run_id: int):
+        await self.get_pay_run(pay_run_id)
+        run = await self.repo.pay(pay_run_id)
+        if run is None:
+            raise HTTPException(status_code=400, detail="La liquidación ya está pagada")
+        return run
+
+    async def cancel_pay_run(self, pay_run_id: int):
+        await self.get_pay_run(pay_run_id)
+        if not await self.repo.cancel(pay_run_id):
+            raise HTTPException(status_code=400, detail="La liquidación ya está pagada")
+        return {"detail": "Liquidación cancelada"}
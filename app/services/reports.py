@@ -1,42 +1,121 @@
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
 import sqlalchemy as sa
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.core.cache import cached, reports_cache
+from app.core.jobs import job_queue
+from app.db.repositories.report_rollups import REBUILD_JOB, ReportRollupsRepository
+from app.models.clients import Client
+from app.models.invoices import Invoice
+from app.models.work_order_parts import WorkOrderPart
+from app.models.work_order_tasks import WorkOrderTask
+
+
+def _income_rows(monthly) -> list[dict]:
+    return [
+        {"month": row.month.strftime("%Y-%m"), "total_income": row.income}
+        for row in monthly
+        if row.invoice_count
+    ]
+
+
+def _expense_rows(monthly) -> list[dict]:
+    return [
+        {"month": row.month.strftime("%Y-%m"), "total_expense": row.expense}
+        for row in monthly
+        if row.expense_count
+    ]
+
+
+def _balance_rows(monthly) -> list[dict]:
+    return [
+        {
+            "month": row.month.strftime("%Y-%m"),
+            "income": row.income,
+            "expense": row.expense,
+            "balance": row.income - row.expense,
+        }
+        for row in monthly
+        if row.invoice_count or row.expense_count
+    ]
 
 
 class ReportsService:
     def __init__(self, db: AsyncSession):
         self.db = db
+        self.rollups = ReportRollupsRepository(db)
 
-    async def profit_by_order(self):
-        query = text(
-            """
-            SELECT
-              wo.id AS order_id,
-              c.name AS client_name,
-              i.total AS invoice_total,
-              COALESCE(SUM(DISTINCT wop.subtotal), 0) AS parts_cost,
-              COALESCE(SUM(DISTINCT wot.price), 0) AS labor_cost,
-              (i.total - COALESCE(SUM(DISTINCT wop.subtotal), 0) - COALESCE(SUM(DISTINCT wot.price), 0)) AS profit
-            FROM work_orders wo
-            JOIN invoices i ON i.work_order_id = wo.id
-            JOIN clients c ON c.id = i.client_id
-            LEFT JOIN work_order_parts wop ON wop.work_order_id = wo.id
-            LEFT JOIN work_order_tasks wot ON wot.work_order_id = wo.id
-            GROUP BY wo.id, c.name, i.total
-            ORDER BY profit DESC;
-        """
+    @cached(reports_cache, "profit_by_order")
+    async def profit_by_order(
+        self,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        client_id: int | None = None,
+        skip: int = 0,
+        limit: int = 100,
+    ):
+        # Repuestos y mano de obra se agregan por orden antes del join para
+        # no multiplicar filas (repuestos x tareas) al cruzarlos.
+        parts = (
+            sa.select(
+                WorkOrderPart.work_order_id,
+                sa.func.sum(WorkOrderPart.subtotal).label("parts_cost"),
+            )
+            .group_by(WorkOrderPart.work_order_id)
+            .subquery()
         )
+        labor = (
+            sa.select(
+                WorkOrderTask.work_order_id,
+                sa.func.sum(WorkOrderTask.price).label("labor_cost"),
+            )
+            .group_by(WorkOrderTask.work_order_id)
+            .subquery()
+        )
+        parts_cost = sa.func.coalesce(parts.c.parts_cost, 0)
+        labor_cost = sa.func.coalesce(labor.c.labor_cost, 0)
+        profit = (Invoice.total - parts_cost - labor_cost).label("profit")
+
+        query = (
+            sa.select(
+                Invoice.work_order_id.label("order_id"),
+                Client.name.label("client_name"),
+                Invoice.total.label("invoice_total"),
+                parts_cost.label("parts_cost"),
+                labor_cost.label("labor_cost"),
+                profit,
+            )
+            .join(Client, Client.id == Invoice.client_id)
+            .outerjoin(parts, parts.c.work_order_id == Invoice.work_order_id)
+            .outerjoin(labor, labor.c.work_order_id == Invoice.work_order_id)
+            .order_by(profit.desc(), Invoice.work_order_id)
+            .offset(skip)
+            .limit(limit)
+        )
+        if start_date:
+            query = query.where(Invoice.issued_at >= start_date)
+        if end_date:
+            query = query.where(Invoice.issued_at <= end_date)
+        if client_id:
+            query = query.where(Invoice.client_id == client_id)
+
         result = await self.db.execute(query)
         return [dict(row) for row in result.mappings().all()]
 
-    async def unpaid_air_mechanic_tasks(self):
+    async def unpaid_air_mechanic_tasks(self, area_id: int = 1, status_id: int = 3):
         query = text(
             """
             SELECT
               wot.id,
               wot.work_order_id,
               wot.description,
-              wot.price
+              wot.price,
+              SUM(wot.price) OVER () AS total
             FROM work_order_tasks wot
             JOIN work_orders wo ON wo.id = wot.work_order_id
             WHERE wot.area_id = :area_id
@@ -44,8 +123,14 @@ class ReportsService:
               AND wot.paid = FALSE
             ORDER BY wot.id;
             """
+        ).columns(
+            sa.column("id", sa.Integer),
+            sa.column("work_order_id", sa.Integer),
+            sa.column("description", sa.Text),
+            sa.column("price", sa.Numeric(10, 2)),
+            sa.column("total", sa.Numeric(14, 2)),
         )
-        params = {"area_id": 1, "status_id": 3}
+        params = {"area_id": area_id, "status_id": status_id}
         result = await self.db.execute(query, params)
         rows = result.fetchall()
         tasks = [
@@ -53,16 +138,20 @@ class ReportsService:
                 "id": row.id,
                 "work_order_id": row.work_order_id,
                 "description": row.description,
-                "price": float(row.price),
+                "price": row.price,
             }
             for row in rows
         ]
-        total = sum(task["price"] for task in tasks)
+        total = rows[0].total if rows else Decimal("0")
         return {"total": total, "tasks": tasks}
 
+    @cached(reports_cache, "billing_by_client")
     async def billing_by_client(
         self, start_date: str | None = None, end_date: str | None = None
     ):
+        if start_date is None and end_date is None:
+            return await self.rollups.billing_by_client()
+
         query = text(
             """
                 SELECT
@@ -85,36 +174,15 @@ class ReportsService:
         result = await self.db.execute(query, params)
         return [dict(row) for row in result.mappings().all()]
 
+    @cached(reports_cache, "top_clients")
     async def top_clients(self, limit: int = 5):
-        query = text(
-            """
-            SELECT
-              c.name AS client_name,
-              SUM(i.total) AS total_billed
-            FROM invoices i
-            JOIN clients c ON c.id = i.client_id
-            GROUP BY c.name
-            ORDER BY total_billed DESC
-            LIMIT :limit;
-        """
-        )
-        result = await self.db.execute(query, {"limit": limit})
-        return [dict(row) for row in result.mappings().all()]
+        return await self.rollups.top_clients(limit=limit)
 
+    @cached(reports_cache, "income_monthly")
     async def income_monthly(self):
-        query = text(
-            """
-            SELECT
-              TO_CHAR(DATE_TRUNC('month', issued_at), 'YYYY-MM') AS month,
-              SUM(total) AS total_income
-            FROM invoices
-            GROUP BY month
-            ORDER BY month DESC;
-        """
-        )
-        result = await self.db.execute(query)
-        return [dict(row) for row in result.mappings().all()]
+        return _income_rows(await self.rollups.monthly())
 
+    @cached(reports_cache, "payments_by_method")
     async def payments_by_method(
         self,
         start_date: str | None = None,
@@ -144,20 +212,11 @@ class ReportsService:
         result = await self.db.execute(query, params)
         return [dict(row) for row in result.mappings().all()]
 
+    @cached(reports_cache, "expenses_monthly")
     async def expenses_monthly(self):
-        query = text(
-            """
-            SELECT
-              TO_CHAR(DATE_TRUNC('month', date), 'YYYY-MM') AS month,
-              SUM(amount) AS total_expense
-            FROM expenses
-            GROUP BY month
-            ORDER BY month DESC;
-        """
-        )
-        result = await self.db.execute(query)
-        return [dict(row) for row in result.mappings().all()]
+        return _expense_rows(await self.rollups.monthly())
 
+    @cached(reports_cache, "expenses_by_type")
     async def expenses_by_type(self):
         query = text(
             """
@@ -173,46 +232,16 @@ class ReportsService:
         result = await self.db.execute(query)
         return [dict(row) for row in result.mappings().all()]
 
+    @cached(reports_cache, "monthly_balance")
     async def monthly_balance(self):
-        query = text(
-            """
-            WITH income AS (
-                SELECT DATE_TRUNC('month', issued_at) AS month, SUM(total) AS total_income
-                FROM invoices
-                GROUP BY month
-            ),
-            expense AS (
-                SELECT DATE_TRUNC('month', date) AS month, SUM(amount) AS total_expense
-                FROM expenses
-                GROUP BY month
-            )
-            SELECT
-              TO_CHAR(COALESCE(i.month, e.month), 'YYYY-MM') AS month,
-              COALESCE(i.total_income, 0) AS income,
-              COALESCE(e.total_expense, 0) AS expense,
-              (COALESCE(i.total_income, 0) - COALESCE(e.total_expense, 0)) AS balance
-            FROM income i
-            FULL OUTER JOIN expense e ON i.month = e.month
-            ORDER BY month DESC;
-        """
-        )
-        result = await self.db.execute(query)
-        return [dict(row) for row in result.mappings().all()]
+        return _balance_rows(await self.rollups.monthly())
 
+    @cached(reports_cache, "financial_balance")
     async def financial_balance(self):
-        query = text(
-            """
-            SELECT
-              (SELECT COALESCE(SUM(total), 0) FROM invoices) AS estimated_income,
-              (SELECT COALESCE(SUM(amount), 0) FROM payments) AS real_income,
-              (SELECT COALESCE(SUM(amount), 0) FROM expenses) AS expense
-            """
-        )
-        result = await self.db.execute(query)
-        row = result.mappings().first()
-        estimated_income = float(row["estimated_income"])
-        real_income = float(row["real_income"])
-        expense = float(row["expense"])
+        totals = await self.rollups.totals()
+        estimated_income = float(totals["income"])
+        real_income = float(totals["payments"])
+        expense = float(totals["expense"])
         return {
             "estimated_income": estimated_income,
             "real_income": real_income,
@@ -220,3 +249,35 @@ class ReportsService:
             "estimated_balance": estimated_income - expense,
             "real_balance": real_income - expense,
         }
+
+    @cached(reports_cache, "dashboard", ignore=("session_factory",))
+    async def dashboard(self, session_factory: sessionmaker, top_limit: int = 5):
+        """Balance, ingresos, gastos y mejores clientes en un único payload.
+
+        Los tres reportes mensuales salen de una sola lectura del resumen
+        mensual; el ranking de clientes corre en paralelo sobre otra conexión
+        del pool.
+        """
+
+        async def top_clients():
+            async with session_factory() as session:
+                return await ReportsService(session).top_clients(limit=top_limit)
+
+        monthly, top = await asyncio.gather(self.rollups.monthly(), top_clients())
+        return {
+            "balance": _balance_rows(monthly),
+            "top_clients": top,
+            "income": _income_rows(monthly),
+            "expenses": _expense_rows(monthly),
+        }
+
+    async def rebuild_rollups(self) -> None:
+        await self.rollups.rebuild()
+        await reports_cache.invalidate()
+
+
+@job_queue.register(REBUILD_JOB)
+async def rebuild_rollups_job(session_factory) -> None:
+    """Recalcula los resúmenes cuando un flush no pudo aplicar sus deltas."""
+    async with session_factory() as session:
+        await ReportsService(session).rebuild_rollups()
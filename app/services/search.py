@@ -0,0 +1,20 @@
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repositories.search import SearchRepository
+
+SEARCH_MIN_LENGTH = 2
+
+
+class SearchService:
+    def __init__(self, db: AsyncSession):
+        self.repo = SearchRepository(db)
+
+    async def search(self, q: str, limit: int = 10) -> list[dict]:
+        term = q.strip()
+        if len(term) < SEARCH_MIN_LENGTH:
+            raise HTTPException(
+                status_code=400,
+                detail=f"La búsqueda requiere al menos {SEARCH_MIN_LENGTH} caracteres",
+            )
+        return await self.repo.search(term, limit=limit)
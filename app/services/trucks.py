@@ -49,12 +49,16 @@ class TrucksService:
         license_plate: str = None,
         brand: str = None,
         model: str = None,
+        skip: int = 0,
+        limit: int = 100,
     ) -> List[Truck]:
         trucks = await self.repo.list_all(
             client_id=client_id,
             license_plate=license_plate,
             brand=brand,
             model=model,
+            skip=skip,
+            limit=limit,
         )
         if not trucks:
             raise HTTPException(
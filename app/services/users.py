@@ -1,7 +1,8 @@
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import create_access_token, verify_password
+from app.core.revocations import token_revocations
+from app.core.security import create_access_token, verify_password_async
 from app.core.validators import validate_foreign_keys
 from app.db.repositories.users import UsersRepository
 from app.models.users import Role
@@ -21,9 +22,15 @@ class UsersService:
 
     async def login(self, credentials: UserLogin):
         user = await self.repo.get_by_email(credentials.email)
-        if not user or not verify_password(credentials.password, user.password):
+        if not user or not await verify_password_async(
+            credentials.password, user.password
+        ):
             raise HTTPException(status_code=401, detail="Credenciales inválidas")
-        return create_access_token({"sub": str(user.id)})
+        version = await self.repo.revocations.get_version(user.id)
+        token_revocations.record(user.id, version)
+        return create_access_token(
+            {"sub": str(user.id), "role": user.role_id, "ver": version}
+        )
 
     async def get_user(self, user_id: int):
         user = await self.repo.get_by_id(user_id)
@@ -56,6 +63,6 @@ class UsersService:
         user = await self.repo.get_by_id(user_id)
         if not user:
             raise HTTPException(status_code=404, detail="Usuario no encontrado")
-        if not verify_password(old_password, user.password):
+        if not await verify_password_async(old_password, user.password):
             raise HTTPException(status_code=401, detail="Contraseña antigua incorrecta")
         return await self.repo.update_password(user_id, new_password)
@@ -2,6 +2,7 @@ from fastapi import HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import reports_cache
 from app.core.validators import validate_foreign_keys
 from app.db.repositories.work_order_parts import WorkOrderPartsRepository
 from app.models.invoices import Invoice
@@ -26,7 +27,9 @@ class WorkOrderPartsService:
             {WorkOrder: data.work_order_id},
         )
         await self._ensure_editable(data.work_order_id)
-        return await self.repo.create(data)
+        part = await self.repo.create(data)
+        await reports_cache.invalidate()
+        return part
 
     async def list_parts(self, work_order_id: int):
         return await self.repo.list_by_work_order(work_order_id)
@@ -40,6 +43,7 @@ class WorkOrderPartsService:
             await validate_foreign_keys(self.repo.db, {WorkOrder: data.work_order_id})
             await self._ensure_editable(data.work_order_id)
         updated = await self.repo.update(part_id, data.model_dump(exclude_unset=True))
+        await reports_cache.invalidate()
         return updated
 
     async def delete_part(self, part_id: int):
@@ -50,7 +54,12 @@ class WorkOrderPartsService:
         deleted = await self.repo.delete(part_id)
         if not deleted:
             raise HTTPException(status_code=404, detail="Repuesto no encontrado")
+        await reports_cache.invalidate()
         return {"detail": "Repuesto eliminado"}
 
     async def list_names(self):
         return await self.repo.list_names()
+
+    async def catalog(self, term: str | None = None, limit: int = 20):
+        term = term.strip() if term else None
+        return await self.repo.catalog(term or None, limit)
@@ -1,12 +1,15 @@
+from decimal import Decimal
+
 from fastapi import HTTPException
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import reports_cache
 from app.core.validators import validate_foreign_keys
 from app.db.repositories.work_order_tasks import WorkOrderTasksRepository
 from app.models.invoices import Invoice
 from app.models.users import User
-from app.models.work_orders import WorkOrder
+from app.models.work_orders import WorkOrder, WorkOrderStatus
 from app.models.work_orders_mechanic import WorkArea
 from app.schemas.work_order_tasks import (
     WorkOrderTaskBulkPaidUpdate,
@@ -26,6 +29,12 @@ class WorkOrderTasksService:
         if result.first():
             raise HTTPException(status_code=400, detail="La orden ya está facturada")
 
+    def _ensure_not_in_pay_run(self, task):
+        if task.pay_run_id is not None:
+            raise HTTPException(
+                status_code=400, detail="La tarea está incluida en una liquidación"
+            )
+
     async def create_task(self, data: WorkOrderTaskCreate):
         await validate_foreign_keys(
             self.repo.db,
@@ -36,7 +45,9 @@ class WorkOrderTasksService:
             },
         )
         await self._ensure_editable(data.work_order_id)
-        return await self.repo.create(data)
+        task = await self.repo.create(data)
+        await reports_cache.invalidate()
+        return task
 
     async def list_tasks(self, work_order_id: int):
         return await self.repo.list_by_work_order(work_order_id)
@@ -45,6 +56,7 @@ class WorkOrderTasksService:
         task = await self.repo.get(task_id)
         if not task:
             raise HTTPException(status_code=404, detail="Tarea no encontrada")
+        self._ensure_not_in_pay_run(task)
         await self._ensure_editable(task.work_order_id)
         if data.work_order_id and data.work_order_id != task.work_order_id:
             await validate_foreign_keys(self.repo.db, {WorkOrder: data.work_order_id})
@@ -57,20 +69,40 @@ class WorkOrderTasksService:
             },
         )
         updated = await self.repo.update(task_id, data.model_dump(exclude_unset=True))
+        await reports_cache.invalidate()
         return updated
 
     async def delete_task(self, task_id: int):
         task = await self.repo.get(task_id)
         if not task:
             raise HTTPException(status_code=404, detail="Tarea no encontrada")
+        self._ensure_not_in_pay_run(task)
         await self._ensure_editable(task.work_order_id)
         deleted = await self.repo.delete(task_id)
         if not deleted:
             raise HTTPException(status_code=404, detail="Tarea no encontrada")
+        await reports_cache.invalidate()
         return {"detail": "Tarea eliminada"}
 
     async def bulk_update_paid(self, data: WorkOrderTaskBulkPaidUpdate):
-        tasks = await self.repo.bulk_update_paid(data.task_ids, data.paid)
+        await validate_foreign_keys(
+            self.repo.db, {WorkArea: data.area_id, WorkOrderStatus: data.status_id}
+        )
+        reserved = await self.repo.reserved_ids(data.task_ids)
+        if reserved:
+            raise HTTPException(
+                status_code=400,
+                detail="Tareas incluidas en una liquidación: "
+                + ", ".join(str(task_id) for task_id in reserved),
+            )
+        tasks = await self.repo.bulk_update_paid(
+            data.task_ids, data.paid, data.area_id, data.status_id
+        )
         if tasks is None:
             raise HTTPException(status_code=404, detail="Tarea no encontrada")
-        return tasks
+        await reports_cache.invalidate()
+        return {
+            "tasks": tasks,
+            "count": len(tasks),
+            "total": sum((task.price for task in tasks), Decimal("0")),
+        }
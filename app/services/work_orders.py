@@ -1,32 +1,53 @@
 from datetime import datetime
+from decimal import Decimal
 
 from fastapi import HTTPException
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.validators import validate_foreign_keys
+from app.core.validators import check_range, day_bounds, validate_foreign_keys
 from app.db.repositories.work_orders import WorkOrdersRepository
-from app.models.invoices import Invoice
 from app.models.trucks import Truck
 from app.models.users import User
 from app.models.work_orders import WorkOrderStatus
 from app.schemas.work_orders import WorkOrderCreate, WorkOrderUpdate
 
 
+def _check_ranges(
+    start_date: datetime | None,
+    end_date: datetime | None,
+    min_total: Decimal | None,
+    max_total: Decimal | None,
+) -> tuple[datetime | None, datetime | None]:
+    """Extiende las fechas a días completos y valida ambos rangos."""
+    start_date, end_date = day_bounds(start_date, end_date)
+    check_range(start_date, end_date)
+    check_range(
+        min_total, max_total, "El total mínimo no puede ser mayor que el total máximo"
+    )
+    return start_date, end_date
+
+
 class WorkOrdersService:
     def __init__(self, db: AsyncSession):
         self.repo = WorkOrdersRepository(db)
 
-    async def _is_editable(self, work_order_id: int) -> bool:
-        result = await self.repo.db.execute(
-            select(Invoice.id).where(Invoice.work_order_id == work_order_id)
-        )
-        return result.first() is None
+    async def _add_editable_many(self, orders):
+        """Marca ``is_editable`` en toda la página con una sola consulta."""
+        invoiced = await self.repo.invoiced_ids([order.id for order in orders])
+        for order in orders:
+            order.is_editable = order.id not in invoiced
+        return orders
 
     async def _add_editable(self, order):
-        order.is_editable = await self._is_editable(order.id)
+        await self._add_editable_many([order])
         return order
 
+    async def _get_or_404(self, work_order_id: int):
+        work_order = await self.repo.get(work_order_id)
+        if not work_order:
+            raise HTTPException(status_code=404, detail="Orden no encontrada")
+        return work_order
+
     async def create_work_order(self, data: WorkOrderCreate):
         await validate_foreign_keys(
             self.repo.db,
@@ -40,10 +61,30 @@ class WorkOrdersService:
         return await self._add_editable(order)
 
     async def get_work_order(self, work_order_id: int):
-        work_order = await self.repo.get(work_order_id)
-        if not work_order:
-            raise HTTPException(status_code=404, detail="Orden no encontrada")
-        return await self._add_editable(work_order)
+        return await self._add_editable(await self._get_or_404(work_order_id))
+
+    def export_query(
+        self,
+        status_id: int | None = None,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        client_id: int | None = None,
+        truck_id: int | None = None,
+        min_total: Decimal | None = None,
+        max_total: Decimal | None = None,
+        sort_by_total: bool = False,
+    ):
+        start_date, end_date = _check_ranges(start_date, end_date, min_total, max_total)
+        return self.repo.summary_query(
+            status_id=status_id,
+            start_date=start_date,
+            end_date=end_date,
+            client_id=client_id,
+            truck_id=truck_id,
+            min_total=min_total,
+            max_total=max_total,
+            sort_by_total=sort_by_total,
+        )
 
     async def list_work_orders(
         self,
@@ -54,21 +95,14 @@ class WorkOrdersService:
         end_date: datetime | None = None,
         client_id: int | None = None,
         truck_id: int | None = None,
+        after: str | None = None,
+        summary: bool = False,
+        min_total: Decimal | None = None,
+        max_total: Decimal | None = None,
+        sort_by_total: bool = False,
     ):
-        if start_date:
-            start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-        if end_date:
-            end_date = end_date.replace(
-                hour=23, minute=59, second=59, microsecond=999999
-            )
-
-        if start_date and end_date and start_date > end_date:
-            raise HTTPException(
-                status_code=400,
-                detail="La fecha de inicio no puede ser mayor que la fecha final",
-            )
-
-        orders = await self.repo.list(
+        start_date, end_date = _check_ranges(start_date, end_date, min_total, max_total)
+        filters = dict(
             skip=skip,
             limit=limit,
             status_id=status_id,
@@ -76,8 +110,16 @@ class WorkOrdersService:
             end_date=end_date,
             client_id=client_id,
             truck_id=truck_id,
+            after=after,
+            min_total=min_total,
+            max_total=max_total,
+            sort_by_total=sort_by_total,
         )
-        return [await self._add_editable(o) for o in orders]
+        if summary:
+            return await self.repo.list_summary(**filters)
+
+        orders = await self.repo.list(**filters)
+        return await self._add_editable_many(orders)
 
     async def update_work_order(self, work_order_id: int, data: WorkOrderUpdate):
         await validate_foreign_keys(self.repo.db, {WorkOrderStatus: data.status_id})
@@ -86,7 +128,7 @@ class WorkOrdersService:
         )
         if not updated:
             raise HTTPException(status_code=404, detail="Orden no encontrada")
-        return await self._add_editable(await self.repo.get(work_order_id))
+        return await self._add_editable(updated)
 
     async def delete_work_order(self, work_order_id: int):
         deleted = await self.repo.delete(work_order_id)
@@ -95,28 +137,23 @@ class WorkOrdersService:
         return {"detail": "Orden eliminada"}
 
     async def assign_reviewer(self, work_order_id: int, reviewer_id: int):
-        await self.get_work_order(work_order_id)
+        await self._get_or_404(work_order_id)
         await validate_foreign_keys(self.repo.db, {User: reviewer_id})
-        await self.repo.update(work_order_id, {"reviewed_by": reviewer_id})
-        return await self._add_editable(await self.repo.get(work_order_id))
+        updated = await self.repo.update(work_order_id, {"reviewed_by": reviewer_id})
+        return await self._add_editable(updated)
 
     async def remove_reviewer(self, work_order_id: int, reviewer_id: int):
-        await self.get_work_order(work_order_id)
+        work_order = await self._get_or_404(work_order_id)
         await validate_foreign_keys(self.repo.db, {User: reviewer_id})
-        work_order = await self.repo.get(work_order_id)
         if work_order.reviewed_by != reviewer_id:
             raise HTTPException(
                 status_code=400, detail="Revisor no asignado a esta orden"
             )
-        await self.repo.update(work_order_id, {"reviewed_by": None})
-        return await self._add_editable(await self.repo.get(work_order_id))
-
-    async def calculate_total(self, work_order_id: int) -> float:
-        order = await self.get_work_order(work_order_id)
-        parts_total = 0.0
-        for p in order.parts:
-            inc = float(p.increment_per_unit or 0)
-            parts_total += float(p.unit_price) * p.quantity * (1 + inc / 100)
-
-        tasks_total = sum(float(t.price) for t in order.tasks)
-        return parts_total + tasks_total
+        updated = await self.repo.update(work_order_id, {"reviewed_by": None})
+        return await self._add_editable(updated)
+
+    async def calculate_total(self, work_order_id: int) -> Decimal:
+        totals = await self.repo.get_totals(work_order_id)
+        if totals is None:
+            raise HTTPException(status_code=404, detail="Orden no encontrada")
+        return totals["total"]
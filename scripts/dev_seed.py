@@ -5,6 +5,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 from app.core.database import engine
+from app.db.repositories.report_rollups import register_rollup_listeners
+from app.db.repositories.work_order_parts import register_part_catalog_listeners
 from app.models import (
     Client,
     ClientType,
@@ -212,6 +214,8 @@ async def seed_work_orders(session: AsyncSession):
 
 
 async def seed():
+    register_rollup_listeners()
+    register_part_catalog_listeners()
     await init_basic_data()
     async with AsyncSession(engine) as session:
         await seed_users(session)
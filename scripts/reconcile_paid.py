@@ -0,0 +1,24 @@
+"""Recalcula el total pagado de las facturas a partir de sus pagos.
+
+Pensado para correr periódicamente (cron) con ``python -m scripts.reconcile_paid``.
+"""
+
+import asyncio
+
+from app.core.database import AsyncSessionLocal
+from app.services.invoices import InvoicesService
+
+
+async def reconcile():
+    async with AsyncSessionLocal() as session:
+        fixed = await InvoicesService(session).reconcile_paid()
+    for row in fixed:
+        print(
+            f"Factura {row['invoice_id']}: {row['previous']} -> {row['paid']}",
+            flush=True,
+        )
+    print(f"{len(fixed)} facturas corregidas", flush=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(reconcile())
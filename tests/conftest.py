@@ -9,8 +9,12 @@ from sqlalchemy.orm import sessionmaker
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))  # pragma no cover
 
-from app.core.database import Base, get_db  # noqa: E402
+from app.core.cache import reports_cache, user_cache  # noqa: E402
+from app.core.database import Base, get_db, get_session_factory  # noqa: E402
 from app.core.dependencies import get_current_user  # noqa: E402
+from app.core.reference_data import reference_data  # noqa: E402
+from app.core.revocations import token_revocations  # noqa: E402
+from app.core.settings import settings  # noqa: E402
 from app.main import app  # noqa: E402
 from app.models.users import Role, User  # noqa: E402
 
@@ -18,7 +22,7 @@ DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
 @pytest.fixture(scope="function")
-def client():
+def client(monkeypatch):
     engine = create_async_engine(DATABASE_URL, echo=False)
     async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
@@ -42,8 +46,16 @@ def client():
             await conn.run_sync(Base.metadata.create_all)
 
     asyncio.run(create_tables())
-
+    asyncio.run(reports_cache.invalidate())
+    user_cache.clear()
+    token_revocations.clear()
+    reference_data.clear()
+
+    # la base en memoria es una sola conexión: los trabajos en segundo plano
+    # se cruzarían con la transacción del request siguiente
+    monkeypatch.setattr(settings, "JOBS_WORKERS", 0)
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: async_session
     app.dependency_overrides[get_current_user] = override_get_current_user
     with TestClient(app) as ac:
         yield ac, async_session
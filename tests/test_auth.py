@@ -1,8 +1,23 @@
 import asyncio
+import threading
 
-from app.core.security import verify_password
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import delete
+
+from app.constants.roles import ADMIN, REVISOR
+from app.core.cache import user_cache, user_cache_key
+from app.core.dependencies import get_current_user, get_token_claims, roles_allowed
+from app.core.revocations import token_revocations
+from app.core.security import (
+    HashingPool,
+    hash_password_async,
+    verify_password,
+    verify_password_async,
+)
 from app.db.repositories.users import UsersRepository
-from app.models.users import Role
+from app.main import app
+from app.models.users import Role, User
 from app.schemas.users import UserCreate
 from app.services.auth import AuthService
 
@@ -40,3 +55,144 @@ def test_authenticate_and_login_token(client):
     assert user_email == email
     assert valid_pw
     assert isinstance(token, str) and token
+
+
+def test_current_user_cached_until_user_changes(client):
+    http, session_factory = client
+    app.dependency_overrides.pop(get_current_user)
+
+    async def seed_user():
+        async with session_factory() as session:
+            session.add(Role(id=ADMIN, name="admin"))
+            await session.commit()
+            user = await UsersRepository(session).create(
+                UserCreate(
+                    name="Cache",
+                    email="cache@example.com",
+                    password="secret",
+                    role_id=ADMIN,
+                )
+            )
+            return user.id, AuthService(session).login_token(user)
+
+    user_id, token = asyncio.run(seed_user())
+    headers = {"Authorization": f"Bearer {token}"}
+
+    assert http.get("/metrics/", headers=headers).json()["success"]
+    cached = asyncio.run(user_cache.get(user_cache_key(user_id)))
+    assert cached.role.name == "admin"
+
+    async def remove_directly():
+        async with session_factory() as session:
+            await session.execute(delete(User).where(User.id == user_id))
+            await session.commit()
+
+    asyncio.run(remove_directly())
+    # sin pasar por el repositorio la cache sigue respondiendo
+    assert http.get("/metrics/", headers=headers).json()["success"]
+
+    async def remove_with_repo():
+        async with session_factory() as session:
+            session.add(
+                User(id=user_id, name="C", email="c@x.com", password="x", role_id=1)
+            )
+            await session.commit()
+            await UsersRepository(session).delete(user_id)
+
+    asyncio.run(remove_with_repo())
+    resp = http.get("/metrics/", headers=headers).json()
+    assert not resp["success"]
+    assert resp["code"] == 404
+
+
+def test_hashing_pool_bounds_pending_work():
+    pool = HashingPool(workers=1, max_queue=0)
+    release = threading.Event()
+
+    async def run():
+        first = asyncio.ensure_future(pool.run(release.wait))
+        await asyncio.sleep(0.05)
+        busy = pool.snapshot()
+        with pytest.raises(HTTPException) as exc:
+            await pool.run(release.wait)
+        release.set()
+        await first
+        return busy, exc.value.status_code
+
+    busy, status_code = asyncio.run(run())
+    assert busy["in_flight"] == 1
+    assert busy["queue_depth"] == 0
+    assert status_code == 503
+    assert pool.snapshot()["rejected"] == 1
+    assert pool.snapshot()["completed"] == 1
+
+
+def test_async_password_helpers():
+    async def run():
+        hashed = await hash_password_async("secret")
+        return hashed, await verify_password_async("secret", hashed)
+
+    hashed, valid = asyncio.run(run())
+    assert hashed != "secret"
+    assert valid
+
+
+def test_stateless_claims_and_revocation(client):
+    _, session_factory = client
+
+    async def seed_user():
+        async with session_factory() as session:
+            session.add(Role(id=ADMIN, name="admin"))
+            await session.commit()
+            await UsersRepository(session).create(
+                UserCreate(
+                    name="Claims",
+                    email="claims@example.com",
+                    password="secret",
+                    role_id=ADMIN,
+                )
+            )
+            service = AuthService(session)
+            user = await service.authenticate_user("claims@example.com", "secret")
+            return user.id, service.login_token(user)
+
+    user_id, token = asyncio.run(seed_user())
+
+    claims = asyncio.run(get_token_claims(token, session_factory))
+    assert claims.sub == str(user_id)
+    assert claims.role == ADMIN
+    assert roles_allowed(ADMIN, load_user=False)(claims) is claims
+    with pytest.raises(HTTPException) as exc:
+        roles_allowed(REVISOR, load_user=False)(claims)
+    assert exc.value.status_code == 403
+
+    async def change_password():
+        async with session_factory() as session:
+            await UsersRepository(session).update_password(user_id, "other")
+
+    asyncio.run(change_password())
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(get_token_claims(token, session_factory))
+    assert exc.value.status_code == 401
+
+    # otro proceso ve la revocación al recargar el registro desde la base
+    token_revocations.clear()
+    with pytest.raises(HTTPException):
+        asyncio.run(get_token_claims(token, session_factory))
+
+    async def login_again():
+        async with session_factory() as session:
+            service = AuthService(session)
+            user = await service.authenticate_user("claims@example.com", "other")
+            return service.login_token(user)
+
+    fresh = asyncio.run(login_again())
+    assert asyncio.run(get_token_claims(fresh, session_factory)).ver == 1
+
+    async def delete_user():
+        async with session_factory() as session:
+            await UsersRepository(session).delete(user_id)
+
+    asyncio.run(delete_user())
+    with pytest.raises(HTTPException):
+        asyncio.run(get_token_claims(fresh, session_factory))
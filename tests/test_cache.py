@@ -0,0 +1,97 @@
+import asyncio
+
+from app.core.cache import MISSING, MemoryCache, RedisCache, ResultCache, cached
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value.encode()
+
+    async def delete(self, key):
+        self.data.pop(key, None)
+
+    async def incr(self, key):
+        value = int(self.data.get(key, 0)) + 1
+        self.data[key] = str(value).encode()
+        return value
+
+
+class Reports:
+    def __init__(self, cache):
+        self.calls = 0
+        self.cache = cache
+
+    async def top(self, limit: int = 5):
+        self.calls += 1
+        return [{"limit": limit, "call": self.calls}]
+
+
+def _decorated(cache):
+    class CachedReports(Reports):
+        top = cached(cache, "top")(Reports.top)
+
+    return CachedReports(cache)
+
+
+def test_memory_cache_evicts_least_recently_used():
+    async def run():
+        cache = MemoryCache(maxsize=2)
+        await cache.set("a", 1)
+        await cache.set("b", 2)
+        await cache.get("a")
+        await cache.set("c", 3)
+        return [await cache.get(key) for key in ("a", "b", "c")]
+
+    assert asyncio.run(run()) == [1, MISSING, 3]
+
+
+def test_memory_cache_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr("app.core.cache.time.monotonic", lambda: now[0])
+
+    async def run():
+        cache = MemoryCache()
+        await cache.set("a", 1, ttl=10)
+        first = await cache.get("a")
+        now[0] += 11
+        return first, await cache.get("a")
+
+    assert asyncio.run(run()) == (1, MISSING)
+
+
+def test_result_cache_keys_on_params_and_invalidates():
+    for backend in (MemoryCache(), RedisCache(FakeRedis())):
+        cache = ResultCache(backend, namespace="test", ttl=60)
+        reports = _decorated(cache)
+
+        async def run():
+            first = await reports.top(limit=3)
+            again = await reports.top(3)
+            other = await reports.top(limit=1)
+            await cache.invalidate()
+            fresh = await reports.top(limit=3)
+            return first, again, other, fresh
+
+        first, again, other, fresh = asyncio.run(run())
+        assert first == again == [{"limit": 3, "call": 1}]
+        assert other == [{"limit": 1, "call": 2}]
+        assert fresh == [{"limit": 3, "call": 3}]
+        assert cache.hits == 1 and cache.misses == 3
+
+
+def test_result_cache_disabled_backend():
+    cache = ResultCache(None, namespace="test")
+    reports = _decorated(cache)
+
+    async def run():
+        await reports.top()
+        await reports.top()
+
+    asyncio.run(run())
+    assert reports.calls == 2
@@ -1,7 +1,8 @@
 import asyncio
 from datetime import date
+from decimal import Decimal
 
-from app.models.expense import ExpenseType
+from app.models.expense import Expense, ExpenseType
 
 
 def seed_expense_type(session_factory):
@@ -51,3 +52,81 @@ def test_invalid_expense_type(client):
     body = resp.json()
     assert not body["success"]
     assert body["code"] == 404
+
+
+def _seed_expenses(session_factory):
+    async def run():
+        async with session_factory() as session:
+            rent = ExpenseType(name="Alquiler")
+            tools = ExpenseType(name="Herramientas")
+            session.add_all([rent, tools])
+            await session.flush()
+            rows = [
+                (date(2024, 1, 5), "100.00", rent.id),
+                (date(2024, 1, 20), "40.00", tools.id),
+                (date(2024, 2, 1), "100.00", rent.id),
+                (date(2024, 2, 15), "15.50", tools.id),
+            ]
+            for day, amount, type_id in rows:
+                session.add(
+                    Expense(date=day, amount=Decimal(amount), expense_type_id=type_id)
+                )
+            await session.commit()
+            return rent.id, tools.id
+
+    return asyncio.run(run())
+
+
+def test_list_expenses_filters(client):
+    http, session_factory = client
+    rent_id, tools_id = _seed_expenses(session_factory)
+
+    resp = http.get(
+        "/expenses", params={"start_date": "2024-01-10", "end_date": "2024-02-10"}
+    )
+    data = resp.json()["data"]
+    assert [e["date"] for e in data] == ["2024-02-01", "2024-01-20"]
+
+    resp = http.get("/expenses", params={"expense_type_id": tools_id})
+    assert [e["amount"] for e in resp.json()["data"]] == [15.5, 40.0]
+
+    resp = http.get("/expenses", params={"min_amount": 50, "max_amount": 100})
+    data = resp.json()["data"]
+    assert {e["expense_type_id"] for e in data} == {rent_id}
+    assert len(data) == 2
+
+    resp = http.get("/expenses", params={"min_amount": 10, "max_amount": 5})
+    assert resp.json()["code"] == 400
+
+
+def test_list_expenses_cursor_pagination(client):
+    http, session_factory = client
+    _seed_expenses(session_factory)
+
+    resp = http.get("/expenses", params={"limit": 3})
+    body = resp.json()
+    assert [e["date"] for e in body["data"]] == [
+        "2024-02-15",
+        "2024-02-01",
+        "2024-01-20",
+    ]
+    assert body["next_cursor"]
+
+    resp = http.get("/expenses", params={"limit": 3, "after": body["next_cursor"]})
+    body = resp.json()
+    assert [e["date"] for e in body["data"]] == ["2024-01-05"]
+    assert body["next_cursor"] is None
+
+
+def test_expenses_total(client):
+    http, session_factory = client
+    rent_id, _ = _seed_expenses(session_factory)
+
+    resp = http.get("/expenses/total")
+    assert resp.json()["data"] == {"total": 255.5, "count": 4}
+
+    resp = http.get(
+        "/expenses/total",
+        params={"expense_type_id": rent_id, "start_date": "2024-02-01"},
+    )
+    assert resp.json()["data"] == {"total": 100.0, "count": 1}
@@ -1,4 +1,6 @@
 import asyncio
+import csv
+import json
 from datetime import datetime
 
 from app.models.clients import Client, ClientType
@@ -397,3 +399,108 @@ def test_list_invoices_invalid_date_range(client):
         body["message"]
         == "La fecha de inicio no puede ser mayor que la fecha final"
     )
+
+
+def test_list_invoices_cursor_pagination(client):
+    http, session_factory = client
+
+    async def seed_invoices():
+        async with session_factory() as session:
+            cli = Client(type=ClientType.persona, name="Cursor")
+            session.add(cli)
+            await session.flush()
+            truck = Truck(client_id=cli.id, license_plate="CUR111")
+            wo_status = WorkOrderStatus(name="open")
+            inv_status = InvoiceStatus(name="pending")
+            inv_type = InvoiceType(name="A", surcharge=0)
+            session.add_all([truck, wo_status, inv_status, inv_type])
+            await session.flush()
+            ids = []
+            for _ in range(3):
+                order = WorkOrder(truck_id=truck.id, status_id=wo_status.id)
+                session.add(order)
+                await session.flush()
+                invoice = Invoice(
+                    work_order_id=order.id,
+                    client_id=cli.id,
+                    invoice_type_id=inv_type.id,
+                    status_id=inv_status.id,
+                    labor_total=0,
+                    parts_total=0,
+                    iva=0,
+                    total=0,
+                )
+                session.add(invoice)
+                await session.flush()
+                ids.append(invoice.id)
+            await session.commit()
+            return ids
+
+    ids = asyncio.run(seed_invoices())
+
+    seen = []
+    params = {"limit": 2}
+    while True:
+        body = http.get("/invoices/", params=params).json()
+        seen.extend(inv["id"] for inv in body["data"])
+        if not body["next_cursor"]:
+            break
+        params["after"] = body["next_cursor"]
+    assert seen == ids[::-1]
+
+
+def test_export_invoices(client):
+    http, session_factory = client
+
+    async def seed():
+        async with session_factory() as session:
+            cli = Client(type=ClientType.persona, name="Exporta")
+            session.add(cli)
+            await session.flush()
+            truck = Truck(client_id=cli.id, license_plate="EXP111")
+            wo_status = WorkOrderStatus(name="open")
+            inv_status = InvoiceStatus(name="pending")
+            inv_type = InvoiceType(name="A", surcharge=0)
+            session.add_all([truck, wo_status, inv_status, inv_type])
+            await session.flush()
+            for total in (100, 200):
+                order = WorkOrder(truck_id=truck.id, status_id=wo_status.id)
+                session.add(order)
+                await session.flush()
+                session.add(
+                    Invoice(
+                        work_order_id=order.id,
+                        client_id=cli.id,
+                        invoice_type_id=inv_type.id,
+                        status_id=inv_status.id,
+                        labor_total=0,
+                        parts_total=0,
+                        iva=0,
+                        total=total,
+                    )
+                )
+            await session.commit()
+            return cli.id
+
+    client_id = asyncio.run(seed())
+
+    resp = http.get("/invoices/export", params={"client_id": client_id})
+    assert resp.status_code == 200
+    lines = resp.text.splitlines()
+    assert lines[0].startswith("id,invoice_number,issued_at")
+    assert len(lines) == 3
+    csv_rows = list(csv.DictReader(lines))
+
+    resp = http.get(
+        "/invoices/export", params={"client_id": client_id, "format": "ndjson"}
+    )
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    # el dinero sale como texto exacto en ambos formatos
+    assert [row["total"] for row in rows] == ["200.00", "100.00"]
+    assert [row["total"] for row in rows] == [row["total"] for row in csv_rows]
+    assert rows[0]["client_name"] == "Exporta"
+    assert rows[0]["status"] == "pending"
+
+    resp = http.get("/invoices/export", params={"format": "xml"})
+    assert resp.json()["code"] == 400
@@ -0,0 +1,210 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.core.jobs import JobQueue
+from app.core.settings import settings
+from app.models.jobs import BackgroundJob
+
+
+@pytest.fixture
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(settings, "JOBS_BACKOFF_SECONDS", 0.01)
+    monkeypatch.setattr(settings, "JOBS_MAX_ATTEMPTS", 3)
+
+
+def _flaky_queue(failures: int):
+    queue = JobQueue()
+    calls = []
+
+    @queue.register("flaky")
+    async def flaky(session_factory, value):
+        calls.append(value)
+        if len(calls) <= failures:
+            raise RuntimeError("falla temporal")
+
+    return queue, calls
+
+
+def test_memory_queue_retries_with_backoff(fast_retries):
+    queue, calls = _flaky_queue(failures=2)
+
+    async def run():
+        await queue.start(session_factory=None, backend="memory", workers=2)
+        await queue.enqueue("flaky", value=1)
+        await queue.join()
+        await queue.stop()
+
+    asyncio.run(run())
+    assert calls == [1, 1, 1]
+    assert (queue.processed, queue.retried, queue.failed) == (1, 2, 0)
+
+
+def test_memory_queue_gives_up_after_max_attempts(fast_retries):
+    queue, calls = _flaky_queue(failures=10)
+
+    async def run():
+        await queue.start(session_factory=None, backend="memory", workers=1)
+        await queue.enqueue("flaky", value=1)
+        await queue.join()
+        await queue.stop()
+
+    asyncio.run(run())
+    assert len(calls) == settings.JOBS_MAX_ATTEMPTS
+    assert (queue.processed, queue.failed) == (0, 1)
+
+
+def test_enqueue_does_not_wait_for_the_job():
+    queue = JobQueue()
+    release = None
+    done = []
+
+    @queue.register("slow")
+    async def slow(session_factory):
+        await release.wait()
+        done.append(True)
+
+    async def run():
+        nonlocal release
+        release = asyncio.Event()
+        await queue.start(session_factory=None, backend="memory", workers=1)
+        await asyncio.wait_for(queue.enqueue("slow"), timeout=1)
+        assert not done
+        release.set()
+        await queue.stop()
+
+    asyncio.run(run())
+    assert done == [True]
+
+
+def test_enqueue_unknown_job():
+    with pytest.raises(ValueError):
+        asyncio.run(JobQueue().enqueue("missing"))
+
+
+def test_schedule_tracks_its_task_and_logs_failures(caplog):
+    queue = JobQueue()
+    done = []
+
+    @queue.register("note")
+    async def note(session_factory, value):
+        done.append(value)
+
+    with pytest.raises(ValueError):
+        queue.schedule("missing")
+    with pytest.raises(RuntimeError):
+        # sin event loop en marcha
+        queue.schedule("note", value=0)
+
+    async def run():
+        await queue.start(session_factory=None, backend="memory", workers=1)
+        task = queue.schedule("note", value=1)
+        assert task in queue._scheduled
+        await queue.join()
+        assert not queue._scheduled
+
+        async def unreachable(job):
+            raise RuntimeError("base caída")
+
+        queue.backend.push = unreachable
+        await asyncio.wait([queue.schedule("note", value=2)])
+        await queue.stop()
+
+    asyncio.run(run())
+    assert done == [1]
+    assert "No se pudo encolar un trabajo" in caplog.text
+
+
+def test_database_queue_persists_jobs(fast_retries, tmp_path):
+    queue, calls = _flaky_queue(failures=1)
+
+    @queue.register("broken")
+    async def broken(session_factory):
+        raise RuntimeError("sin servidor de correo")
+
+    async def run():
+        # archivo: cada sesión (worker, encolado) usa su propia conexión
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        await queue.start(factory, backend="database", workers=1)
+        await queue.enqueue("flaky", value=7)
+        await queue.enqueue("broken")
+        await queue.join()
+        await queue.stop()
+
+        async with factory() as session:
+            result = await session.execute(
+                select(BackgroundJob).order_by(BackgroundJob.id)
+            )
+            rows = [
+                (row.name, row.payload, row.status, row.attempts, row.last_error)
+                for row in result.scalars()
+            ]
+        await engine.dispose()
+        return rows
+
+    flaky_row, broken_row = asyncio.run(run())
+    assert flaky_row[:4] == ("flaky", {"value": 7}, "done", 2)
+    assert broken_row[:4] == ("broken", {}, "failed", settings.JOBS_MAX_ATTEMPTS)
+    assert "sin servidor de correo" in broken_row[4]
+    assert calls == [7, 7]
+
+
+def test_database_queue_recovers_expired_claims(fast_retries, tmp_path):
+    queue, calls = _flaky_queue(failures=0)
+
+    async def run():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+        # tomados por un proceso que murió antes de terminarlos
+        expired = datetime.utcnow() - timedelta(seconds=1)
+        async with factory() as session:
+            session.add_all(
+                [
+                    BackgroundJob(
+                        name="flaky",
+                        payload={"value": 3},
+                        status="running",
+                        locked_until=expired,
+                    ),
+                    BackgroundJob(
+                        name="flaky",
+                        payload={"value": 4},
+                        status="running",
+                        attempts=settings.JOBS_MAX_ATTEMPTS - 1,
+                        locked_until=expired,
+                    ),
+                ]
+            )
+            await session.commit()
+
+        await queue.start(factory, backend="database", workers=1)
+        await asyncio.wait_for(queue.join(), timeout=5)
+        await queue.stop()
+
+        async with factory() as session:
+            result = await session.execute(
+                select(BackgroundJob).order_by(BackgroundJob.id)
+            )
+            rows = [
+                (row.status, row.attempts, row.locked_until) for row in result.scalars()
+            ]
+        await engine.dispose()
+        return rows
+
+    retried, exhausted = asyncio.run(run())
+    # el intento cortado cuenta como fallido: 1 vencido + 1 exitoso
+    assert retried == ("done", 2, None)
+    assert exhausted == ("failed", settings.JOBS_MAX_ATTEMPTS, None)
+    assert calls == [3]
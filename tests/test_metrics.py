@@ -0,0 +1,17 @@
+from app.core.database import pool_metrics
+
+
+def test_metrics_exposes_pool_counters(client):
+    http, _ = client
+    pool_metrics.reset()
+    pool_metrics.record_wait(0.002)
+    pool_metrics.record_checkout()
+
+    resp = http.get("/metrics/")
+    assert resp.status_code == 200
+    data = resp.json()["data"]["db_pool"]
+    assert data["checkouts"] == 1
+    assert data["checked_out"] == 1
+    assert data["peak_checked_out"] == 1
+    assert data["wait_max_ms"] == 2.0
+    assert "pool_size" in data
@@ -0,0 +1,242 @@
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+
+def _seed_tasks(session_factory):
+    """Dos mecánicos, dos áreas, una orden terminada y otra abierta."""
+
+    async def seed():
+        async with session_factory() as session:
+            from app.models.clients import Client, ClientType
+            from app.models.trucks import Truck
+            from app.models.users import Role, User
+            from app.models.work_order_tasks import WorkOrderTask
+            from app.models.work_orders import WorkOrder, WorkOrderStatus
+            from app.models.work_orders_mechanic import WorkArea
+
+            role = Role(name="mechanic")
+            air, motor = WorkArea(name="aire"), WorkArea(name="motor")
+            done, open_ = WorkOrderStatus(name="done"), WorkOrderStatus(name="open")
+            cli = Client(type=ClientType.persona, name="Payroll")
+            session.add_all([role, air, motor, done, open_, cli])
+            await session.flush()
+            ana = User(
+                name="Ana", email="ana@example.com", password="x", role_id=role.id
+            )
+            beto = User(
+                name="Beto", email="beto@example.com", password="x", role_id=role.id
+            )
+            truck = Truck(client_id=cli.id, license_plate="RUN1")
+            session.add_all([ana, beto, truck])
+            await session.flush()
+            finished = WorkOrder(truck_id=truck.id, status_id=done.id)
+            pending = WorkOrder(truck_id=truck.id, status_id=open_.id)
+            session.add_all([finished, pending])
+            await session.flush()
+            rows = [
+                (finished, ana, air, 100, datetime(2024, 1, 10)),
+                (finished, ana, air, 50, datetime(2024, 1, 20)),
+                (finished, beto, air, 30, datetime(2024, 1, 15)),
+                (finished, beto, motor, 80, datetime(2024, 1, 15)),
+                (pending, ana, air, 70, datetime(2024, 1, 15)),
+                (finished, ana, air, 60, datetime(2024, 2, 5)),
+            ]
+            session.add_all(
+                [
+                    WorkOrderTask(
+                        work_order_id=order.id,
+                        user_id=user.id,
+                        area_id=area.id,
+                        description="tarea",
+                        price=price,
+                        created_at=created_at,
+                    )
+                    for order, user, area, price, created_at in rows
+                ]
+            )
+            await session.commit()
+            return {
+                "ana": ana.id,
+                "beto": beto.id,
+                "air": air.id,
+                "motor": motor.id,
+                "done": done.id,
+            }
+
+    return asyncio.run(seed())
+
+
+def _task_flags(session_factory):
+    async def fetch():
+        async with session_factory() as session:
+            from sqlalchemy import select
+
+            from app.models.work_order_tasks import WorkOrderTask
+
+            result = await session.execute(
+                select(WorkOrderTask.paid, WorkOrderTask.pay_run_id).order_by(
+                    WorkOrderTask.id
+                )
+            )
+            return result.all()
+
+    return asyncio.run(fetch())
+
+
+def test_preview_groups_by_mechanic_and_area(client):
+    http, session_factory = client
+    ids = _seed_tasks(session_factory)
+
+    resp = http.get(
+        "/pay-runs/preview",
+        params={
+            "status_id": ids["done"],
+            "start_date": "2024-01-01",
+            "end_date": "2024-01-31",
+        },
+    )
+    assert resp.status_code == 200
+    data = resp.json()["data"]
+    assert data["task_count"] == 4
+    assert Decimal(data["total"]) == 260
+    lines = {(line["user_id"], line["area_id"]): line for line in data["lines"]}
+    assert lines[(ids["ana"], ids["air"])]["task_count"] == 2
+    assert Decimal(lines[(ids["ana"], ids["air"])]["total"]) == 150
+    assert Decimal(lines[(ids["beto"], ids["motor"])]["total"]) == 80
+    # la vista previa no reserva nada
+    assert all(run_id is None for _, run_id in _task_flags(session_factory))
+
+
+def test_pay_run_flow(client):
+    http, session_factory = client
+    ids = _seed_tasks(session_factory)
+    filters = {
+        "area_id": ids["air"],
+        "status_id": ids["done"],
+        "start_date": "2024-01-01",
+        "end_date": "2024-01-31",
+    }
+
+    resp = http.post("/pay-runs/", json=filters)
+    assert resp.status_code == 200
+    run = resp.json()["data"]
+    assert run["task_count"] == 3
+    assert Decimal(run["total"]) == 180
+    assert run["paid_at"] is None
+    assert {line["user_id"]: Decimal(line["total"]) for line in run["lines"]} == {
+        ids["ana"]: 150,
+        ids["beto"]: 30,
+    }
+    flags = _task_flags(session_factory)
+    assert [run_id for _, run_id in flags] == [
+        run["id"],
+        run["id"],
+        run["id"],
+        None,
+        None,
+        None,
+    ]
+    assert not any(paid for paid, _ in flags)
+
+    # las tareas ya reservadas no entran en otra liquidación
+    resp = http.post("/pay-runs/", json=filters)
+    assert resp.json()["code"] == 400
+
+    resp = http.post(f"/pay-runs/{run['id']}/pay")
+    assert resp.status_code == 200
+    assert resp.json()["data"]["paid_at"] is not None
+    assert [paid for paid, _ in _task_flags(session_factory)] == [
+        True,
+        True,
+        True,
+        False,
+        False,
+        False,
+    ]
+
+    resp = http.post(f"/pay-runs/{run['id']}/pay")
+    assert resp.json()["code"] == 400
+    resp = http.delete(f"/pay-runs/{run['id']}")
+    assert resp.json()["code"] == 400
+
+    # la consulta lee el resumen guardado
+    resp = http.get(f"/pay-runs/{run['id']}")
+    assert Decimal(resp.json()["data"]["total"]) == 180
+    resp = http.get("/pay-runs/")
+    assert [item["id"] for item in resp.json()["data"]] == [run["id"]]
+
+
+def test_cancel_pay_run_releases_tasks(client):
+    http, session_factory = client
+    ids = _seed_tasks(session_factory)
+
+    resp = http.post("/pay-runs/", json={"user_id": ids["beto"]})
+    run_id = resp.json()["data"]["id"]
+    assert resp.json()["data"]["task_count"] == 2
+
+    resp = http.delete(f"/pay-runs/{run_id}")
+    assert resp.status_code == 200
+    assert resp.json()["data"]["detail"] == "Liquidación cancelada"
+    assert all(run is None for _, run in _task_flags(session_factory))
+
+    resp = http.get(f"/pay-runs/{run_id}")
+    assert resp.json()["code"] == 404
+
+
+def test_pay_run_validates_filters(client):
+    http, session_factory = client
+    _seed_tasks(session_factory)
+
+    resp = http.post("/pay-runs/", json={"area_id": 999})
+    assert resp.json()["code"] == 404
+
+    resp = http.get(
+        "/pay-runs/preview",
+        params={"start_date": "2024-02-01", "end_date": "2024-01-01"},
+    )
+    assert resp.json()["code"] == 400
+
+
+def test_reserved_tasks_cannot_be_edited_or_paid_outside_the_run(client):
+    http, session_factory = client
+    ids = _seed_tasks(session_factory)
+
+    resp = http.post("/pay-runs/", json={"user_id": ids["beto"]})
+    run = resp.json()["data"]
+
+    async def task_ids():
+        async with session_factory() as session:
+            from sqlalchemy import select
+
+            from app.models.work_order_tasks import WorkOrderTask
+
+            result = await session.execute(
+                select(WorkOrderTask.id, WorkOrderTask.pay_run_id).order_by(
+                    WorkOrderTask.id
+                )
+            )
+            return result.all()
+
+    rows = asyncio.run(task_ids())
+    reserved = [task_id for task_id, run_id in rows if run_id == run["id"]]
+    free = [task_id for task_id, run_id in rows if run_id is None]
+
+    resp = http.put(
+        "/work-orders/tasks/bulk-paid",
+        json={"task_ids": [free[0], reserved[0]], "paid": True},
+    )
+    assert resp.json()["code"] == 400
+    assert str(reserved[0]) in resp.json()["message"]
+
+    resp = http.put(f"/work-orders/tasks/{reserved[0]}", json={"price": 1})
+    assert resp.json()["code"] == 400
+    resp = http.delete(f"/work-orders/tasks/{reserved[0]}")
+    assert resp.json()["code"] == 400
+
+    # nada cambió: la liquidación paga exactamente lo que guardó
+    assert not any(paid for paid, _ in _task_flags(session_factory))
+    resp = http.post(f"/pay-runs/{run['id']}/pay")
+    assert Decimal(resp.json()["data"]["total"]) == 110
+    paid = [paid for paid, _ in _task_flags(session_factory)]
+    assert paid.count(True) == 2
@@ -1,9 +1,22 @@
 import asyncio
+import csv
+import io
+from datetime import datetime
 
+from sqlalchemy import update
+
+from app.core.reference_data import reference_data
 from app.models.clients import Client, ClientType
-from app.models.invoices import Invoice, InvoiceStatus, InvoiceType, PaymentMethod
+from app.models.invoices import (
+    Invoice,
+    InvoiceStatus,
+    InvoiceType,
+    Payment,
+    PaymentMethod,
+)
 from app.models.trucks import Truck
 from app.models.work_orders import WorkOrder, WorkOrderStatus
+from app.services.notifications import NotificationService
 
 
 def _seed_invoice(session_factory):
@@ -379,3 +392,261 @@ def test_list_payments_by_check_type(client):
     data = resp.json()["data"]
     assert len(data) == 1
     assert data[0]["bank_checks"][0]["type"] == "physical"
+
+
+def test_search_payments_cursor_pagination(client):
+    http, session_factory = client
+    invoice_id, method_id = _seed_invoice(session_factory)
+
+    async def seed_payments():
+        async with session_factory() as session:
+            session.add_all(
+                [
+                    Payment(
+                        invoice_id=invoice_id,
+                        method_id=method_id,
+                        amount=amount,
+                        date=datetime(2024, 3, 1),
+                    )
+                    for amount in [10, 20, 30]
+                ]
+            )
+            await session.commit()
+
+    asyncio.run(seed_payments())
+
+    resp = http.get("/invoices/payments/", params={"limit": 2})
+    body = resp.json()
+    assert [p["amount"] for p in body["data"]] == [30, 20]
+    assert body["next_cursor"]
+
+    resp = http.get(
+        "/invoices/payments/", params={"limit": 2, "after": body["next_cursor"]}
+    )
+    body = resp.json()
+    assert [p["amount"] for p in body["data"]] == [10]
+    assert body["next_cursor"] is None
+
+
+def test_search_payments_invalid_cursor(client):
+    http, _ = client
+    resp = http.get("/invoices/payments/", params={"after": "no-es-un-cursor"})
+    data = resp.json()
+    assert not data["success"]
+    assert data["code"] == 400
+
+
+def test_bulk_payments(client):
+    http, session_factory = client
+    invoice_id, method_id = _seed_invoice(session_factory)
+
+    resp = http.post(
+        "/invoices/payments/bulk",
+        json={
+            "payments": [
+                {"invoice_id": invoice_id, "method_id": method_id, "amount": 30},
+                {"invoice_id": 999, "method_id": method_id, "amount": 5},
+                {
+                    "invoice_id": invoice_id,
+                    "method_id": method_id,
+                    "amount": 20.5,
+                    "bank_checks": [
+                        {
+                            "bank_name": "Banco",
+                            "check_number": "001",
+                            "amount": 20.5,
+                            "type": "physical",
+                            "due_date": "2030-01-01T00:00:00",
+                        }
+                    ],
+                },
+            ]
+        },
+    )
+    body = resp.json()
+    assert body["success"]
+    assert body["message"] == "2 de 3 pagos registrados"
+    results = body["data"]
+    assert [row["success"] for row in results] == [True, False, True]
+    assert results[1]["error"] == "Invoice con id 999 no existe"
+    assert results[1]["payment_id"] is None
+
+    payments = http.get("/invoices/payments/", params={"invoice_id": invoice_id})
+    data = payments.json()["data"]
+    assert sorted(p["id"] for p in data) == sorted(
+        [results[0]["payment_id"], results[2]["payment_id"]]
+    )
+    checks = [c for p in data for c in p["bank_checks"] or []]
+    assert [c["check_number"] for c in checks] == ["001"]
+
+    async def paid():
+        async with session_factory() as session:
+            return float((await session.get(Invoice, invoice_id)).paid)
+
+    assert asyncio.run(paid()) == 50.5
+    balance = http.get("/reports/financial-balance").json()["data"]
+    assert balance["real_income"] == 50.5
+
+
+def test_payment_accumulates_paid_atomically(client):
+    http, session_factory = client
+    invoice_id, method_id = _seed_invoice(session_factory)
+
+    for amount in [10, 15]:
+        http.post(
+            "/invoices/payments/",
+            json={"invoice_id": invoice_id, "method_id": method_id, "amount": amount},
+        )
+
+    async def paid():
+        async with session_factory() as session:
+            return float((await session.get(Invoice, invoice_id)).paid)
+
+    assert asyncio.run(paid()) == 25
+    data = http.get("/reports/billing-by-client").json()["data"]
+    assert data[0]["total_paid"] == 25
+
+
+def test_reconcile_paid(client):
+    http, session_factory = client
+    invoice_id, method_id = _seed_invoice(session_factory)
+    http.post(
+        "/invoices/payments/",
+        json={"invoice_id": invoice_id, "method_id": method_id, "amount": 40},
+    )
+
+    async def corrupt():
+        async with session_factory() as session:
+            await session.execute(
+                update(Invoice).where(Invoice.id == invoice_id).values(paid=7)
+            )
+            await session.commit()
+
+    asyncio.run(corrupt())
+
+    resp = http.post("/invoices/reconcile-paid")
+    body = resp.json()
+    assert body["message"] == "1 facturas corregidas"
+    assert body["data"] == [{"invoice_id": invoice_id, "previous": 7, "paid": 40}]
+    data = http.get("/reports/billing-by-client").json()["data"]
+    assert data[0]["total_paid"] == 40
+
+    assert http.post("/invoices/reconcile-paid").json()["data"] == []
+
+
+def test_reference_data_serves_methods_and_surcharge(client):
+    http, session_factory = client
+
+    async def setup():
+        async with session_factory() as session:
+            session.add(PaymentMethod(id=1, name="Efectivo"))
+            await session.commit()
+
+    asyncio.run(setup())
+    resp = http.get("/invoices/payment-methods")
+    assert resp.json()["data"] == [{"id": 1, "name": "Efectivo"}]
+
+    async def rename():
+        async with session_factory() as session:
+            method = await session.get(PaymentMethod, 1)
+            method.name = "Contado"
+            await session.commit()
+
+    # modificar la tabla desde este proceso recarga el registro
+    asyncio.run(rename())
+    resp = http.get("/invoices/payment-methods")
+    assert resp.json()["data"] == [{"id": 1, "name": "Contado"}]
+    assert reference_data.snapshot()["rows"]["payment_methods"] == 1
+
+
+def test_export_payments_csv(client):
+    http, session_factory = client
+    invoice_id, method_id = _seed_invoice(session_factory)
+    for amount in (10, 25):
+        http.post(
+            "/invoices/payments/",
+            json={"invoice_id": invoice_id, "method_id": method_id, "amount": amount},
+        )
+
+    resp = http.get("/invoices/payments/export", params={"type": "Cash"})
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/csv")
+    assert 'filename="pagos.csv"' in resp.headers["content-disposition"]
+    header, *rows = list(csv.reader(io.StringIO(resp.text)))
+    assert header[:3] == ["id", "date", "invoice_id"]
+    assert [row[header.index("amount")] for row in rows] == ["25.00", "10.00"]
+    assert {row[header.index("client_name")] for row in rows} == {"Payer"}
+
+    resp = http.get("/invoices/payments/export", params={"type": "Cheque"})
+    assert resp.text.strip().count("\n") == 0
+
+
+def _check_payment(invoice_id, method_id):
+    return {
+        "invoice_id": invoice_id,
+        "method_id": method_id,
+        "amount": 40,
+        "bank_checks": [
+            {
+                "bank_name": "BN",
+                "check_number": "900",
+                "amount": 40,
+                "type": "physical",
+                "due_date": "2030-01-01T00:00:00",
+            }
+        ],
+    }
+
+
+def test_payment_notifies_due_checks_through_queue(client, monkeypatch):
+    http, session_factory = client
+    invoice_id, method_id = _seed_invoice(session_factory)
+    sent = []
+
+    async def send_email(self, recipients, subject, body):
+        sent.append((subject, body))
+
+    monkeypatch.setattr(NotificationService, "_send_email", send_email)
+
+    resp = http.post(
+        "/invoices/payments/",
+        json={"invoice_id": invoice_id, "method_id": method_id, "amount": 5},
+    )
+    assert resp.json()["success"]
+    assert sent == []
+
+    resp = http.post("/invoices/payments/", json=_check_payment(invoice_id, method_id))
+    assert resp.json()["success"]
+    assert sent == [
+        ("Cheque próximo a vencer", "El cheque 900 vence el 2030-01-01 00:00:00")
+    ]
+
+
+def test_failed_notification_does_not_fail_payment(client, monkeypatch):
+    http, session_factory = client
+    invoice_id, method_id = _seed_invoice(session_factory)
+
+    async def send_email(self, recipients, subject, body):
+        raise ConnectionError("smtp caído")
+
+    monkeypatch.setattr(NotificationService, "_send_email", send_email)
+
+    resp = http.post("/invoices/payments/", json=_check_payment(invoice_id, method_id))
+    body = resp.json()
+    assert body["success"]
+    assert body["data"]["bank_checks"][0]["check_number"] == "900"
+
+
+def test_search_payments_inverted_date_range_is_empty(client):
+    http, _ = client
+    resp = http.get(
+        "/invoices/payments/",
+        params={
+            "start_date": datetime(2023, 2, 1).isoformat(),
+            "end_date": datetime(2023, 1, 1).isoformat(),
+        },
+    )
+    body = resp.json()
+    # el listado de pagos nunca rechazó un rango invertido: devuelve vacío
+    assert body["success"]
+    assert body["data"] == []
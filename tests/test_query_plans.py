@@ -0,0 +1,172 @@
+import asyncio
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import event, text
+
+from app.db.repositories.expenses import ExpensesRepository
+from app.db.repositories.invoices import InvoicesRepository, PaymentsRepository
+from app.db.repositories.trucks import TrucksRepository
+from app.db.repositories.work_order_parts import WorkOrderPartsRepository
+from app.db.repositories.work_order_tasks import WorkOrderTasksRepository
+from app.db.repositories.work_orders import WorkOrdersRepository
+from app.db.repositories.work_orders_mechanic import WorkOrderMechanicRepository
+
+# (consulta del repositorio, índices que su plan debe usar). Las tablas están
+# vacías: las cargas ``selectinload`` de hijos no llegan a emitirse.
+CASES = {
+    "expenses.list_by_date": (
+        lambda db: ExpensesRepository(db).list_expenses(
+            start_date=date(2024, 1, 1), end_date=date(2024, 1, 31)
+        ),
+        {"ix_expenses_date"},
+    ),
+    "expenses.total_by_type": (
+        lambda db: ExpensesRepository(db).total(expense_type_id=1),
+        {"ix_expenses_expense_type_id"},
+    ),
+    "invoices.list_by_client": (
+        lambda db: InvoicesRepository(db).list(client_id=1),
+        {"ix_invoices_client_id"},
+    ),
+    "invoices.list_by_status": (
+        lambda db: InvoicesRepository(db).list(status_id=1),
+        {"ix_invoices_status_id"},
+    ),
+    "invoices.list_by_date": (
+        lambda db: InvoicesRepository(db).list(
+            start_date=datetime(2024, 1, 1), end_date=datetime(2024, 1, 31)
+        ),
+        {"ix_invoices_issued_at"},
+    ),
+    "work_orders.invoiced_ids": (
+        lambda db: WorkOrdersRepository(db).invoiced_ids([1, 2]),
+        {"ix_invoices_work_order_id"},
+    ),
+    "work_orders.list_by_truck": (
+        lambda db: WorkOrdersRepository(db).list(truck_id=1),
+        {
+            "ix_work_orders_truck_id",
+            "ix_work_order_parts_work_order_id",
+            "ix_work_order_tasks_work_order_id",
+        },
+    ),
+    "work_orders.list_by_status": (
+        lambda db: WorkOrdersRepository(db).list(status_id=1),
+        {"ix_work_orders_status_id"},
+    ),
+    "work_orders.summary_by_truck": (
+        lambda db: WorkOrdersRepository(db).list_summary(truck_id=1),
+        {
+            "ix_work_orders_truck_id",
+            "ix_invoices_work_order_id",
+            "ix_work_order_parts_work_order_id",
+            "ix_work_order_tasks_work_order_id",
+        },
+    ),
+    "payments.list_by_invoice": (
+        lambda db: PaymentsRepository(db).list_by_invoice(1),
+        {"ix_payments_invoice_id"},
+    ),
+    "payments.total_by_invoice": (
+        lambda db: PaymentsRepository(db).total_by_invoice(1),
+        {"ix_payments_invoice_id"},
+    ),
+    "payments.search_by_invoice": (
+        lambda db: PaymentsRepository(db).list(invoice_id=1),
+        {"ix_payments_invoice_id"},
+    ),
+    "payments.due_checks": (
+        lambda db: PaymentsRepository(db).due_checks([1, 2]),
+        {"ix_bank_checks_payment_id"},
+    ),
+    "tasks.list_by_work_order": (
+        lambda db: WorkOrderTasksRepository(db).list_by_work_order(1),
+        {"ix_work_order_tasks_work_order_id"},
+    ),
+    "parts.list_by_work_order": (
+        lambda db: WorkOrderPartsRepository(db).list_by_work_order(1),
+        {"ix_work_order_parts_work_order_id"},
+    ),
+    "mechanics.list_by_order": (
+        lambda db: WorkOrderMechanicRepository(db).list_mechanics_by_order(1),
+        {"ix_work_order_mechanics_work_order_id"},
+    ),
+    "trucks.list_by_client": (
+        lambda db: TrucksRepository(db).list_all(client_id=1),
+        {"ix_trucks_client_id"},
+    ),
+}
+
+
+def _query_plans(session_factory, call) -> list[str]:
+    """Ejecuta ``call`` y devuelve el EXPLAIN QUERY PLAN de cada SELECT emitido."""
+
+    async def run():
+        async with session_factory() as session:
+            statements = []
+
+            def capture(conn, cursor, statement, parameters, context, executemany):
+                if statement.lstrip().upper().startswith("SELECT"):
+                    statements.append((statement, parameters))
+
+            engine = session.bind.sync_engine
+            event.listen(engine, "before_cursor_execute", capture)
+            try:
+                await call(session)
+            finally:
+                event.remove(engine, "before_cursor_execute", capture)
+
+            plans = []
+            connection = await session.connection()
+            for statement, parameters in statements:
+                raw = await connection.exec_driver_sql(
+                    f"EXPLAIN QUERY PLAN {statement}", parameters
+                )
+                plans.extend(row[-1] for row in raw.all())
+            return plans
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+def test_repository_query_uses_indexes(client, name):
+    _, session_factory = client
+    call, expected = CASES[name]
+
+    plans = _query_plans(session_factory, call)
+    used = " | ".join(plans)
+    missing = [index for index in expected if index not in used]
+    assert not missing, f"{name} no usa {missing}: {used}"
+
+
+def test_filtered_tables_are_never_scanned(client):
+    _, session_factory = client
+    hot_tables = ("invoices", "payments", "bank_checks", "work_order_tasks")
+
+    plans = []
+    for name in ("invoices.list_by_client", "payments.list_by_invoice"):
+        plans += _query_plans(session_factory, CASES[name][0])
+
+    scans = [
+        plan
+        for plan in plans
+        if any(plan.startswith(f"SCAN {table}") for table in hot_tables)
+        and "INDEX" not in plan
+    ]
+    assert not scans
+
+
+def test_indexes_exist_in_schema(client):
+    _, session_factory = client
+
+    async def run():
+        async with session_factory() as session:
+            result = await session.execute(
+                text("SELECT name FROM sqlite_master WHERE type = 'index'")
+            )
+            return set(result.scalars().all())
+
+    names = asyncio.run(run())
+    expected = set().union(*(indexes for _, indexes in CASES.values()))
+    assert expected <= names
@@ -1,6 +1,10 @@
 import asyncio
 from datetime import date, datetime
 
+from sqlalchemy import delete, select
+from sqlalchemy.orm import load_only
+
+from app.core.jobs import job_queue
 from app.models.clients import Client, ClientType
 from app.models.expense import Expense, ExpenseType
 from app.models.invoices import (
@@ -10,8 +14,15 @@ from app.models.invoices import (
     Payment,
     PaymentMethod,
 )
+from app.models.reports import MonthlyReportRollup
 from app.models.trucks import Truck
+from app.models.users import Role, User
+from app.models.work_order_parts import WorkOrderPart
+from app.models.work_order_tasks import WorkOrderTask
 from app.models.work_orders import WorkOrder, WorkOrderStatus
+from app.models.work_orders_mechanic import WorkArea
+from app.services.work_order_parts import WorkOrderPartsService
+from app.services.work_order_tasks import WorkOrderTasksService
 
 
 def _seed_data(session_factory):
@@ -184,3 +195,306 @@ def test_financial_balance(client):
     assert data["expense"] == 60
     assert data["estimated_balance"] == 40
     assert data["real_balance"] == 20
+
+
+def test_monthly_reports_read_rollups(client):
+    http, session_factory = client
+    _seed_balance_data(session_factory)
+
+    resp = http.get("/reports/income-monthly")
+    assert resp.json()["data"] == [{"month": "2024-01", "total_income": 100}]
+
+    resp = http.get("/reports/expenses-monthly")
+    assert resp.json()["data"] == [{"month": "2024-01", "total_expense": 60}]
+
+    resp = http.get("/reports/monthly-balance")
+    assert resp.json()["data"] == [
+        {"month": "2024-01", "income": 100, "expense": 60, "balance": 40}
+    ]
+
+
+def test_billing_and_top_clients_without_dates(client):
+    http, session_factory = client
+    client1_id, client2_id = _seed_data(session_factory)
+
+    resp = http.get("/reports/billing-by-client")
+    data = resp.json()["data"]
+    assert [row["client_id"] for row in data] == [client2_id, client1_id]
+    assert data[0]["total_billed"] == 200
+
+    resp = http.get("/reports/top-clients", params={"limit": 1})
+    assert resp.json()["data"] == [{"client_name": "Beta", "total_billed": 200}]
+
+
+def test_rollups_follow_updates_and_deletes(client):
+    http, session_factory = client
+    _seed_balance_data(session_factory)
+
+    async def change():
+        async with session_factory() as session:
+            invoice = (await session.execute(select(Invoice))).scalar_one()
+            invoice.total = 150
+            expense = (await session.execute(select(Expense))).scalar_one()
+            await session.delete(expense)
+            await session.commit()
+
+    asyncio.run(change())
+
+    resp = http.get("/reports/financial-balance")
+    data = resp.json()["data"]
+    assert data["estimated_income"] == 150
+    assert data["expense"] == 0
+    assert http.get("/reports/expenses-monthly").json()["data"] == []
+
+
+def test_rollups_follow_changes_to_unloaded_columns(client):
+    http, session_factory = client
+    _seed_balance_data(session_factory)
+
+    async def change():
+        async with session_factory() as session:
+            invoice = (
+                await session.execute(select(Invoice).options(load_only(Invoice.id)))
+            ).scalar_one()
+            # el valor previo de total no estaba cargado: se carga al asignarlo
+            await session.run_sync(lambda _: setattr(invoice, "total", 150))
+            expense = (
+                await session.execute(select(Expense).options(load_only(Expense.id)))
+            ).scalar_one()
+            await session.delete(expense)
+            await session.commit()
+
+    asyncio.run(change())
+
+    data = http.get("/reports/financial-balance").json()["data"]
+    assert data["estimated_income"] == 150
+    assert data["expense"] == 0
+    assert http.get("/reports/expenses-monthly").json()["data"] == []
+
+
+def test_stale_rollups_schedule_a_rebuild(client):
+    http, session_factory = client
+    _seed_balance_data(session_factory)
+
+    async def run():
+        async with session_factory() as session:
+            await session.execute(delete(MonthlyReportRollup))
+            # lo que marca un flush que no pudo calcular sus deltas
+            session.info["rollups_stale"] = True
+            await session.commit()
+        await job_queue.join()
+
+    asyncio.run(run())
+
+    data = http.get("/reports/financial-balance").json()["data"]
+    assert data["estimated_income"] == 100
+    assert data["expense"] == 60
+
+
+def test_rebuild_rollups(client):
+    http, session_factory = client
+    _seed_balance_data(session_factory)
+
+    async def wipe():
+        async with session_factory() as session:
+            await session.execute(delete(MonthlyReportRollup))
+            await session.commit()
+
+    asyncio.run(wipe())
+    assert http.get("/reports/financial-balance").json()["data"]["expense"] == 0
+
+    resp = http.post("/reports/rollups/rebuild")
+    assert resp.json()["success"]
+
+    data = http.get("/reports/financial-balance").json()["data"]
+    assert data["estimated_income"] == 100
+    assert data["real_income"] == 80
+    assert data["expense"] == 60
+
+
+def test_dashboard(client):
+    http, session_factory = client
+    _seed_data(session_factory)
+
+    resp = http.get("/reports/dashboard")
+    assert resp.status_code == 200
+    data = resp.json()["data"]
+    assert data["income"] == [
+        {"month": "2024-02", "total_income": 200},
+        {"month": "2024-01", "total_income": 100},
+    ]
+    assert data["expenses"] == []
+    assert [row["balance"] for row in data["balance"]] == [200, 100]
+    assert data["top_clients"][0] == {"client_name": "Beta", "total_billed": 200}
+
+
+def test_reports_cached_until_write(client):
+    http, session_factory = client
+    _seed_balance_data(session_factory)
+
+    assert http.get("/reports/financial-balance").json()["data"]["expense"] == 60
+
+    async def add_expense_directly():
+        async with session_factory() as session:
+            session.add(Expense(date=date(2024, 1, 6), amount=40))
+            await session.commit()
+
+    asyncio.run(add_expense_directly())
+    # sin pasar por el servicio la cache no se entera
+    assert http.get("/reports/financial-balance").json()["data"]["expense"] == 60
+
+    resp = http.post(
+        "/expenses",
+        json={"date": "2024-01-07", "amount": "10", "expense_type_id": None},
+    )
+    assert resp.json()["success"]
+    assert http.get("/reports/financial-balance").json()["data"]["expense"] == 110
+
+
+def _seed_order_costs(session_factory, client_id):
+    """Dos repuestos de 20 y dos tareas de 15 en la orden facturada al cliente."""
+
+    async def add_costs():
+        async with session_factory() as session:
+            role = Role(name="mech")
+            area = WorkArea(name="Aire")
+            session.add_all([role, area])
+            await session.flush()
+            user = User(name="M", email="m@example.com", password="x", role_id=role.id)
+            session.add(user)
+            await session.flush()
+
+            invoice = (
+                await session.execute(
+                    select(Invoice).where(Invoice.client_id == client_id)
+                )
+            ).scalar_one()
+            for _ in range(2):
+                session.add(
+                    WorkOrderPart(
+                        work_order_id=invoice.work_order_id,
+                        name="Filtro",
+                        quantity=1,
+                        unit_price=20,
+                        subtotal=20,
+                    )
+                )
+                session.add(
+                    WorkOrderTask(
+                        work_order_id=invoice.work_order_id,
+                        user_id=user.id,
+                        area_id=area.id,
+                        description="Cambio",
+                        price=15,
+                    )
+                )
+            await session.commit()
+            return invoice.work_order_id
+
+    return asyncio.run(add_costs())
+
+
+def test_profit_by_order_counts_repeated_lines(client):
+    http, session_factory = client
+    client1_id, client2_id = _seed_data(session_factory)
+    _seed_order_costs(session_factory, client1_id)
+
+    resp = http.get("/reports/profit-by-order")
+    data = resp.json()["data"]
+    assert [row["client_name"] for row in data] == ["Beta", "Alpha"]
+    assert data[1]["parts_cost"] == 40
+    assert data[1]["labor_cost"] == 30
+    assert data[1]["profit"] == 30
+
+    resp = http.get("/reports/profit-by-order", params={"client_id": client2_id})
+    assert [row["client_name"] for row in resp.json()["data"]] == ["Beta"]
+
+    resp = http.get(
+        "/reports/profit-by-order",
+        params={"start_date": "2024-02-01T00:00:00", "skip": 0, "limit": 1},
+    )
+    data = resp.json()["data"]
+    assert len(data) == 1 and data[0]["client_name"] == "Beta"
+
+
+def test_profit_by_order_follows_part_and_task_writes(client, monkeypatch):
+    http, session_factory = client
+    client1_id, _ = _seed_data(session_factory)
+    order_id = _seed_order_costs(session_factory, client1_id)
+
+    def profit_row():
+        data = http.get("/reports/profit-by-order").json()["data"]
+        return next(row for row in data if row["client_name"] == "Alpha")
+
+    assert profit_row()["parts_cost"] == 40
+
+    async def editable(self, work_order_id):
+        return None
+
+    # la orden está facturada; acá solo importa que la escritura limpie la cache
+    monkeypatch.setattr(WorkOrderPartsService, "_ensure_editable", editable)
+    monkeypatch.setattr(WorkOrderTasksService, "_ensure_editable", editable)
+    part = http.get(f"/work-orders/parts/{order_id}").json()["data"][0]
+    resp = http.put(f"/work-orders/parts/{part['id']}", json={"subtotal": 50})
+    assert resp.json()["success"]
+    assert profit_row()["parts_cost"] == 70
+
+    task = http.get(f"/work-orders/tasks/{order_id}").json()["data"][0]
+    resp = http.put(f"/work-orders/tasks/{task['id']}", json={"price": 25})
+    assert resp.json()["success"]
+    assert profit_row()["labor_cost"] == 40
+
+
+def test_unpaid_mechanic_tasks_by_area_and_status(client):
+    http, session_factory = client
+
+    async def seed():
+        async with session_factory() as session:
+            role = Role(name="mec")
+            area, other = WorkArea(name="aire"), WorkArea(name="chapa")
+            status = WorkOrderStatus(name="terminada")
+            cli = Client(type=ClientType.persona, name="Unpaid")
+            session.add_all([role, area, other, status, cli])
+            await session.flush()
+            user = User(
+                name="Mec", email="mec@example.com", password="x", role_id=role.id
+            )
+            truck = Truck(client_id=cli.id, license_plate="UNP1")
+            session.add_all([user, truck])
+            await session.flush()
+            order = WorkOrder(truck_id=truck.id, status_id=status.id)
+            session.add(order)
+            await session.flush()
+            for area_id, price, paid in (
+                (area.id, 10.5, False),
+                (area.id, 20.25, False),
+                (area.id, 99, True),
+                (other.id, 40, False),
+            ):
+                session.add(
+                    WorkOrderTask(
+                        work_order_id=order.id,
+                        user_id=user.id,
+                        area_id=area_id,
+                        description="t",
+                        price=price,
+                        paid=paid,
+                    )
+                )
+            await session.commit()
+            return area.id, status.id
+
+    area_id, status_id = asyncio.run(seed())
+    resp = http.get(
+        "/reports/unpaid-air-mechanic-tasks",
+        params={"area_id": area_id, "status_id": status_id},
+    )
+    data = resp.json()["data"]
+    assert [task["price"] for task in data["tasks"]] == [10.5, 20.25]
+    assert data["total"] == 30.75
+
+    resp = http.get(
+        "/reports/unpaid-air-mechanic-tasks",
+        params={"area_id": area_id, "status_id": status_id + 1},
+    )
+    assert resp.json()["data"] == {"total": 0.0, "tasks": []}
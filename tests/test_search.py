@@ -0,0 +1,88 @@
+import asyncio
+
+from app.models.clients import Client, ClientType
+from app.models.trucks import Truck
+
+
+def _seed(session_factory):
+    async def run():
+        async with session_factory() as session:
+            acme = Client(
+                type=ClientType.empresa,
+                name="Transportes Acme",
+                document_number="30-111",
+                phone="555-0101",
+            )
+            other = Client(type=ClientType.persona, name="Juan Pérez", phone="555-0202")
+            session.add_all([acme, other])
+            await session.flush()
+            session.add_all(
+                [
+                    Truck(
+                        client_id=acme.id,
+                        license_plate="ACM123",
+                        brand="Scania",
+                        model="R450",
+                    ),
+                    Truck(
+                        client_id=other.id,
+                        license_plate="XYZ987",
+                        brand="Volvo",
+                        model="FH",
+                    ),
+                ]
+            )
+            await session.commit()
+            return acme.id, other.id
+
+    return asyncio.run(run())
+
+
+def test_search_clients_and_trucks(client):
+    http, session_factory = client
+    acme_id, _ = _seed(session_factory)
+
+    resp = http.get("/search/", params={"q": "acm"})
+    assert resp.status_code == 200
+    data = resp.json()["data"]
+    # la patente empieza con "acm": prefijo antes que coincidencia parcial
+    assert [(row["type"], row["label"]) for row in data] == [
+        ("truck", "ACM123"),
+        ("client", "Transportes Acme"),
+    ]
+    assert all(row["client_id"] == acme_id for row in data)
+    assert data[0]["detail"] == "Scania R450"
+    assert data[0]["score"] > data[1]["score"]
+
+
+def test_search_by_phone_and_model(client):
+    http, session_factory = client
+    _, other_id = _seed(session_factory)
+
+    resp = http.get("/search/", params={"q": "555-0202"})
+    data = resp.json()["data"]
+    assert [(row["type"], row["id"]) for row in data] == [("client", other_id)]
+
+    resp = http.get("/search/", params={"q": "volvo"})
+    data = resp.json()["data"]
+    assert [row["label"] for row in data] == ["XYZ987"]
+
+
+def test_search_limit_and_escaping(client):
+    http, session_factory = client
+    _seed(session_factory)
+
+    resp = http.get("/search/", params={"q": "55", "limit": 1})
+    assert len(resp.json()["data"]) == 1
+
+    # los comodines de LIKE se buscan literalmente
+    resp = http.get("/search/", params={"q": "%%"})
+    assert resp.json()["data"] == []
+
+
+def test_search_requires_min_length(client):
+    http, _ = client
+    resp = http.get("/search/", params={"q": " a "})
+    body = resp.json()
+    assert body["code"] == 400
+    assert body["message"] == "La búsqueda requiere al menos 2 caracteres"
@@ -2,10 +2,14 @@ import asyncio
 
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import event, insert
 
+from app.core.reference_data import reference_data
 from app.core.validators import exists_or_404, get_or_404, validate_foreign_keys
 from app.models.clients import Client, ClientType
+from app.models.trucks import Truck
 from app.models.users import Role
+from app.models.work_orders_mechanic import WorkArea
 
 
 def test_get_or_404_success(client):
@@ -108,3 +112,123 @@ def test_validate_foreign_keys_failure(client):
 
     with pytest.raises(HTTPException):
         asyncio.run(run())
+
+
+def test_validate_foreign_keys_reports_all_missing(client):
+    _, session_factory = client
+
+    async def run():
+        async with session_factory() as session:
+            role = Role(name="user")
+            session.add(role)
+            await session.commit()
+            await validate_foreign_keys(
+                session, {Role: role.id, Client: 999, WorkArea: -1}
+            )
+
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(run())
+    assert exc.value.status_code == 404
+    assert exc.value.detail == (
+        "Client con id 999 no existe; WorkArea con id -1 no existe"
+    )
+
+
+def test_validate_foreign_keys_single_query(client):
+    _, session_factory = client
+
+    async def run():
+        async with session_factory() as session:
+            cli = Client(type=ClientType.persona, name="John")
+            session.add(cli)
+            await session.flush()
+            truck = Truck(client_id=cli.id, license_plate="VAL123")
+            session.add(truck)
+            await session.commit()
+
+            statements = []
+
+            def count(conn, cursor, statement, *args):
+                statements.append(statement)
+
+            engine = session.bind.sync_engine
+            event.listen(engine, "before_cursor_execute", count)
+            try:
+                await validate_foreign_keys(session, {Client: cli.id, Truck: truck.id})
+            finally:
+                event.remove(engine, "before_cursor_execute", count)
+            return statements
+
+    assert len(asyncio.run(run())) == 1
+
+
+def test_validate_foreign_keys_uses_reference_data(client):
+    _, session_factory = client
+
+    async def run():
+        async with session_factory() as session:
+            session.add(Role(id=1, name="user"))
+            await session.commit()
+            await reference_data.load(session)
+
+            statements = []
+
+            def count(conn, cursor, statement, *args):
+                statements.append(statement)
+
+            engine = session.bind.sync_engine
+            event.listen(engine, "before_cursor_execute", count)
+            try:
+                await validate_foreign_keys(session, {Role: 1})
+            finally:
+                event.remove(engine, "before_cursor_execute", count)
+            return statements
+
+    assert asyncio.run(run()) == []
+
+
+def test_validate_foreign_keys_queries_ids_missing_from_reference_data(client):
+    _, session_factory = client
+
+    async def run():
+        async with session_factory() as session:
+            await reference_data.load(session)
+            # alta hecha por otro proceso: el registro en memoria no la conoce
+            await session.execute(insert(Role).values(id=7, name="externo"))
+            await session.commit()
+            assert not await reference_data.known(session, Role, 7)
+            await validate_foreign_keys(session, {Role: 7})
+            with pytest.raises(HTTPException):
+                await validate_foreign_keys(session, {Role: 8})
+
+    asyncio.run(run())
+
+
+def test_reference_data_get_misses_query_a_single_row(client):
+    _, session_factory = client
+
+    async def run():
+        async with session_factory() as session:
+            await reference_data.load(session)
+            await session.execute(insert(Role).values(id=7, name="externo"))
+            await session.commit()
+
+            statements = []
+
+            def count(conn, cursor, statement, *args):
+                statements.append(statement)
+
+            engine = session.bind.sync_engine
+            event.listen(engine, "before_cursor_execute", count)
+            try:
+                assert await reference_data.get(session, Role, 99) is None
+                assert len(statements) == 1
+                assert (await reference_data.get(session, Role, 7)).name == "externo"
+                assert len(statements) == 2
+                # ya queda en memoria
+                await reference_data.get(session, Role, 7)
+                assert len(statements) == 2
+            finally:
+                event.remove(engine, "before_cursor_execute", count)
+
+    asyncio.run(run())
@@ -1,4 +1,5 @@
 import asyncio
+from decimal import Decimal
 
 
 def test_add_work_order_invalid_fk(client):
@@ -137,3 +138,109 @@ def test_cannot_add_part_when_invoiced(client):
     data = resp.json()
     assert not data["success"]
     assert data["code"] == 400
+
+
+def _seed_parts(session_factory, parts):
+    async def seed():
+        async with session_factory() as session:
+            from app.models.clients import Client, ClientType
+            from app.models.trucks import Truck
+            from app.models.work_order_parts import WorkOrderPart
+            from app.models.work_orders import WorkOrder, WorkOrderStatus
+
+            cli = Client(type=ClientType.persona, name="Catalog")
+            session.add(cli)
+            await session.flush()
+            truck = Truck(client_id=cli.id, license_plate="CAT123")
+            status = WorkOrderStatus(name="open")
+            session.add_all([truck, status])
+            await session.flush()
+            order = WorkOrder(truck_id=truck.id, status_id=status.id)
+            session.add(order)
+            await session.flush()
+            for name, price in parts:
+                session.add(
+                    WorkOrderPart(
+                        work_order_id=order.id,
+                        name=name,
+                        quantity=1,
+                        unit_price=price,
+                        subtotal=price,
+                    )
+                )
+                await session.flush()
+            await session.commit()
+
+    asyncio.run(seed())
+
+
+def test_list_names_is_distinct_and_sorted(client):
+    http, session_factory = client
+    _seed_parts(session_factory, [("Filtro", 10), ("Aceite", 5), ("Filtro", 12)])
+
+    resp = http.get("/work-orders/parts/names")
+    assert resp.status_code == 200
+    assert resp.json()["data"] == ["Aceite", "Filtro"]
+
+
+def test_parts_catalog_usage_and_last_price(client):
+    http, session_factory = client
+    _seed_parts(
+        session_factory,
+        [
+            ("Filtro de aceite", 10),
+            ("Filtro de aire", 8),
+            ("Filtro de aceite", 12),
+            ("Aceite 15W40", 30),
+            ("Filtro de aceite", 15),
+        ],
+    )
+
+    resp = http.get("/work-orders/parts/catalog")
+    assert resp.status_code == 200
+    data = resp.json()["data"]
+    assert data[0]["name"] == "Filtro de aceite"
+    assert data[0]["uses"] == 3
+    assert Decimal(data[0]["last_unit_price"]) == Decimal("15")
+    assert {item["name"] for item in data} == {
+        "Filtro de aceite",
+        "Filtro de aire",
+        "Aceite 15W40",
+    }
+
+    resp = http.get("/work-orders/parts/catalog", params={"q": "aceite"})
+    names = [item["name"] for item in resp.json()["data"]]
+    # Los que empiezan con el término van primero aunque se usen menos
+    assert names == ["Aceite 15W40", "Filtro de aceite"]
+
+    resp = http.get("/work-orders/parts/catalog", params={"q": "fil", "limit": 1})
+    assert [item["name"] for item in resp.json()["data"]] == ["Filtro de aceite"]
+
+
+def test_parts_catalog_escapes_wildcards(client):
+    http, session_factory = client
+    _seed_parts(session_factory, [("Junta 100%", 4), ("Junta tapa", 6)])
+
+    resp = http.get("/work-orders/parts/catalog", params={"q": "%"})
+    assert [item["name"] for item in resp.json()["data"]] == ["Junta 100%"]
+
+
+def test_parts_catalog_follows_renames_and_deletes(client):
+    http, session_factory = client
+    _seed_parts(session_factory, [("Correa", 20), ("Correa", 25)])
+    part_id = http.get("/work-orders/parts/1").json()["data"][0]["id"]
+
+    resp = http.put(f"/work-orders/parts/{part_id}", json={"name": "Correa Gates"})
+    assert resp.json()["success"]
+    catalog = {
+        item["name"]: item
+        for item in http.get("/work-orders/parts/catalog").json()["data"]
+    }
+    assert catalog["Correa"]["uses"] == 1
+    assert catalog["Correa Gates"]["uses"] == 1
+    assert Decimal(catalog["Correa Gates"]["last_unit_price"]) == Decimal("20")
+
+    resp = http.delete(f"/work-orders/parts/{part_id}")
+    assert resp.json()["success"]
+    resp = http.get("/work-orders/parts/names")
+    assert resp.json()["data"] == ["Correa"]
@@ -1,4 +1,5 @@
 import asyncio
+from decimal import Decimal
 
 
 def test_add_task_invalid_fk(client):
@@ -227,7 +228,9 @@ def test_bulk_update_paid(client):
     )
     assert resp.status_code == 200
     data = resp.json()["data"]
-    assert all(t["paid"] is True for t in data)
+    assert all(t["paid"] is True for t in data["tasks"])
+    assert data["count"] == 2
+    assert Decimal(data["total"]) == 10
 
     resp = http.get(f"/work-orders/tasks/{work_order_id}")
     assert resp.status_code == 200
@@ -245,3 +248,131 @@ def test_bulk_update_paid_not_found(client):
     data = resp.json()
     assert not data["success"]
     assert data["code"] == 404
+
+
+def test_bulk_update_paid_filters_by_area_and_status(client):
+    http, session_factory = client
+
+    async def seed_data():
+        async with session_factory() as session:
+            from app.models.clients import Client, ClientType
+            from app.models.trucks import Truck
+            from app.models.users import Role, User
+            from app.models.work_order_tasks import WorkOrderTask
+            from app.models.work_orders import WorkOrder, WorkOrderStatus
+            from app.models.work_orders_mechanic import WorkArea
+
+            role = Role(name="payer")
+            motor, chapa = WorkArea(name="motor"), WorkArea(name="chapa")
+            done, open_ = WorkOrderStatus(name="done"), WorkOrderStatus(name="open")
+            cli = Client(type=ClientType.persona, name="Filter")
+            session.add_all([role, motor, chapa, done, open_, cli])
+            await session.flush()
+            user = User(
+                name="Payee", email="payee@example.com", password="x", role_id=role.id
+            )
+            truck = Truck(client_id=cli.id, license_plate="PAY1")
+            session.add_all([user, truck])
+            await session.flush()
+            finished = WorkOrder(truck_id=truck.id, status_id=done.id)
+            pending = WorkOrder(truck_id=truck.id, status_id=open_.id)
+            session.add_all([finished, pending])
+            await session.flush()
+            tasks = [
+                WorkOrderTask(
+                    work_order_id=order.id,
+                    user_id=user.id,
+                    area_id=area.id,
+                    description=f"{area.name} {order.id}",
+                    price=price,
+                )
+                for order, area, price in (
+                    (finished, motor, 100),
+                    (finished, chapa, 40),
+                    (pending, motor, 70),
+                )
+            ]
+            session.add_all(tasks)
+            await session.commit()
+            return [task.id for task in tasks], motor.id, done.id
+
+    task_ids, motor_id, done_id = asyncio.run(seed_data())
+
+    resp = http.put(
+        "/work-orders/tasks/bulk-paid",
+        json={
+            "task_ids": task_ids,
+            "paid": True,
+            "area_id": motor_id,
+            "status_id": done_id,
+        },
+    )
+    assert resp.status_code == 200
+    data = resp.json()["data"]
+    assert [t["id"] for t in data["tasks"]] == [task_ids[0]]
+    assert data["count"] == 1
+    assert Decimal(data["total"]) == 100
+
+    async def paid_flags():
+        async with session_factory() as session:
+            from sqlalchemy import select
+
+            from app.models.work_order_tasks import WorkOrderTask
+
+            result = await session.execute(
+                select(WorkOrderTask.id, WorkOrderTask.paid).order_by(WorkOrderTask.id)
+            )
+            return [paid for _, paid in result.all()]
+
+    assert asyncio.run(paid_flags()) == [True, False, False]
+
+
+def test_bulk_update_paid_unknown_id_changes_nothing(client):
+    http, session_factory = client
+
+    async def seed_data():
+        async with session_factory() as session:
+            from app.models.clients import Client, ClientType
+            from app.models.trucks import Truck
+            from app.models.users import Role, User
+            from app.models.work_order_tasks import WorkOrderTask
+            from app.models.work_orders import WorkOrder, WorkOrderStatus
+            from app.models.work_orders_mechanic import WorkArea
+
+            role, area = Role(name="r"), WorkArea(name="a")
+            status = WorkOrderStatus(name="open")
+            cli = Client(type=ClientType.persona, name="Atomic")
+            session.add_all([role, area, status, cli])
+            await session.flush()
+            user = User(name="U", email="u@example.com", password="x", role_id=role.id)
+            truck = Truck(client_id=cli.id, license_plate="ATOM1")
+            session.add_all([user, truck])
+            await session.flush()
+            order = WorkOrder(truck_id=truck.id, status_id=status.id)
+            session.add(order)
+            await session.flush()
+            task = WorkOrderTask(
+                work_order_id=order.id,
+                user_id=user.id,
+                area_id=area.id,
+                description="T",
+                price=5,
+            )
+            session.add(task)
+            await session.commit()
+            return task.id
+
+    task_id = asyncio.run(seed_data())
+    resp = http.put(
+        "/work-orders/tasks/bulk-paid",
+        json={"task_ids": [task_id, 999], "paid": True},
+    )
+    assert resp.json()["code"] == 404
+
+    async def is_paid():
+        async with session_factory() as session:
+            from app.models.work_order_tasks import WorkOrderTask
+
+            return (await session.get(WorkOrderTask, task_id)).paid
+
+    assert not asyncio.run(is_paid())
@@ -1,5 +1,7 @@
 import asyncio
+import json
 from datetime import datetime
+from decimal import Decimal
 
 from app.models.clients import Client, ClientType
 from app.models.trucks import Truck
@@ -553,3 +555,180 @@ def test_order_total_with_increments(client):
 
     assert resp.status_code == 200
     assert resp.json()["data"]["total"] == 52
+
+
+def _seed_order_with_lines(session_factory):
+    async def run():
+        async with session_factory() as session:
+            from app.models.work_order_parts import WorkOrderPart
+            from app.models.work_order_tasks import WorkOrderTask
+            from app.models.work_orders_mechanic import WorkArea
+
+            cli = Client(type=ClientType.persona, name="Resumen")
+            role = Role(name="worker")
+            area = WorkArea(name="area")
+            session.add_all([cli, role, area])
+            await session.flush()
+            user = User(name="Rev", email="rev@a.com", password="x", role_id=role.id)
+            session.add(user)
+            await session.flush()
+
+            truck = Truck(client_id=cli.id, license_plate="SUM111")
+            status = WorkOrderStatus(name="open")
+            session.add_all([truck, status])
+            await session.flush()
+
+            order = WorkOrder(
+                truck_id=truck.id, status_id=status.id, reviewed_by=user.id
+            )
+            empty = WorkOrder(truck_id=truck.id, status_id=status.id)
+            session.add_all([order, empty])
+            await session.flush()
+
+            for _ in range(2):
+                session.add(
+                    WorkOrderPart(
+                        work_order_id=order.id,
+                        name="Filtro",
+                        quantity=2,
+                        unit_price=10,
+                        subtotal=20,
+                        increment_per_unit=10,
+                    )
+                )
+            session.add(
+                WorkOrderTask(
+                    work_order_id=order.id,
+                    user_id=user.id,
+                    area_id=area.id,
+                    description="fix",
+                    price=30,
+                )
+            )
+            await session.commit()
+            return order.id, empty.id
+
+    return asyncio.run(run())
+
+
+def test_list_orders_summary(client):
+    http, session_factory = client
+    order_id, empty_id = _seed_order_with_lines(session_factory)
+
+    resp = http.get("/orders/", params={"summary": True})
+    assert resp.status_code == 200
+    data = resp.json()["data"]
+    assert [row["id"] for row in data] == [empty_id, order_id]
+
+    row = data[1]
+    assert row["license_plate"] == "SUM111"
+    assert row["client_name"] == "Resumen"
+    assert row["status_name"] == "open"
+    assert row["reviewer_name"] == "Rev"
+    assert row["task_count"] == 1
+    assert row["part_count"] == 2
+    assert Decimal(row["parts_total"]) == 44
+    assert Decimal(row["labor_total"]) == 30
+    assert Decimal(row["total"]) == 74
+    assert "tasks" not in row
+
+    assert Decimal(data[0]["total"]) == 0
+    assert data[0]["reviewer_name"] is None
+    assert all(row["is_editable"] for row in data)
+
+
+def test_list_orders_editable_batched(client):
+    http, session_factory = client
+    order_id, empty_id = _seed_order_with_lines(session_factory)
+
+    async def invoice_order():
+        async with session_factory() as session:
+            from app.models.invoices import Invoice, InvoiceStatus, InvoiceType
+
+            inv_status = InvoiceStatus(name="pending")
+            inv_type = InvoiceType(name="A", surcharge=0)
+            session.add_all([inv_status, inv_type])
+            await session.flush()
+            order = await session.get(WorkOrder, order_id)
+            session.add(
+                Invoice(
+                    work_order_id=order_id,
+                    client_id=(await session.get(Truck, order.truck_id)).client_id,
+                    invoice_type_id=inv_type.id,
+                    status_id=inv_status.id,
+                    labor_total=0,
+                    parts_total=0,
+                    iva=0,
+                    total=0,
+                )
+            )
+            await session.commit()
+
+    asyncio.run(invoice_order())
+
+    data = http.get("/orders/").json()["data"]
+    assert {row["id"]: row["is_editable"] for row in data} == {
+        empty_id: True,
+        order_id: False,
+    }
+    summary = http.get("/orders/", params={"summary": True}).json()["data"]
+    assert {row["id"]: row["is_editable"] for row in summary} == {
+        empty_id: True,
+        order_id: False,
+    }
+    assert not http.get(f"/orders/{order_id}").json()["data"]["is_editable"]
+
+
+def test_list_orders_totals_filter_and_sort(client):
+    http, session_factory = client
+    order_id, empty_id = _seed_order_with_lines(session_factory)
+
+    data = http.get("/orders/").json()["data"]
+    totals = {row["id"]: Decimal(row["total"]) for row in data}
+    assert totals == {order_id: 74, empty_id: 0}
+    detail = http.get(f"/orders/{order_id}").json()["data"]
+    assert Decimal(detail["parts_total"]) == 44
+    assert Decimal(detail["labor_total"]) == 30
+
+    data = http.get("/orders/", params={"min_total": 1}).json()["data"]
+    assert [row["id"] for row in data] == [order_id]
+    params = {"max_total": 10, "summary": True}
+    data = http.get("/orders/", params=params).json()["data"]
+    assert [row["id"] for row in data] == [empty_id]
+
+    body = http.get("/orders/", params={"sort_by_total": True, "limit": 1}).json()
+    assert [row["id"] for row in body["data"]] == [order_id]
+    body = http.get(
+        "/orders/",
+        params={"sort_by_total": True, "limit": 1, "after": body["next_cursor"]},
+    ).json()
+    assert [row["id"] for row in body["data"]] == [empty_id]
+
+
+def test_export_orders_ndjson(client):
+    http, session_factory = client
+    order_id, empty_id = _seed_order_with_lines(session_factory)
+
+    resp = http.get("/orders/export", params={"format": "ndjson", "min_total": 1})
+    assert resp.status_code == 200
+    rows = [json.loads(line) for line in resp.text.splitlines()]
+    assert [row["id"] for row in rows] == [order_id]
+    assert Decimal(rows[0]["total"]) == 74
+    assert rows[0]["license_plate"] == "SUM111"
+
+
+def test_list_orders_serialized_with_schema(client):
+    http, session_factory = client
+    order_id, _ = _seed_order_with_lines(session_factory)
+
+    resp = http.get("/orders/")
+    assert resp.headers["content-type"] == "application/json"
+    body = resp.json()
+    assert body["code"] == 0
+    assert body["success"] is True
+    order = next(row for row in body["data"] if row["id"] == order_id)
+    # solo los campos de WorkOrderOut: nada del ORM por fuera del schema
+    assert order["reviewer"]["name"] == "Rev"
+    assert "password" not in order["reviewer"]
+    assert Decimal(order["total"]) == 74
+    assert len(order["parts"]) == 2